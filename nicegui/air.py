@@ -12,6 +12,7 @@ import socketio
 import socketio.exceptions
 
 from . import background_tasks, core
+from . import json as nicegui_json
 from .client import Client
 from .dataclasses import KWONLY_SLOTS
 from .logging import log
@@ -28,7 +29,7 @@ class Stream:
 class Air:
     def __init__(self, token: str) -> None:
         self.token = token
-        self.relay = socketio.AsyncClient()
+        self.relay = socketio.AsyncClient(json=nicegui_json)
         self.client = httpx.AsyncClient(app=core.app)
         self.streaming_client = httpx.AsyncClient()
         self.connecting = False
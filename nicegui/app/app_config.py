@@ -28,6 +28,7 @@ class AppConfig:
         dark (Optional[bool]): Whether to use a dark theme.
         language (Language): The language settings for the application.
         binding_refresh_interval (float): The interval at which to refresh bindings.
+        message_flush_interval (float): The time to wait for further changes before sending updates to a client.
         reconnect_timeout (float): The timeout for reconnection attempts.
         tailwind (bool): Whether to use the Tailwind CSS framework.
         prod_js (bool): Whether to use the production JavaScript bundle.
@@ -52,6 +53,7 @@ class AppConfig:
             dark=True,
             language=Language(),
             binding_refresh_interval=0.5,
+            message_flush_interval=0.01,
             reconnect_timeout=10.0,
             tailwind=True,
             prod_js=False,
@@ -88,6 +90,7 @@ class AppConfig:
     dark: Optional[bool] = field(init=False)
     language: Language = field(init=False)
     binding_refresh_interval: float = field(init=False)
+    message_flush_interval: float = field(init=False)
     reconnect_timeout: float = field(init=False)
     tailwind: bool = field(init=False)
     prod_js: bool = field(init=False)
@@ -104,6 +107,7 @@ class AppConfig:
         dark: Optional[bool],
         language: Language,
         binding_refresh_interval: float,
+        message_flush_interval: float,
         reconnect_timeout: float,
         tailwind: bool,
         prod_js: bool,
@@ -123,6 +127,7 @@ class AppConfig:
             dark (Optional[bool]): Whether to use a dark theme.
             language (Language): The language settings for the application.
             binding_refresh_interval (float): The interval at which to refresh bindings.
+            message_flush_interval (float): The time to wait for further changes before sending updates to a client.
             reconnect_timeout (float): The timeout for reconnection attempts.
             tailwind (bool): Whether to use the Tailwind CSS framework.
             prod_js (bool): Whether to use the production JavaScript bundle.
@@ -139,6 +144,7 @@ class AppConfig:
         self.dark = dark
         self.language = language
         self.binding_refresh_interval = binding_refresh_interval
+        self.message_flush_interval = message_flush_interval
         self.reconnect_timeout = reconnect_timeout
         self.tailwind = tailwind
         self.prod_js = prod_js
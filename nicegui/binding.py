@@ -1,17 +1,62 @@
 import asyncio
+import contextvars
+import dataclasses
 import time
 from collections import defaultdict
 from collections.abc import Mapping
-from typing import Any, Callable, DefaultDict, Dict, Iterable, List, Optional, Set, Tuple, Union
+from contextlib import contextmanager
+from typing import Any, Callable, DefaultDict, Dict, Iterable, Iterator, Optional, Set, Tuple, Type, Union
 
 from . import core
 from .logging import log
+from .observables import ObservableCollection
 
 MAX_PROPAGATION_TIME = 0.01
 
-bindings: DefaultDict[Tuple[int, str], List] = defaultdict(list)
-bindable_properties: Dict[Tuple[int, str], Any] = {}
-active_links: List[Tuple[Any, str, Any, str, Callable[[Any], Any]]] = []
+
+class Link:
+    """A one-way connection from a source property to a target property.
+
+    Source and target objects are kept alive by the link until it is removed (see `remove()`).
+    """
+    __slots__ = ('source_id', 'source_name', 'source_obj', 'target_id', 'target_name', 'target_obj', 'transform')
+
+    def __init__(self, source_obj: Any, source_name: str, target_obj: Any, target_name: str,
+                 transform: Callable[[Any], Any]) -> None:
+        self.source_id = id(source_obj)
+        self.source_name = source_name
+        self.source_obj = source_obj
+        self.target_id = id(target_obj)
+        self.target_name = target_name
+        self.target_obj = target_obj
+        self.transform = transform
+
+
+bindings: DefaultDict[Tuple[int, str], Dict[Link, None]] = defaultdict(dict)
+"""All links, grouped by source object ID and property name (dicts are used as ordered sets)."""
+active_links: DefaultDict[Tuple[int, str], Dict[Link, None]] = defaultdict(dict)
+"""Links which need to be polled, grouped by source object ID and property name."""
+links_by_object: DefaultDict[int, Set[Link]] = defaultdict(set)
+"""All links in which an object is involved as source or target, indexed by object ID."""
+observed_collections: Dict[int, Set[str]] = {}
+"""IDs of observable collections which notify about changes, together with their bound keys."""
+_collection_handlers: Dict[int, Callable[[], None]] = {}
+
+
+class _Batch:
+    """Bindable properties written within a batch, with their owner and whether and which value they had before."""
+
+    def __init__(self) -> None:
+        self.is_open = True
+        self.writes: Dict[Tuple[int, str], Tuple[Any, 'BindableProperty', bool, Any]] = {}
+
+
+# NOTE: the batch is bound to the current context, so an `await` within a batch does not hold back other tasks
+_current_batch: contextvars.ContextVar[Optional[_Batch]] = contextvars.ContextVar('binding_batch', default=None)
+
+
+def _is_equal(a: Any, b: Any) -> bool:
+    return a is b or not a != b
 
 
 def _has_attribute(obj: Union[object, Mapping], name: str) -> Any:
@@ -43,16 +88,28 @@ async def refresh_loop() -> None:
 def _refresh_step() -> None:
     visited: Set[Tuple[int, str]] = set()
     t = time.time()
-    for link in active_links:
-        (source_obj, source_name, target_obj, target_name, transform) = link
-        if _has_attribute(source_obj, source_name):
-            value = transform(_get_attribute(source_obj, source_name))
-            if not _has_attribute(target_obj, target_name) or _get_attribute(target_obj, target_name) != value:
-                _set_attribute(target_obj, target_name, value)
-                _propagate(target_obj, target_name, visited)
-        del link, source_obj, target_obj  # pylint: disable=modified-iterating-list
+    for (_, source_name), links in list(active_links.items()):
+        if not links:
+            continue
+        source_obj = next(iter(links)).source_obj
+        if not _has_attribute(source_obj, source_name):
+            continue
+        source_value = _get_attribute(source_obj, source_name)
+        for link in list(links):
+            target_obj = link.target_obj
+            target_name = link.target_name
+            value = link.transform(source_value)
+            if _has_attribute(target_obj, target_name) and _is_equal(_get_attribute(target_obj, target_name), value):
+                continue
+            _set_attribute(target_obj, target_name, value)
+            _propagate(target_obj, target_name, visited)
+        del links, source_obj
     if time.time() - t > MAX_PROPAGATION_TIME:
-        log.warning(f'binding propagation for {len(active_links)} active links took {time.time() - t:.3f} s')
+        log.warning(f'binding propagation for {_count_active_links()} active links took {time.time() - t:.3f} s')
+
+
+def _count_active_links() -> int:
+    return sum(len(links) for links in active_links.values())
 
 
 def _propagate(source_obj: Any, source_name: str, visited: Optional[Set[Tuple[int, str]]] = None) -> None:
@@ -67,14 +124,81 @@ def _propagate(source_obj: Any, source_name: str, visited: Optional[Set[Tuple[in
         return
     source_value = _get_attribute(source_obj, source_name)
 
-    for _, target_obj, target_name, transform in bindings.get((source_obj_id, source_name), []):
-        if (id(target_obj), target_name) in visited:
+    for link in list(bindings.get((source_obj_id, source_name), ())):
+        if (link.target_id, link.target_name) in visited:
+            continue
+        target_obj = link.target_obj
+        target_name = link.target_name
+        target_value = link.transform(source_value)
+        if _has_attribute(target_obj, target_name) and _is_equal(_get_attribute(target_obj, target_name), target_value):
             continue
+        _set_attribute(target_obj, target_name, target_value)
+        _propagate(target_obj, target_name, visited)
+
+
+def _add_link(source_obj: Any, source_name: str, target_obj: Any, target_name: str,
+              transform: Callable[[Any], Any]) -> None:
+    """Register a link and decide how changes of the source are detected.
+
+    Bindable properties and observable collections notify about changes themselves.
+    All other sources fall back to being polled by the refresh loop.
+    """
+    link = Link(source_obj, source_name, target_obj, target_name, transform)
+    key = (link.source_id, source_name)
+    bindings[key][link] = None
+    links_by_object[link.source_id].add(link)
+    links_by_object[link.target_id].add(link)
+    if _is_bindable_property(source_obj, source_name):
+        return
+    if isinstance(source_obj, ObservableCollection):
+        _observe_collection(source_obj, source_name)
+        return
+    active_links[key][link] = None
 
-        target_value = transform(source_value)
-        if not _has_attribute(target_obj, target_name) or _get_attribute(target_obj, target_name) != target_value:
-            _set_attribute(target_obj, target_name, target_value)
-            _propagate(target_obj, target_name, visited)
+
+def _is_bindable_property(obj: Any, name: str) -> bool:
+    return isinstance(getattr(type(obj), name, None), BindableProperty) and hasattr(obj, '___' + name)
+
+
+def _observe_collection(collection: ObservableCollection, name: str) -> None:
+    if id(collection) not in observed_collections:
+        names: Set[str] = set()
+        observed_collections[id(collection)] = names
+
+        def propagate_changes() -> None:
+            for name in list(names):
+                _propagate(collection, name)
+
+        collection.on_change(propagate_changes)
+        _collection_handlers[id(collection)] = propagate_changes
+    observed_collections[id(collection)].add(name)
+
+
+def _remove_link(link: Link) -> None:
+    key = (link.source_id, link.source_name)
+    for registry in (bindings, active_links):
+        links = registry.get(key)
+        if links is not None:
+            links.pop(link, None)
+            if not links:
+                del registry[key]
+    if key not in bindings and link.source_id in observed_collections:
+        names = observed_collections[link.source_id]
+        names.discard(link.source_name)
+        if not names:
+            del observed_collections[link.source_id]
+            link.source_obj.remove_change_handler(_collection_handlers.pop(link.source_id))
+    for obj_id in (link.source_id, link.target_id):
+        object_links = links_by_object.get(obj_id)
+        if object_links is not None:
+            object_links.discard(link)
+            if not object_links:
+                del links_by_object[obj_id]
+
+
+def _remove_object_links(obj_id: int) -> None:
+    for link in list(links_by_object.get(obj_id, ())):
+        _remove_link(link)
 
 
 def bind_to(self_obj: Any, self_name: str, other_obj: Any, other_name: str, forward: Callable[[Any], Any]) -> None:
@@ -89,9 +213,7 @@ def bind_to(self_obj: Any, self_name: str, other_obj: Any, other_name: str, forw
     :param other_name: The name of the property to bind to.
     :param forward: A function to apply to the value before applying it.
     """
-    bindings[(id(self_obj), self_name)].append((self_obj, other_obj, other_name, forward))
-    if (id(self_obj), self_name) not in bindable_properties:
-        active_links.append((self_obj, self_name, other_obj, other_name, forward))
+    _add_link(self_obj, self_name, other_obj, other_name, forward)
     _propagate(self_obj, self_name)
 
 
@@ -107,9 +229,7 @@ def bind_from(self_obj: Any, self_name: str, other_obj: Any, other_name: str, ba
     :param other_name: The name of the property to bind from.
     :param backward: A function to apply to the value before applying it.
     """
-    bindings[(id(other_obj), other_name)].append((other_obj, self_obj, self_name, backward))
-    if (id(other_obj), other_name) not in bindable_properties:
-        active_links.append((other_obj, other_name, self_obj, self_name, backward))
+    _add_link(other_obj, other_name, self_obj, self_name, backward)
     _propagate(other_obj, other_name)
 
 
@@ -141,42 +261,112 @@ class BindableProperty:
         self.name = name  # pylint: disable=attribute-defined-outside-init
 
     def __get__(self, owner: Any, _=None) -> Any:
+        if owner is None:
+            return self
         return getattr(owner, '___' + self.name)
 
     def __set__(self, owner: Any, value: Any) -> None:
         has_attr = hasattr(owner, '___' + self.name)
-        value_changed = has_attr and getattr(owner, '___' + self.name) != value
+        current_batch = _current_batch.get()
+        if current_batch is not None and current_batch.is_open:
+            key = (id(owner), self.name)
+            if key not in current_batch.writes:
+                current_batch.writes[key] = (owner, self, has_attr, getattr(owner, '___' + self.name, None))
+            setattr(owner, '___' + self.name, value)
+            return
+        value_changed = has_attr and not _is_equal(getattr(owner, '___' + self.name), value)
         if has_attr and not value_changed:
             return
         setattr(owner, '___' + self.name, value)
-        bindable_properties[(id(owner), self.name)] = owner
-        _propagate(owner, self.name)
+        self._notify(owner, value, has_attr, value_changed)
+
+    def _notify(self, owner: Any, value: Any, had_attr: bool, value_changed: bool) -> None:
+        if not had_attr:
+            active_links.pop((id(owner), self.name), None)  # NOTE: the property notifies about changes, no need to poll
+        if (id(owner), self.name) in bindings:
+            _propagate(owner, self.name)
         if value_changed and self._change_handler is not None:
             self._change_handler(owner, value)
 
 
+@contextmanager
+def batch() -> Iterator[None]:
+    """Defer the propagation of bindable properties until the end of the block.
+
+    Repeated writes to the same property are collapsed into a single propagation
+    and a single call of its change handler, which is skipped if the final value equals the initial one.
+    Batches can be nested; changes are propagated when leaving the outermost batch.
+    """
+    current_batch = _current_batch.get()
+    if current_batch is not None and current_batch.is_open:
+        yield
+        return
+    current_batch = _Batch()
+    token = _current_batch.set(current_batch)
+    try:
+        yield
+    finally:
+        current_batch.is_open = False  # NOTE: tasks created within the batch share it, but write directly from now on
+        _current_batch.reset(token)
+        _flush_batched_writes(current_batch.writes.values())
+
+
+def _flush_batched_writes(writes: Iterable[Tuple[Any, 'BindableProperty', bool, Any]]) -> None:
+    """Notify about all written properties, even if some of the notifications fail."""
+    error: Optional[Exception] = None
+    for owner, bindable_property, had_attr, old_value in writes:
+        value = getattr(owner, '___' + bindable_property.name)
+        value_changed = had_attr and not _is_equal(old_value, value)
+        if had_attr and not value_changed:
+            continue
+        try:
+            bindable_property._notify(owner, value, had_attr, value_changed)  # pylint: disable=protected-access
+        except Exception as e:
+            error = error or e
+    if error is not None:
+        raise error
+
+
+def bindable_dataclass(cls: Optional[Type] = None, *,
+                       bindable_fields: Optional[Iterable[str]] = None,
+                       **kwargs: Any) -> Union[Type, Callable[[Type], Type]]:
+    """A dataclass with bindable properties.
+
+    All fields (or only the given `bindable_fields`) are turned into bindable properties.
+    This way bindings to instances of this class are updated on change instead of being polled by the refresh loop.
+
+    :param cls: class to be transformed into a dataclass
+    :param bindable_fields: optional list of field names to make bindable (default: all fields)
+    :param kwargs: optional keyword arguments passed to `dataclasses.dataclass` (``slots=True`` is not supported)
+    """
+    if kwargs.get('slots'):
+        raise ValueError('`slots=True` is not supported with bindable_dataclass')
+
+    def wrap(cls: Type) -> Type:
+        cls = dataclasses.dataclass(**kwargs)(cls)
+        field_names = {field.name for field in dataclasses.fields(cls)}
+        for name in (field_names if bindable_fields is None else bindable_fields):
+            if name not in field_names:
+                raise ValueError(f'"{name}" is not a dataclass field')
+            bindable_property = BindableProperty()
+            bindable_property.__set_name__(cls, name)
+            setattr(cls, name, bindable_property)
+        return cls
+
+    return wrap if cls is None else wrap(cls)
+
+
 def remove(objects: Iterable[Any]) -> None:
     """Remove all bindings that involve the given objects.
 
+    Only the links of the given objects are visited, no matter how many other bindings exist.
+    Links hold their objects strongly, so bound objects are kept alive until their bindings are removed.
+    Elements remove their bindings automatically when they are deleted.
+
     :param objects: The objects to remove.
     """
-    object_ids = set(map(id, objects))
-    active_links[:] = [
-        (source_obj, source_name, target_obj, target_name, transform)
-        for source_obj, source_name, target_obj, target_name, transform in active_links
-        if id(source_obj) not in object_ids and id(target_obj) not in object_ids
-    ]
-    for key, binding_list in list(bindings.items()):
-        binding_list[:] = [
-            (source_obj, target_obj, target_name, transform)
-            for source_obj, target_obj, target_name, transform in binding_list
-            if id(source_obj) not in object_ids and id(target_obj) not in object_ids
-        ]
-        if not binding_list:
-            del bindings[key]
-    for (obj_id, name), obj in list(bindable_properties.items()):
-        if id(obj) in object_ids:
-            del bindable_properties[(obj_id, name)]
+    for obj in objects:
+        _remove_object_links(id(obj))
 
 
 def reset() -> None:
@@ -185,5 +375,7 @@ def reset() -> None:
     This function is intended for testing purposes only.
     """
     bindings.clear()
-    bindable_properties.clear()
     active_links.clear()
+    links_by_object.clear()
+    observed_collections.clear()
+    _collection_handlers.clear()
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import inspect
+import os
 import time
 import uuid
+from collections import OrderedDict
 from contextlib import contextmanager
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
     Awaitable,
     Callable,
     Dict,
@@ -16,17 +20,19 @@ from typing import (
     Iterator,
     List,
     Optional,
+    Set,
+    Tuple,
     Union,
 )
 
 from fastapi import Request
-from fastapi.responses import Response
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from typing_extensions import Self
 
 from . import background_tasks, binding, core, helpers, json
 from .awaitable_response import AwaitableResponse
-from .dependencies import generate_resources
+from .dependencies import generate_resources, libraries, vue_components
 from .element import Element
 from .favicon import get_favicon_url
 from .logging import log
@@ -38,6 +44,23 @@ if TYPE_CHECKING:
 
 templates = Jinja2Templates(Path(__file__).parent / "templates")
 
+RENDER_CACHE_SIZE = int(os.environ.get("NICEGUI_RENDER_CACHE_SIZE", "100"))
+STREAMING_RENDER_THRESHOLD = int(
+    os.environ.get("NICEGUI_STREAMING_RENDER_THRESHOLD", "10000")
+)
+STREAMING_RENDER_CHUNK_SIZE = 1000
+CLIENT_ID_PLACEHOLDER = "__nicegui_client_id__"
+ELEMENTS_PLACEHOLDER = "__nicegui_elements__"
+HTML_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", "`": "&#96;", "$": "&#36;"}
+)
+
+render_cache: OrderedDict[str, str] = OrderedDict()
+"""Maps fingerprints of element trees and page settings to rendered pages with a client ID placeholder.
+
+The elements are still serialized for every request to compute the fingerprint, only the template rendering is cached.
+"""
+
 
 class Client:
     page_routes: Dict[Callable[..., Any], str] = {}
@@ -61,10 +84,14 @@ class Client:
         self.instances[self.id] = self
 
         self.elements: Dict[int, Element] = {}
+        self.deferred_containers: Dict[int, Element] = {}
+        self.deferred_element_ids: Set[int] = set()
+        self.deferred_method_calls: Dict[int, List[Tuple[str, Tuple[Any, ...]]]] = {}
         self.next_element_id: int = 0
         self.is_waiting_for_connection: bool = False
         self.is_waiting_for_disconnect: bool = False
         self.environ: Optional[Dict[str, Any]] = None
+        self.session_id: Optional[str] = None
         self.shared = shared
         self.on_air = False
         self._disconnect_task: Optional[asyncio.Task] = None
@@ -129,57 +156,129 @@ class Client:
         prefix = request.headers.get(
             "X-Forwarded-Prefix", request.scope.get("root_path", "")
         )
-        elements = json.dumps(
+        context = {
+            "version": __version__,
+            "head_html": self.head_html,
+            "title": self.page.resolve_title() if self.title is None else self.title,
+            "viewport": self.page.resolve_viewport(),
+            "favicon_url": get_favicon_url(self.page, prefix),
+            "dark": str(self.page.resolve_dark()),
+            "language": self.page.resolve_language(),
+            "prefix": prefix,
+            "tailwind": core.app.config.tailwind,
+            "prod_js": core.app.config.prod_js,
+            "quasar_config": json.dumps(core.app.config.quasar_config),
+            "socket_io_js_query_params": {
+                **core.app.config.socket_io_js_query_params,
+                "client_id": CLIENT_ID_PLACEHOLDER,
+            },
+            "socket_io_js_extra_headers": core.app.config.socket_io_js_extra_headers,
+            "socket_io_js_transports": core.app.config.socket_io_js_transports,
+        }
+        headers = {"Cache-Control": "no-store", "X-NiceGUI-Content": "page"}
+        elements = self.elements
+        if self.deferred_element_ids:
+            elements = {
+                id: element
+                for id, element in self.elements.items()
+                if id not in self.deferred_element_ids
+            }
+        if len(elements) > STREAMING_RENDER_THRESHOLD:
+            html = self._render(prefix, elements, ELEMENTS_PLACEHOLDER, context)
+            head, tail = html.replace(CLIENT_ID_PLACEHOLDER, self.id).split(
+                ELEMENTS_PLACEHOLDER, 1
+            )
+            return StreamingResponse(
+                self._stream_elements(elements, head, tail),
+                status_code=status_code,
+                headers=headers,
+                media_type="text/html",
+            )
+
+        elements_json = json.dumps(
             {
                 id: element._to_dict()
-                for id, element in self.elements.items()  # pylint: disable=protected-access
-            }
+                for id, element in elements.items()  # pylint: disable=protected-access
+            },
+            bytes_as_base64=True,
         )
-        socket_io_js_query_params = {
-            **core.app.config.socket_io_js_query_params,
-            "client_id": self.id,
-        }
+        # NOTE: elements like ui.upload embed the client ID, which must not make the page unique
+        elements_json = elements_json.replace(self.id, CLIENT_ID_PLACEHOLDER)
+        fingerprint = hashlib.sha256(
+            "\0".join(
+                [
+                    elements_json,
+                    self.body_html,
+                    repr(sorted(context.items())),
+                    # NOTE: libraries and components are only registered, so their number identifies the registries
+                    str(len(libraries)),
+                    str(len(vue_components)),
+                ]
+            ).encode()
+        ).hexdigest()
+        html = render_cache.get(fingerprint)
+        if html is None:
+            html = self._render(prefix, elements, elements_json, context)
+            render_cache[fingerprint] = html
+            while len(render_cache) > RENDER_CACHE_SIZE:
+                render_cache.popitem(last=False)
+        else:
+            render_cache.move_to_end(fingerprint)
+        return HTMLResponse(
+            html.replace(CLIENT_ID_PLACEHOLDER, self.id),
+            status_code=status_code,
+            headers=headers,
+        )
+
+    async def _stream_elements(
+        self, elements: Dict[int, Element], head: str, tail: str
+    ) -> AsyncIterator[str]:
+        """Stream the rendered page while serializing the elements chunk by chunk.
+
+        This way the browser can start loading the resources in the head of the page right away
+        and the complete element JSON never needs to be held in memory.
+        """
+        yield head
+        items = list(elements.items())
+        yield "{"
+        for i in range(0, len(items), STREAMING_RENDER_CHUNK_SIZE):
+            chunk_items = items[i : i + STREAMING_RENDER_CHUNK_SIZE]
+            chunk = json.dumps(
+                {
+                    id: element._to_dict()
+                    for id, element in chunk_items  # pylint: disable=protected-access
+                },
+                bytes_as_base64=True,
+            )[1:-1]
+            yield ("," if i else "") + chunk.translate(HTML_ESCAPE_TABLE)
+            # NOTE: give other tasks a chance to run between chunks
+            await asyncio.sleep(0)
+        yield "}"
+        yield tail
+
+    def _render(
+        self,
+        prefix: str,
+        elements: Dict[int, Element],
+        elements_json: str,
+        context: Dict[str, Any],
+    ) -> str:
+        """Render the page template with a placeholder for the client ID."""
         vue_html, vue_styles, vue_scripts, imports, js_imports = generate_resources(
-            prefix, self.elements.values()
+            prefix, elements.values()
         )
-        return templates.TemplateResponse(
-            request=request,
-            name="index.html",
-            context={
-                "request": request,
-                "version": __version__,
-                "elements": elements.replace("&", "&amp;")
-                .replace("<", "&lt;")
-                .replace(">", "&gt;")
-                .replace("`", "&#96;")
-                .replace("$", "&#36;"),
-                "head_html": self.head_html,
-                "body_html": "<style>"
-                + "\n".join(vue_styles)
-                + "</style>\n"
-                + self.body_html
-                + "\n"
-                + "\n".join(vue_html),
-                "vue_scripts": "\n".join(vue_scripts),
-                "imports": json.dumps(imports),
-                "js_imports": "\n".join(js_imports),
-                "quasar_config": json.dumps(core.app.config.quasar_config),
-                "title": self.page.resolve_title()
-                if self.title is None
-                else self.title,
-                "viewport": self.page.resolve_viewport(),
-                "favicon_url": get_favicon_url(self.page, prefix),
-                "dark": str(self.page.resolve_dark()),
-                "language": self.page.resolve_language(),
-                "prefix": prefix,
-                "tailwind": core.app.config.tailwind,
-                "prod_js": core.app.config.prod_js,
-                "socket_io_js_query_params": socket_io_js_query_params,
-                "socket_io_js_extra_headers": core.app.config.socket_io_js_extra_headers,
-                "socket_io_js_transports": core.app.config.socket_io_js_transports,
-            },
-            status_code=status_code,
-            headers={"Cache-Control": "no-store", "X-NiceGUI-Content": "page"},
+        return templates.get_template("index.html").render(
+            **context,
+            elements=elements_json.translate(HTML_ESCAPE_TABLE),
+            body_html="<style>"
+            + "\n".join(vue_styles)
+            + "</style>\n"
+            + self.body_html
+            + "\n"
+            + "\n".join(vue_html),
+            vue_scripts="\n".join(vue_scripts),
+            imports=json.dumps(imports),
+            js_imports="\n".join(js_imports),
         )
 
     async def connected(
@@ -292,6 +391,7 @@ class Client:
         if self._disconnect_task:
             self._disconnect_task.cancel()
             self._disconnect_task = None
+        self.outbox.wake_up()
         for t in self.connect_handlers:
             self.safe_invoke(t)
         for t in core.app._connect_handlers:  # pylint: disable=protected-access
@@ -369,6 +469,9 @@ class Client:
             self.outbox.enqueue_delete(element)
         for element_id in element_ids:
             del self.elements[element_id]
+            self.deferred_containers.pop(element_id, None)
+            self.deferred_element_ids.discard(element_id)
+            self.deferred_method_calls.pop(element_id, None)
 
     def remove_all_elements(self) -> None:
         """Remove all elements from the client."""
@@ -0,0 +1,172 @@
+"""Columnar binary encoding of NumPy arrays and pandas DataFrames.
+
+Numeric data is not serialized value by value but as raw little-endian buffers.
+These are transmitted as binary socket.io attachments (or as base64 strings when embedded into the initial page)
+and decoded into typed arrays by `static/utils/columnar.js` in the browser.
+"""
+
+import os
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+try:
+    import numpy as np
+
+    has_numpy = True
+except ImportError:
+    has_numpy = False
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+ARRAY_KEY = "__ndarray__"
+COLUMNS_KEY = "__columns__"
+TYPED_ARRAY_DTYPES = {
+    "int8",
+    "uint8",
+    "int16",
+    "uint16",
+    "int32",
+    "uint32",
+    "float32",
+    "float64",
+}
+# NOTE: largest integer which is exactly representable as JavaScript number
+MAX_SAFE_INTEGER = 2**53 - 1
+BUFFER_DTYPES = {"bool": "uint8", "int64": "float64", "uint64": "float64"}
+# NOTE: small arrays are cheaper to send as JSON numbers than as separate binary attachments
+MIN_BINARY_ARRAY_SIZE = int(os.environ.get("NICEGUI_MIN_BINARY_ARRAY_SIZE", "1000"))
+
+
+def encode_array(array: "np.ndarray") -> Optional[Dict[str, Any]]:
+    """Encode a numeric NumPy array into a binary buffer.
+
+    64-bit integers are sent as float64 if they are exactly representable as JavaScript numbers.
+    Booleans are sent as bytes.
+
+    :param array: NumPy array
+    :return: encoded array or `None` if the data type is not supported
+    """
+    dtype = array.dtype.name
+    if dtype in {"int64", "uint64"} and array.size:
+        if array.max() > MAX_SAFE_INTEGER or array.min() < -MAX_SAFE_INTEGER:
+            return None
+    if dtype in BUFFER_DTYPES:
+        array = array.astype(BUFFER_DTYPES[dtype])
+    elif dtype not in TYPED_ARRAY_DTYPES:
+        return None
+    buffer = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<")).tobytes()
+    return {ARRAY_KEY: {"dtype": dtype, "shape": list(array.shape), "buffer": buffer}}
+
+
+def to_serializable(df: "pd.DataFrame") -> "pd.DataFrame":
+    """Convert columns of a pandas DataFrame which are not JSON-serializable to strings.
+
+    This concerns columns of type `datetime64[ns]`, `timedelta64[ns]`, `complex128` and `period[M]`.
+    The DataFrame is only copied if such columns exist.
+
+    :param df: pandas DataFrame
+    :return: DataFrame with JSON-serializable values
+    """
+    date_cols = df.columns[df.dtypes == "datetime64[ns]"]
+    time_cols = df.columns[df.dtypes == "timedelta64[ns]"]
+    complex_cols = df.columns[df.dtypes == "complex128"]
+    period_cols = df.columns[df.dtypes == "period[M]"]
+    if (
+        len(date_cols) != 0
+        or len(time_cols) != 0
+        or len(complex_cols) != 0
+        or len(period_cols) != 0
+    ):
+        df = df.copy()
+        df[date_cols] = df[date_cols].astype(str)
+        df[time_cols] = df[time_cols].astype(str)
+        df[complex_cols] = df[complex_cols].astype(str)
+        df[period_cols] = df[period_cols].astype(str)
+    return df
+
+
+def encode_dataframe(df: "pd.DataFrame") -> Dict[str, Any]:
+    """Encode a pandas DataFrame column by column.
+
+    Numeric columns are encoded as binary buffers, all other columns as lists of values.
+
+    :param df: pandas DataFrame (with JSON-serializable values)
+    :return: encoded DataFrame
+    """
+    columns: List[Any] = []
+    for name in df.columns:
+        values = df[name].to_numpy()
+        encoded = encode_array(values) if values.dtype.kind in "biuf" else None
+        columns.append(values.tolist() if encoded is None else encoded)
+    return {
+        COLUMNS_KEY: {
+            "length": len(df),
+            "names": [_column_label(name) for name in df.columns],
+            "columns": columns,
+        }
+    }
+
+
+def _column_label(name: Any) -> Any:
+    # NOTE: labels are kept for decoding on the Python side, JavaScript turns them into strings when used as keys
+    return name if name is None or isinstance(name, (str, int, float)) else str(name)
+
+
+def encode_arrays(obj: Any, min_size: Optional[int] = None) -> Any:
+    """Replace all numeric NumPy arrays within nested dictionaries and lists by their binary encoding.
+
+    The given object is not modified; containers are only copied if they contain an encoded array.
+
+    :param obj: object to encode
+    :param min_size: minimum number of array elements for binary encoding (default: `MIN_BINARY_ARRAY_SIZE`)
+    """
+    if not has_numpy:
+        return obj
+    if min_size is None:
+        min_size = MIN_BINARY_ARRAY_SIZE
+    if isinstance(obj, np.ndarray):
+        return (encode_array(obj) if obj.size >= min_size else None) or obj
+    if isinstance(obj, dict):
+        encoded_dict = {
+            key: encode_arrays(value, min_size) for key, value in obj.items()
+        }
+        return (
+            obj
+            if all(encoded_dict[key] is value for key, value in obj.items())
+            else encoded_dict
+        )
+    if isinstance(obj, list):
+        encoded_list = [encode_arrays(value, min_size) for value in obj]
+        return obj if all(a is b for a, b in zip(encoded_list, obj)) else encoded_list
+    return obj
+
+
+def is_encoded(obj: Any) -> bool:
+    """Whether the object is an encoded array or DataFrame."""
+    return (
+        isinstance(obj, dict)
+        and (ARRAY_KEY in obj or COLUMNS_KEY in obj)
+        and len(obj) == 1
+    )
+
+
+def decode_array(encoded: Dict[str, Any]) -> List[Any]:
+    """Decode an encoded array into (nested) lists of Python values."""
+    data = encoded[ARRAY_KEY]
+    dtype = BUFFER_DTYPES.get(data["dtype"], data["dtype"])
+    array = np.frombuffer(
+        data["buffer"], dtype=np.dtype(dtype).newbyteorder("<")
+    ).reshape(data["shape"])
+    return array.astype(data["dtype"]).tolist()
+
+
+def decode_rows(encoded: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Decode an encoded DataFrame into a list of rows."""
+    data = encoded[COLUMNS_KEY]
+    columns = [
+        decode_array(column) if is_encoded(column) else column
+        for column in data["columns"]
+    ]
+    if not columns:
+        return [{} for _ in range(data["length"])]
+    return [dict(zip(data["names"], values)) for values in zip(*columns)]
@@ -3,9 +3,10 @@ from __future__ import annotations
 import ast
 import inspect
 import re
-from copy import copy, deepcopy
+from copy import copy
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Sequence, Union, overload
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Union, overload
 
 from typing_extensions import Self
 
@@ -53,14 +54,39 @@ TAG_CHAR = TAG_START_CHAR + r'|-|\.|[0-9]|\u00B7|[\u0300-\u036F]|[\u203F-\u2040]
 TAG_PATTERN = re.compile(fr'^({TAG_START_CHAR})({TAG_CHAR})*$')
 
 
+def _raise_on_modification(*_: Any, **__: Any) -> Any:
+    raise TypeError('shared defaults must not be modified, assign a modified copy instead')
+
+
+class SharedList(list):
+    """A list which is shared by many elements (e.g. default classes) and therefore must not be modified."""
+    append = extend = insert = remove = pop = clear = sort = reverse = _raise_on_modification  # type: ignore
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _raise_on_modification  # type: ignore
+
+
+class SharedDict(dict):
+    """A dictionary which is shared by many elements (e.g. default styles) and therefore must not be modified."""
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _raise_on_modification  # type: ignore
+    __ior__ = _raise_on_modification  # type: ignore
+
+
+NO_EVENT_LISTENERS: Dict[str, EventListener] = SharedDict()
+
+_valid_tags: Set[str] = set()
+
+
 class Element(Visibility):
+    __slots__ = ('client', 'id', 'tag', '_class_list', '_style_dict', '_props', '_listener_dict', '_text',
+                 'slots', 'default_slot', '_deleted', 'parent_slot', '_tailwind')
+    # NOTE: core attributes are stored in slots to reduce the memory footprint of each element
+
     component: Optional[Component] = None
     libraries: List[Library] = []
     extra_libraries: List[Library] = []
     exposed_libraries: List[Library] = []
     _default_props: Dict[str, Any] = {}
-    _default_classes: List[str] = []
-    _default_style: Dict[str, str] = {}
+    _default_classes: List[str] = SharedList()
+    _default_style: Dict[str, str] = SharedDict()
 
     def __init__(self, tag: Optional[str] = None, *, _client: Optional[Client] = None) -> None:
         """Generic Element
@@ -72,19 +98,20 @@ class Element(Visibility):
         :param _client: client for this element (for internal use only)
         """
         super().__init__()
-        self.client = _client or context.get_client()
+        slot_stack = context.get_slot_stack()
+        self.client = _client or (slot_stack[-1].parent.client if slot_stack else context.get_client())
         self.id = self.client.next_element_id
         self.client.next_element_id += 1
         self.tag = tag if tag else self.component.tag if self.component else 'div'
-        if not TAG_PATTERN.match(self.tag):
-            raise ValueError(f'Invalid HTML tag: {self.tag}')
-        self._classes: List[str] = []
-        self._classes.extend(self._default_classes)
-        self._style: Dict[str, str] = {}
-        self._style.update(self._default_style)
-        self._props: Dict[str, Any] = {'key': self.id}  # HACK: workaround for #600 and #898
-        self._props.update(self._default_props)
-        self._event_listeners: Dict[str, EventListener] = {}
+        if self.tag not in _valid_tags:
+            if not TAG_PATTERN.match(self.tag):
+                raise ValueError(f'Invalid HTML tag: {self.tag}')
+            _valid_tags.add(self.tag)
+        # NOTE: classes and style are shared with the class defaults until they are modified (see `_classes` and `_style`)
+        self._class_list: List[str] = self._default_classes
+        self._style_dict: Dict[str, str] = self._default_style
+        self._props: Dict[str, Any] = {'key': self.id, **self._default_props}  # HACK: workaround for #600 and #898
+        self._listener_dict: Dict[str, EventListener] = NO_EVENT_LISTENERS  # NOTE: replaced on first access
         self._text: Optional[str] = None
         self.slots: Dict[str, Slot] = {}
         self.default_slot = self.add_slot('default')
@@ -92,12 +119,14 @@ class Element(Visibility):
 
         self.client.elements[self.id] = self
         self.parent_slot: Optional[Slot] = None
-        slot_stack = context.get_slot_stack()
         if slot_stack:
             self.parent_slot = slot_stack[-1]
             self.parent_slot.children.append(self)
+            deferring = self.client.deferred_containers and self.parent_slot.parent._is_deferring()  # pylint: disable=protected-access
+            if deferring:
+                self.client.deferred_element_ids.add(self.id)
 
-        self.tailwind = Tailwind(self)
+        self._tailwind: Optional[Tailwind] = None
 
         self.client.outbox.enqueue_update(self)
         if self.parent_slot:
@@ -136,8 +165,46 @@ class Element(Visibility):
                 cls.exposed_libraries.append(register_library(path, expose=True))
 
         cls._default_props = copy(cls._default_props)
-        cls._default_classes = copy(cls._default_classes)
-        cls._default_style = copy(cls._default_style)
+
+    @property
+    def _classes(self) -> List[str]:
+        """The HTML classes of the element (copied from the shared class defaults on first access)."""
+        if isinstance(self._class_list, SharedList):
+            self._class_list = list(self._class_list)
+        return self._class_list
+
+    @_classes.setter
+    def _classes(self, classes: List[str]) -> None:
+        self._class_list = classes
+
+    @property
+    def _style(self) -> Dict[str, str]:
+        """The CSS definitions of the element (copied from the shared style defaults on first access)."""
+        if isinstance(self._style_dict, SharedDict):
+            self._style_dict = dict(self._style_dict)
+        return self._style_dict
+
+    @_style.setter
+    def _style(self, style: Dict[str, str]) -> None:
+        self._style_dict = style
+
+    @property
+    def _event_listeners(self) -> Dict[str, EventListener]:
+        """The event listeners of the element (replacing the shared empty dictionary on first access)."""
+        if self._listener_dict is NO_EVENT_LISTENERS:
+            self._listener_dict = {}
+        return self._listener_dict
+
+    @_event_listeners.setter
+    def _event_listeners(self, listeners: Dict[str, EventListener]) -> None:
+        self._listener_dict = listeners
+
+    @property
+    def tailwind(self) -> Tailwind:
+        """Tailwind helper for this element (created on first access)."""
+        if self._tailwind is None:
+            self._tailwind = Tailwind(self)
+        return self._tailwind
 
     def add_resource(self, path: Union[str, Path]) -> None:
         """Add a resource to the element.
@@ -190,12 +257,12 @@ class Element(Visibility):
         return {
             'id': self.id,
             'tag': self.tag,
-            'class': self._classes,
-            'style': self._style,
+            'class': self._class_list,
+            'style': self._style_dict,
             'props': self._props,
             'text': self._text,
             'slots': self._collect_slot_dict(),
-            'events': [listener.to_dict() for listener in self._event_listeners.values()],
+            'events': [listener.to_dict() for listener in self._listener_dict.values()],
             'component': {
                 'key': self.component.key,
                 'name': self.component.name,
@@ -209,6 +276,18 @@ class Element(Visibility):
             ],
         }
 
+    def _to_patch(self, fields: Dict[str, Set[str]]) -> Dict[str, Any]:
+        patch: Dict[str, Any] = {}
+        if 'class' in fields:
+            patch['class'] = self._class_list
+        for field, values in (('props', self._props), ('style', self._style_dict)):
+            if field in fields:
+                patch[field] = {key: values[key] for key in fields[field] if key in values}
+                removed = [key for key in fields[field] if key not in values]
+                if removed:
+                    patch[f'{field}_removed'] = removed
+        return patch
+
     @staticmethod
     def _update_classes_list(classes: List[str],
                              add: Optional[str] = None,
@@ -234,10 +313,10 @@ class Element(Visibility):
         :param remove: whitespace-delimited string of classes to remove from the element
         :param replace: whitespace-delimited string of classes to use instead of existing ones
         """
-        new_classes = self._update_classes_list(self._classes, add, remove, replace)
-        if self._classes != new_classes:
-            self._classes = new_classes
-            self.update()
+        new_classes = self._update_classes_list(self._class_list, add, remove, replace)
+        if self._class_list != new_classes:
+            self._class_list = new_classes
+            self._update_patch('class')
         return self
 
     @classmethod
@@ -257,18 +336,20 @@ class Element(Visibility):
         :param remove: whitespace-delimited string of classes to remove from the element
         :param replace: whitespace-delimited string of classes to use instead of existing ones
         """
-        cls._default_classes = cls._update_classes_list(cls._default_classes, add, remove, replace)
+        cls._default_classes = SharedList(cls._update_classes_list(cls._default_classes, add, remove, replace))
         return cls
 
     @staticmethod
+    @lru_cache(maxsize=1000)
     def _parse_style(text: Optional[str]) -> Dict[str, str]:
+        # NOTE: the result is cached and shared between calls, so it must not be modified
         result = {}
         for word in (text or '').split(';'):
             word = word.strip()
             if word:
                 key, value = word.split(':', 1)
                 result[key.strip()] = value.strip()
-        return result
+        return SharedDict(result)
 
     def style(self,
               add: Optional[str] = None, *,
@@ -282,14 +363,16 @@ class Element(Visibility):
         :param remove: semicolon-separated list of styles to remove from the element
         :param replace: semicolon-separated list of styles to use instead of existing ones
         """
-        style_dict = deepcopy(self._style) if replace is None else {}
+        style_dict = dict(self._style_dict) if replace is None else {}
         for key in self._parse_style(remove):
             style_dict.pop(key, None)
         style_dict.update(self._parse_style(add))
         style_dict.update(self._parse_style(replace))
-        if self._style != style_dict:
-            self._style = style_dict
-            self.update()
+        if self._style_dict != style_dict:
+            changed_keys = {key for key in self._style_dict.keys() | style_dict.keys()
+                            if self._style_dict.get(key) != style_dict.get(key)}
+            self._style_dict = style_dict
+            self._update_patch('style', changed_keys)
         return self
 
     @classmethod
@@ -307,16 +390,18 @@ class Element(Visibility):
         :param remove: semicolon-separated list of styles to remove from the element
         :param replace: semicolon-separated list of styles to use instead of existing ones
         """
-        if replace is not None:
-            cls._default_style.clear()
+        style_dict = dict(cls._default_style) if replace is None else {}
         for key in cls._parse_style(remove):
-            cls._default_style.pop(key, None)
-        cls._default_style.update(cls._parse_style(add))
-        cls._default_style.update(cls._parse_style(replace))
+            style_dict.pop(key, None)
+        style_dict.update(cls._parse_style(add))
+        style_dict.update(cls._parse_style(replace))
+        cls._default_style = SharedDict(style_dict)
         return cls
 
     @staticmethod
+    @lru_cache(maxsize=1000)
     def _parse_props(text: Optional[str]) -> Dict[str, Any]:
+        # NOTE: the result is cached and shared between calls, so it must not be modified
         dictionary = {}
         for match in PROPS_PATTERN.finditer(text or ''):
             key = match.group(1)
@@ -327,7 +412,7 @@ class Element(Visibility):
                 if (value.startswith("'") and value.endswith("'")) or (value.startswith('"') and value.endswith('"')):
                     value = ast.literal_eval(value)
                 dictionary[key] = value
-        return dictionary
+        return SharedDict(dictionary)
 
     def props(self,
               add: Optional[str] = None, *,
@@ -342,17 +427,17 @@ class Element(Visibility):
         :param add: whitespace-delimited list of either boolean values or key=value pair to add
         :param remove: whitespace-delimited list of property keys to remove
         """
-        needs_update = False
+        changed_keys: Set[str] = set()
         for key in self._parse_props(remove):
             if key in self._props:
-                needs_update = True
+                changed_keys.add(key)
                 del self._props[key]
         for key, value in self._parse_props(add).items():
             if self._props.get(key) != value:
-                needs_update = True
+                changed_keys.add(key)
                 self._props[key] = value
-        if needs_update:
-            self.update()
+        if changed_keys:
+            self._update_patch('props', changed_keys)
         return self
 
     @classmethod
@@ -448,7 +533,7 @@ class Element(Visibility):
         return self
 
     def _handle_event(self, msg: Dict) -> None:
-        listener = self._event_listeners[msg['listener_id']]
+        listener = self._listener_dict[msg['listener_id']]
         storage.request_contextvar.set(listener.request)
         args = events.GenericEventArguments(sender=self, client=self.client, args=msg['args'])
         events.handle_event(listener.handler, args)
@@ -459,6 +544,23 @@ class Element(Visibility):
             return
         self.client.outbox.enqueue_update(self)
 
+    def _update_patch(self, field: str, keys: Iterable[str] = ()) -> None:
+        """Update only the given field (and keys) of the element on the client side.
+
+        In contrast to `update()` the element is not re-sent as a whole, which saves bandwidth and serialization time.
+        Elements overriding `update()` (e.g. to refresh derived props or to notify their JavaScript component)
+        are updated via `update()` instead.
+
+        :param field: changed field of the element ("props", "style" or "class")
+        :param keys: changed keys of the field (only for "props" and "style")
+        """
+        if self.is_deleted:
+            return
+        if type(self).update is not Element.update:
+            self.update()
+            return
+        self.client.outbox.enqueue_patch(self, field, keys)
+
     def run_method(self, name: str, *args: Any, timeout: float = 1, check_interval: float = 0.01) -> AwaitableResponse:
         """Run a method on the client side.
 
@@ -472,9 +574,64 @@ class Element(Visibility):
         """
         if not core.loop:
             return NullResponse()
+        if self.id in self.client.deferred_element_ids:
+            # NOTE: the element does not exist in the browser yet, so the method is called once it has been sent
+            self.client.deferred_method_calls.setdefault(self.id, []).append((name, args))
+            return NullResponse()
         return self.client.run_javascript(f'return runMethod({self.id}, "{name}", {json.dumps(args)})',
                                           timeout=timeout, check_interval=check_interval)
 
+    def _defer_content(self) -> None:
+        """Do not send the descendants of this element to the browser before `_show_content` is called."""
+        self.client.deferred_containers[self.id] = self
+        self.client.deferred_element_ids.update(element.id for element in self._collect_descendants())
+
+    def _show_content(self) -> None:
+        """Send the descendants of this element to the browser if they have been deferred."""
+        if self.client.deferred_containers.pop(self.id, None) is None:
+            return
+        if self.id not in self.client.deferred_element_ids:
+            self._send_deferred(self._collect_shown_descendants())
+        self.update()
+
+    def _is_deferring(self) -> bool:
+        """Whether new children of this element are deferred (see `_defer_content`)."""
+        return self.id in self.client.deferred_containers or self.id in self.client.deferred_element_ids
+
+    def _collect_shown_descendants(self) -> List[Element]:
+        """Collect all descendants which are not within another deferring container."""
+        elements: List[Element] = []
+        for child in self:
+            elements.append(child)
+            if child.id not in self.client.deferred_containers:
+                elements.extend(child._collect_shown_descendants())  # pylint: disable=protected-access
+        return elements
+
+    def _send_deferred(self, elements: List[Element]) -> None:
+        """Send deferred elements to the browser, followed by the method calls which have been held back."""
+        for element in elements:
+            self.client.deferred_element_ids.discard(element.id)
+            self.client.outbox.enqueue_update(element)
+        for element in elements:
+            for name, args in self.client.deferred_method_calls.pop(element.id, []):
+                element.run_method(name, *args)
+
+    def add_children(self, factory: Callable[[Any], Element], items: Iterable[Any], *,
+                     slot: str = 'default') -> List[Element]:
+        """Create many child elements at once.
+
+        This is faster than creating the elements one by one in a loop,
+        because the slot is entered only once and the outbox is woken up only once for all new elements.
+        The parent element is updated once together with its new children.
+
+        :param factory: function that creates a child element from an item (e.g. `ui.label`)
+        :param items: items to create the child elements from
+        :param slot: name of the slot to add the children to (default: "default")
+        :return: list of the created child elements
+        """
+        with self.slots[slot], self.client.outbox.bulk():
+            return [factory(item) for item in items]
+
     def _collect_descendants(self, *, include_self: bool = False) -> List[Element]:
         elements: List[Element] = [self] if include_self else []
         for child in self:
@@ -503,6 +660,11 @@ class Element(Visibility):
         target_container.default_slot.children.insert(target_index, self)
         self.parent_slot = target_container.default_slot
         target_container.update()
+        if self.client.deferred_containers:
+            if target_container._is_deferring():  # pylint: disable=protected-access
+                self.client.deferred_element_ids.update(e.id for e in self._collect_descendants(include_self=True))
+            elif self.id in self.client.deferred_element_ids:
+                self._send_deferred([self, *self._collect_shown_descendants()])
 
     def remove(self, element: Union[Element, int]) -> None:
         """Remove a child element.
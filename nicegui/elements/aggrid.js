@@ -1,8 +1,11 @@
+import { decodeRows, isEncodedColumns } from "../../static/utils/columnar.js";
 import { convertDynamicProperties } from "../../static/utils/dynamic_properties.js";
 
 export default {
   template: "<div></div>",
   mounted() {
+    this.pending_requests = {};
+    this.last_request_id = 0;
     this.update_grid();
   },
   methods: {
@@ -12,6 +15,17 @@ export default {
         ...this.options,
         onGridReady: this.auto_size_columns ? (params) => params.api.sizeColumnsToFit() : undefined,
       };
+      if (isEncodedColumns(this.gridOptions.rowData)) {
+        this.gridOptions.rowData = decodeRows(this.gridOptions.rowData);
+      }
+      if (this.row_id_field) {
+        this.gridOptions.getRowId = (params) => String(params.data[this.row_id_field]);
+      }
+      if (this.has_datasource) {
+        this.gridOptions.rowModelType = "infinite";
+        this.gridOptions.datasource = { getRows: (params) => this.request_rows(params) };
+      }
+      this.applied_revision = this.revision;
       for (const column of this.html_columns) {
         if (this.gridOptions.columnDefs[column].cellRenderer === undefined) {
           this.gridOptions.columnDefs[column].cellRenderer = (params) => (params.value ? params.value : "");
@@ -47,6 +61,29 @@ export default {
       this.grid = new agGrid.Grid(this.$el, this.gridOptions);
       this.gridOptions.api.addGlobalListener(this.handle_event);
     },
+    request_rows(params) {
+      const request_id = ++this.last_request_id;
+      this.pending_requests[request_id] = params;
+      this.$emit("rows_request", {
+        request_id: request_id,
+        start: params.startRow,
+        stop: params.endRow,
+        sort_model: params.sortModel,
+        filter_model: params.filterModel,
+      });
+    },
+    resolve_rows(request_id, rows, row_count) {
+      const params = this.pending_requests[request_id];
+      if (!params) return;
+      delete this.pending_requests[request_id];
+      if (rows === null) params.failCallback();
+      else params.successCallback(rows, row_count ?? -1);
+    },
+    apply_transaction(revision, transaction) {
+      if (revision <= this.applied_revision) return;
+      this.applied_revision = revision;
+      this.gridOptions.api.applyTransaction(transaction);
+    },
     run_grid_method(name, ...args) {
       return this.gridOptions.api[name](...args);
     },
@@ -95,5 +132,8 @@ export default {
     options: Object,
     html_columns: Array,
     auto_size_columns: Boolean,
+    row_id_field: String,
+    has_datasource: Boolean,
+    revision: Number,
   },
 };
@@ -1,10 +1,15 @@
-from typing import Dict, List, Optional, cast
+import functools
+import operator
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union, cast
 
 from typing_extensions import Self
 
-from .. import optional_features
+from .. import background_tasks, columnar, optional_features
 from ..awaitable_response import AwaitableResponse
+from ..dataclasses import KWONLY_SLOTS
 from ..element import Element
+from ..events import GenericEventArguments
 
 try:
     import pandas as pd
@@ -14,6 +19,31 @@ except ImportError:
     pass
 
 
+@dataclass(**KWONLY_SLOTS)
+class AgGridRequest:
+    """Request for a block of rows of the infinite row model.
+
+    Attributes:
+        - start (int): Index of the first requested row.
+        - stop (int): Index after the last requested row.
+        - sort_model (List[Dict]): AG Grid sort model, e.g. `[{'colId': 'age', 'sort': 'desc'}]`.
+        - filter_model (Dict): AG Grid filter model by column ID.
+    """
+
+    start: int
+    stop: int
+    sort_model: List[Dict]
+    filter_model: Dict
+
+
+AgGridDatasource = Callable[
+    [AgGridRequest],
+    Union[
+        Tuple[List[Dict], Optional[int]], Awaitable[Tuple[List[Dict], Optional[int]]]
+    ],
+]
+
+
 class AgGrid(
     Element, component="aggrid.js", libraries=["lib/aggrid/ag-grid-community.min.js"]
 ):
@@ -30,6 +60,8 @@ class AgGrid(
         - html_columns (List[int], optional): List of columns that should be rendered as HTML. Defaults to [].
         - theme (str, optional): AG Grid theme. Defaults to 'balham'.
         - auto_size_columns (bool, optional): Whether to automatically resize columns to fit the grid width. Defaults to True.
+        - row_id_field (str, optional): Name of the field containing unique row IDs. Required for `apply_transaction`.
+        - datasource (Callable, optional): Function returning a block of rows for the infinite row model.
 
     Attributes:
         - options (Dict): The options dictionary.
@@ -56,6 +88,12 @@ class AgGrid(
         - get_selected_row(self) -> Optional[Dict]:
             Get the single currently selected row.
 
+        - apply_transaction(self, add=(), update=(), remove=()) -> None:
+            Add, update and remove rows without re-sending the whole grid.
+
+        - refresh_datasource(self) -> None:
+            Request all rows from the datasource again.
+
         - get_client_data(self, timeout=1, check_interval=0.01) -> List[Dict]:
             Get the data from the client including any edits made by the client.
 
@@ -70,6 +108,8 @@ class AgGrid(
         html_columns: List[int] = [],
         theme: str = "balham",
         auto_size_columns: bool = True,
+        row_id_field: Optional[str] = None,
+        datasource: Optional[AgGridDatasource] = None,
     ) -> None:
         """AG Grid
 
@@ -77,17 +117,30 @@ class AgGrid(
 
         The methods `run_grid_method` and `run_column_method` can be used to interact with the AG Grid instance on the client.
 
+        With a `datasource` the grid uses AG Grid's infinite row model:
+        Whenever the grid needs a block of rows, the datasource is called with an `AgGridRequest`
+        and returns the rows of the block together with the total number of rows (or `None` if unknown).
+        The datasource can also be an async function.
+
         Args:
 
             - options (Dict): Dictionary of AG Grid options.
             - html_columns (List[int], optional): List of columns that should be rendered as HTML. Defaults to [].
             - theme (str, optional): AG Grid theme. Defaults to 'balham'.
             - auto_size_columns (bool, optional): Whether to automatically resize columns to fit the grid width. Defaults to True.
+            - row_id_field (str, optional): Name of the field containing unique row IDs. Required for `apply_transaction`.
+            - datasource (Callable, optional): Function returning a block of rows for the infinite row model.
         """
         super().__init__()
         self._props["options"] = options
         self._props["html_columns"] = html_columns
         self._props["auto_size_columns"] = auto_size_columns
+        self._props["row_id_field"] = row_id_field
+        self._props["has_datasource"] = datasource is not None
+        self._props["revision"] = 0
+        self._datasource = datasource
+        if datasource is not None:
+            self.on("rows_request", self._handle_rows_request)
         self._classes.append("nicegui-aggrid")
         self._classes.append(f"ag-theme-{theme}")
 
@@ -99,6 +152,7 @@ class AgGrid(
         theme: str = "balham",
         auto_size_columns: bool = True,
         options: Dict = {},
+        server_side: bool = False,
     ) -> Self:
         """Create an AG Grid from a Pandas DataFrame.
 
@@ -114,26 +168,12 @@ class AgGrid(
             - theme (str, optional): AG Grid theme. Defaults to 'balham'.
             - auto_size_columns (bool, optional): Whether to automatically resize columns to fit the grid width. Defaults to True.
             - options (Dict, optional): Dictionary of additional AG Grid options.
+            - server_side (bool, optional): Whether to keep the DataFrame on the server and only send the requested rows.
+              Sorting and filtering (text, number, date and set filters) are done on the server. Defaults to False.
 
         Returns:
             - AgGrid: AG Grid element.
         """
-        date_cols = df.columns[df.dtypes == "datetime64[ns]"]
-        time_cols = df.columns[df.dtypes == "timedelta64[ns]"]
-        complex_cols = df.columns[df.dtypes == "complex128"]
-        period_cols = df.columns[df.dtypes == "period[M]"]
-        if (
-            len(date_cols) != 0
-            or len(time_cols) != 0
-            or len(complex_cols) != 0
-            or len(period_cols) != 0
-        ):
-            df = df.copy()
-            df[date_cols] = df[date_cols].astype(str)
-            df[time_cols] = df[time_cols].astype(str)
-            df[complex_cols] = df[complex_cols].astype(str)
-            df[period_cols] = df[period_cols].astype(str)
-
         if isinstance(df.columns, pd.MultiIndex):
             raise ValueError(
                 "MultiIndex columns are not supported. "
@@ -141,10 +181,22 @@ class AgGrid(
                 '`df.columns = ["_".join(col) for col in df.columns.values]`.'
             )
 
+        if server_side:
+            return cls(
+                {
+                    "columnDefs": [{"field": str(col)} for col in df.columns],
+                    "suppressDotNotation": True,
+                    **options,
+                },
+                theme=theme,
+                auto_size_columns=auto_size_columns,
+                datasource=lambda request: _slice_dataframe(df, request),
+            )
+
         return cls(
             {
                 "columnDefs": [{"field": str(col)} for col in df.columns],
-                "rowData": df.to_dict("records"),
+                "rowData": columnar.encode_dataframe(columnar.to_serializable(df)),
                 "suppressDotNotation": True,
                 **options,
             },
@@ -171,7 +223,11 @@ class AgGrid(
             You can set various configuration options such as column definitions, sorting, filtering, pagination, etc.
             For more details, refer to the AgGrid documentation: [AgGrid Options](https://www.ag-grid.com/javascript-grid-properties/).
         """
-        return self._props["options"]
+        options = self._props["options"]
+        if columnar.is_encoded(options.get("rowData")):
+            # NOTE: rows of a DataFrame are sent in columnar format and only decoded when accessed
+            options["rowData"] = columnar.decode_rows(options["rowData"])
+        return options
 
     def update(self) -> None:
         """
@@ -192,6 +248,98 @@ class AgGrid(
         super().update()
         self.run_method("update_grid")
 
+    def apply_transaction(
+        self,
+        *,
+        add: List[Dict] = [],
+        update: List[Dict] = [],
+        remove: List[Dict] = [],
+    ) -> None:
+        """Add, update and remove rows without re-sending the whole grid.
+
+        The changes are applied to `options['rowData']` and sent to the client as an AG Grid transaction,
+        so the traffic only depends on the number of changed rows.
+        Rows are identified by the `row_id_field` passed to the constructor.
+
+        See [AG Grid Transactions](https://www.ag-grid.com/javascript-data-grid/data-update-transactions/) for more information.
+
+        Args:
+            - add (List[Dict], optional): Rows to append.
+            - update (List[Dict], optional): Rows to replace, matched by their row ID.
+            - remove (List[Dict], optional): Rows to remove, only the row ID field is needed.
+        """
+        row_id_field = self._props["row_id_field"]
+        if row_id_field is None:
+            raise ValueError(
+                "Transactions require the `row_id_field` of the grid to be set."
+            )
+        row_data: List[Dict] = self.options.setdefault("rowData", [])
+        removed_ids = {row[row_id_field] for row in remove}
+        updated_rows = {row[row_id_field]: row for row in update}
+        if removed_ids or updated_rows:
+            row_data[:] = [
+                updated_rows.get(row[row_id_field], row)
+                for row in row_data
+                if row[row_id_field] not in removed_ids
+            ]
+        row_data.extend(add)
+        self._props["revision"] += 1
+        # NOTE: the row data in the element store is kept in sync, so the transaction survives a remount of the grid
+        self.client.outbox.enqueue_message(
+            "row_delta",
+            {
+                "id": self.id,
+                "path": ["options", "rowData"],
+                "key": row_id_field,
+                "revision": self._props["revision"],
+                "added": add,
+                "updated": update,
+                "removed_keys": list(removed_ids),
+            },
+            self.client.id,
+        )
+        self.run_method(
+            "apply_transaction",
+            self._props["revision"],
+            {
+                "add": add,
+                "update": update,
+                "remove": [{row_id_field: row[row_id_field]} for row in remove],
+            },
+        )
+
+    def refresh_datasource(self) -> None:
+        """Request all rows from the datasource again, e.g. after the underlying data has changed."""
+        self.run_grid_method("refreshInfiniteCache")
+
+    def _handle_rows_request(self, e: GenericEventArguments) -> None:
+        assert self._datasource is not None
+        request_id = e.args["request_id"]
+        request = AgGridRequest(
+            start=e.args["start"],
+            stop=e.args["stop"],
+            sort_model=e.args.get("sort_model") or [],
+            filter_model=e.args.get("filter_model") or {},
+        )
+        try:
+            result = self._datasource(request)
+        except Exception:
+            self.run_method("resolve_rows", request_id, None)
+            raise
+        if isinstance(result, Awaitable):
+
+            async def wait_for_result() -> None:
+                try:
+                    rows, row_count = await result
+                except Exception:
+                    self.run_method("resolve_rows", request_id, None)
+                    raise
+                self.run_method("resolve_rows", request_id, rows, row_count)
+
+            background_tasks.create(wait_for_result(), name="aggrid datasource")
+        else:
+            self.run_method("resolve_rows", request_id, *result)
+
     def call_api_method(
         self, name: str, *args, timeout: float = 1, check_interval: float = 0.01
     ) -> AwaitableResponse:
@@ -543,3 +691,77 @@ class AgGrid(
         client_row_data = await self.get_client_data()
         self.options["rowData"] = client_row_data
         self.update()
+
+
+def _slice_dataframe(
+    df: "pd.DataFrame", request: AgGridRequest
+) -> Tuple[List[Dict], int]:
+    for col_id, model in request.filter_model.items():
+        df = df[_filter_mask(df[_find_column(df, col_id)], model)]
+    if request.sort_model:
+        df = df.sort_values(
+            [_find_column(df, sort["colId"]) for sort in request.sort_model],
+            ascending=[sort["sort"] == "asc" for sort in request.sort_model],
+        )
+    rows = columnar.to_serializable(df.iloc[request.start : request.stop])
+    return rows.to_dict("records"), len(df)
+
+
+def _find_column(df: "pd.DataFrame", col_id: str) -> Any:
+    return df.columns[df.columns.astype(str) == col_id][0]
+
+
+def _filter_mask(column: "pd.Series", model: Dict) -> "pd.Series":
+    """Evaluate an AG Grid text, number, date or set filter model on a DataFrame column."""
+    if "conditions" in model or "condition1" in model:
+        # NOTE: AG Grid < 29 sends two conditions instead of a list
+        conditions = model.get("conditions") or [model[f"condition{i}"] for i in (1, 2)]
+        combine = operator.and_ if model["operator"] == "AND" else operator.or_
+        return functools.reduce(combine, [_filter_mask(column, c) for c in conditions])
+
+    filter_type = model.get("filterType")
+    type_ = model.get("type")
+    if filter_type == "set":
+        return column.astype(str).isin([str(value) for value in model["values"]])
+    if type_ in ("blank", "notBlank"):
+        blank = column.isna() | (column.astype(str) == "")
+        return blank if type_ == "blank" else ~blank
+    if filter_type == "text":
+        values = column.astype(str).str.lower()
+        text = str(model.get("filter", "")).lower()
+        if type_ == "contains":
+            return values.str.contains(text, regex=False)
+        if type_ == "notContains":
+            return ~values.str.contains(text, regex=False)
+        if type_ == "equals":
+            return values == text
+        if type_ == "notEqual":
+            return values != text
+        if type_ == "startsWith":
+            return values.str.startswith(text)
+        if type_ == "endsWith":
+            return values.str.endswith(text)
+    if filter_type in ("number", "date"):
+        if filter_type == "date":
+            values = pd.to_datetime(column)
+            value, value_to = (
+                pd.Timestamp(model["dateFrom"]),
+                pd.Timestamp(model["dateTo"]) if model.get("dateTo") else None,
+            )
+        else:
+            values, value, value_to = column, model["filter"], model.get("filterTo")
+        if type_ == "equals":
+            return values == value
+        if type_ == "notEqual":
+            return values != value
+        if type_ == "lessThan":
+            return values < value
+        if type_ == "lessThanOrEqual":
+            return values <= value
+        if type_ == "greaterThan":
+            return values > value
+        if type_ == "greaterThanOrEqual":
+            return values >= value
+        if type_ == "inRange":
+            return (values > value) & (values < value_to)
+    raise ValueError(f"Unsupported filter model: {model}")
@@ -5,7 +5,7 @@ from .mixins.value_element import ValueElement
 
 
 class Dialog(ValueElement):
-    def __init__(self, *, value: bool = False) -> None:
+    def __init__(self, *, value: bool = False, lazy: bool = False) -> None:
         """Dialog
 
         Creates a dialog based on Quasar's [QDialog ](https://quasar.dev/vue-components/dialog) component.
@@ -13,8 +13,11 @@ class Dialog(ValueElement):
         To make it persistent, set `.props('persistent')` on the dialog element.
 
         - value: whether the dialog should be opened on creation (default: `False`)
+        - lazy: whether to send the content to the browser only when the dialog is opened for the first time (default: `False`)
         """
         super().__init__(tag="q-dialog", value=value, on_value_change=None)
+        if lazy and not value:
+            self._defer_content()
         self._result: Any = None
         self._submitted: Optional[asyncio.Event] = None
 
@@ -49,6 +52,8 @@ class Dialog(ValueElement):
 
     def _handle_value_change(self, value: Any) -> None:
         super()._handle_value_change(value)
+        if self.value:
+            self._show_content()
         if not self.value:
             self._result = None
             self.submitted.set()
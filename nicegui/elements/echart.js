@@ -1,3 +1,4 @@
+import { decodeArrays } from "../../static/utils/columnar.js";
 import { convertDynamicProperties } from "../../static/utils/dynamic_properties.js";
 
 export default {
@@ -16,8 +17,9 @@ export default {
   },
   methods: {
     update_chart() {
-      convertDynamicProperties(this.options, true);
-      this.chart.setOption(this.options, { notMerge: this.chart.options?.series.length != this.options.series.length });
+      const options = decodeArrays(this.options);
+      convertDynamicProperties(options, true);
+      this.chart.setOption(options, { notMerge: this.chart.options?.series.length != options.series.length });
     },
     run_chart_method(name, ...args) {
       if (name.startsWith(":")) {
@@ -1,8 +1,8 @@
-from typing import Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from typing_extensions import Self
 
-from .. import optional_features
+from .. import columnar, optional_features
 from ..awaitable_response import AwaitableResponse
 from ..element import Element
 from ..events import EChartPointClickEventArguments, GenericEventArguments, handle_event
@@ -181,6 +181,15 @@ class EChart(Element, component="echart.js", libraries=["lib/echarts/echarts.min
         """
         return self._props["options"]
 
+    def _to_dict(self) -> Dict[str, Any]:
+        data = super()._to_dict()
+        # NOTE: numeric NumPy arrays are sent as binary buffers which are decoded by echart.js
+        data["props"] = {
+            **data["props"],
+            "options": columnar.encode_arrays(self._props["options"]),
+        }
+        return data
+
     def update(self) -> None:
         """
         Update the EChart element.
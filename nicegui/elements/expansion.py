@@ -17,6 +17,7 @@ class Expansion(TextElement, ValueElement, DisableableElement):
         - group (str, optional): The optional group name for coordinated open/close state within the group, also known as "accordion mode". Defaults to None.
         - value (bool, optional): Whether the expansion should be opened on creation. Defaults to False.
         - on_value_change (callable, optional): The callback to execute when the value changes. Defaults to None.
+        - lazy (bool, optional): Whether to send the content to the browser only when the expansion is opened for the first time. Defaults to False.
 
     Attributes:
         - tag (str): The HTML tag for the expansion item.
@@ -49,6 +50,7 @@ class Expansion(TextElement, ValueElement, DisableableElement):
         group: Optional[str] = None,
         value: bool = False,
         on_value_change: Optional[Callable[..., Any]] = None,
+        lazy: bool = False,
     ) -> None:
         """Expansion
 
@@ -62,6 +64,7 @@ class Expansion(TextElement, ValueElement, DisableableElement):
             - group (str, optional): The optional group name for coordinated open/close state within the group, also known as "accordion mode". Defaults to None.
             - value (bool, optional): Whether the expansion should be opened on creation. Defaults to False.
             - on_value_change (callable, optional): The callback to execute when the value changes. Defaults to None.
+            - lazy (bool, optional): Whether to send the content to the browser only when the expansion is opened for the first time. Defaults to False.
         """
         super().__init__(
             tag="q-expansion-item",
@@ -75,6 +78,8 @@ class Expansion(TextElement, ValueElement, DisableableElement):
             self._props["group"] = group
         self._props["icon"] = icon
         self._classes.append("nicegui-expansion")
+        if lazy and not value:
+            self._defer_content()
 
     def open(self) -> None:
         """
@@ -105,6 +110,11 @@ class Expansion(TextElement, ValueElement, DisableableElement):
         """
         self.value = False
 
+    def _handle_value_change(self, value: Any) -> None:
+        super()._handle_value_change(value)
+        if value:
+            self._show_content()
+
     def _text_to_model_text(self, text: str) -> None:
         """
         Converts the given text to the model text.
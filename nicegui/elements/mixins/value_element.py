@@ -242,13 +242,13 @@ class ValueElement(Element):
             - This method is called internally and should not be called directly.
             - The `_handle_value_change` method is responsible for updating the element's properties and triggering the change handler when the value of the element changes.
             - It sets the new value in the `_props` dictionary using the `VALUE_PROP` key.
-            - If `_send_update_on_value_change` is True, it calls the `update` method to update the element's appearance.
+            - If `_send_update_on_value_change` is True, it sends the changed value prop to the client.
             - It creates a `ValueChangeEventArguments` object with the sender, client, and event value.
             - It calls the `handle_event` function with the change handler and the event arguments.
         """
         self._props[self.VALUE_PROP] = self._value_to_model_value(value)
         if self._send_update_on_value_change:
-            self.update()
+            self._update_patch("props", [self.VALUE_PROP])
         args = ValueChangeEventArguments(
             sender=self, client=self.client, value=self._value_to_event_value(value)
         )
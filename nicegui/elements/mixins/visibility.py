@@ -293,7 +293,7 @@ class Visibility:
 
         Notes:
             This method is responsible for handling the visibility change of an element.
-            It updates the element's classes based on the visibility value and triggers an update.
+            It updates the element's classes based on the visibility value and sends them to the client.
 
             If the element is set to be visible and the 'hidden' class is present in its classes,
             the 'hidden' class will be removed and the element will be updated.
@@ -315,7 +315,7 @@ class Visibility:
         classes = element._classes  # pylint: disable=protected-access, no-member
         if visible and "hidden" in classes:
             classes.remove("hidden")
-            element.update()  # pylint: disable=no-member
+            element._update_patch("class")  # pylint: disable=protected-access, no-member
         if not visible and "hidden" not in classes:
             classes.append("hidden")
-            element.update()  # pylint: disable=no-member
+            element._update_patch("class")  # pylint: disable=protected-access, no-member
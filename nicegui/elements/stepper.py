@@ -42,6 +42,8 @@ class Stepper(ValueElement):
         for i, step in enumerate(self):
             done = i < names.index(value) if value in names else False
             step.props(f":done={done}")
+            if step._props["name"] == value:  # pylint: disable=protected-access
+                step._show_content()  # pylint: disable=protected-access
 
     def next(self) -> None:
         """Show the next step."""
@@ -54,7 +56,12 @@ class Stepper(ValueElement):
 
 class Step(DisableableElement):
     def __init__(
-        self, name: str, title: Optional[str] = None, icon: Optional[str] = None
+        self,
+        name: str,
+        title: Optional[str] = None,
+        icon: Optional[str] = None,
+        *,
+        lazy: bool = False,
     ) -> None:
         """Step
 
@@ -64,6 +71,7 @@ class Step(DisableableElement):
         - name: name of the step (will be the value of the `ui.stepper` element)
         - title: title of the step (default: `None`, meaning the same as `name`)
         - icon: icon of the step (default: `None`)
+        - lazy: whether to send the content to the browser only when the step is selected for the first time (default: `False`)
         """
         super().__init__(tag="q-step")
         self._props["name"] = name
@@ -74,6 +82,8 @@ class Step(DisableableElement):
         self.stepper = cast(ValueElement, context.get_slot().parent)
         if self.stepper.value is None:
             self.stepper.value = name
+        if lazy and self.stepper._props["model-value"] != name:  # pylint: disable=protected-access
+            self._defer_content()
 
 
 class StepperNavigation(Element):
@@ -1,3 +1,4 @@
+import { decodeRows, isEncodedColumns } from "../../static/utils/columnar.js";
 import { convertDynamicProperties } from "../../static/utils/dynamic_properties.js";
 
 export default {
@@ -6,6 +7,7 @@ export default {
       ref="qRef"
       v-bind="$attrs"
       :columns="convertedColumns"
+      :rows="decoded_rows"
     >
       <template v-for="(_, slot) in $slots" v-slot:[slot]="slotProps">
         <slot :name="slot" v-bind="slotProps || {}" />
@@ -14,8 +16,14 @@ export default {
   `,
   props: {
     columns: Array,
+    rows: [Array, Object],
+    revision: Number,
   },
   computed: {
+    decoded_rows() {
+      // NOTE: row deltas are applied to the rows in the element store (see the "row_delta" message in index.html)
+      return isEncodedColumns(this.rows) ? decodeRows(this.rows) : this.rows;
+    },
     convertedColumns() {
       this.columns.forEach((column) => convertDynamicProperties(column, false));
       return this.columns;
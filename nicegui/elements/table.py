@@ -1,8 +1,21 @@
-from typing import Any, Callable, Dict, List, Literal, Optional, Union
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from typing_extensions import Self
 
-from .. import optional_features
+from .. import background_tasks, columnar, optional_features
+from ..dataclasses import KWONLY_SLOTS
 from ..element import Element
 from ..events import (
     GenericEventArguments,
@@ -20,6 +33,30 @@ except ImportError:
     pass
 
 
+@dataclass(**KWONLY_SLOTS)
+class TableRequest:
+    """Request for a slice of rows in server-side mode.
+
+    - start: index of the first requested row
+    - stop: index after the last requested row (`None` means all remaining rows)
+    - sort_by: name of the column to sort by (`None` means unsorted)
+    - descending: whether to sort in descending order
+    - filter: filter string of the table (`None` or empty means unfiltered)
+    """
+
+    start: int
+    stop: Optional[int]
+    sort_by: Optional[str]
+    descending: bool
+    filter: Optional[str]
+
+
+TableDataSource = Callable[
+    [TableRequest],
+    Union[Tuple[List[Dict], int], Awaitable[Tuple[List[Dict], int]]],
+]
+
+
 class Table(FilterElement, component="table.js"):
     def __init__(
         self,
@@ -31,6 +68,7 @@ class Table(FilterElement, component="table.js"):
         pagination: Optional[Union[int, dict]] = None,
         on_select: Optional[Callable[..., Any]] = None,
         on_pagination_change: Optional[Callable[..., Any]] = None,
+        data_source: Optional[TableDataSource] = None,
     ) -> None:
         """Table
 
@@ -44,8 +82,12 @@ class Table(FilterElement, component="table.js"):
         - pagination: a dictionary correlating to a pagination object or number of rows per page (`None` hides the pagination, 0 means "infinite"; default: `None`).
         - on_select: callback which is invoked when the selection changes
         - on_pagination_change: callback which is invoked when the pagination changes
+        - data_source: function returning the rows of the requested page and the total number of rows (enables server-side mode)
 
         If selection is 'single' or 'multiple', then a `selected` property is accessible containing the selected rows.
+
+        In server-side mode the table only holds the rows of the current page.
+        Paging, sorting and filtering are done by the data source, which is called with a `TableRequest` and may also be async.
         """
         super().__init__()
 
@@ -62,6 +104,7 @@ class Table(FilterElement, component="table.js"):
         self._props["selection"] = selection or "none"
         self._props["selected"] = []
         self._props["fullscreen"] = False
+        self._props["revision"] = 0
 
         def handle_selection(e: GenericEventArguments) -> None:
             if e.args["added"]:
@@ -72,7 +115,7 @@ class Table(FilterElement, component="table.js"):
                 self.selected = [
                     row for row in self.selected if row[row_key] not in e.args["keys"]
                 ]
-            self.update()
+            self._update_patch("props", ["selected"])
             arguments = TableSelectionEventArguments(
                 sender=self, client=self.client, selection=self.selected
             )
@@ -82,7 +125,6 @@ class Table(FilterElement, component="table.js"):
 
         def handle_pagination_change(e: GenericEventArguments) -> None:
             self.pagination = e.args
-            self.update()
             arguments = ValueChangeEventArguments(
                 sender=self, client=self.client, value=self.pagination
             )
@@ -90,6 +132,14 @@ class Table(FilterElement, component="table.js"):
 
         self.on("update:pagination", handle_pagination_change)
 
+        self._data_source = data_source
+        if data_source is not None:
+            self._props["pagination"].setdefault("rowsNumber", 0)
+            self.on(
+                "request", lambda e: self._request(e.args["pagination"]), ["pagination"]
+            )
+            self._request(self.pagination)
+
     @classmethod
     def from_pandas(
         cls,
@@ -99,6 +149,7 @@ class Table(FilterElement, component="table.js"):
         selection: Optional[Literal["single", "multiple"]] = None,
         pagination: Optional[Union[int, dict]] = None,
         on_select: Optional[Callable[..., Any]] = None,
+        server_side: bool = False,
     ) -> Self:
         """Create a table from a Pandas DataFrame.
 
@@ -114,24 +165,9 @@ class Table(FilterElement, component="table.js"):
         - selection: selection type ("single" or "multiple"; default: `None`)
         - pagination: a dictionary correlating to a pagination object or number of rows per page (`None` hides the pagination, 0 means "infinite"; default: `None`).
         - on_select: callback which is invoked when the selection changes
+        - server_side: whether to keep the DataFrame on the server and only send the visible rows (default: `False`)
         :return: table element
         """
-        date_cols = df.columns[df.dtypes == "datetime64[ns]"]
-        time_cols = df.columns[df.dtypes == "timedelta64[ns]"]
-        complex_cols = df.columns[df.dtypes == "complex128"]
-        period_cols = df.columns[df.dtypes == "period[M]"]
-        if (
-            len(date_cols) != 0
-            or len(time_cols) != 0
-            or len(complex_cols) != 0
-            or len(period_cols) != 0
-        ):
-            df = df.copy()
-            df[date_cols] = df[date_cols].astype(str)
-            df[time_cols] = df[time_cols].astype(str)
-            df[complex_cols] = df[complex_cols].astype(str)
-            df[period_cols] = df[period_cols].astype(str)
-
         if isinstance(df.columns, pd.MultiIndex):
             raise ValueError(
                 "MultiIndex columns are not supported. "
@@ -139,23 +175,36 @@ class Table(FilterElement, component="table.js"):
                 '`df.columns = ["_".join(col) for col in df.columns.values]`.'
             )
 
-        return cls(
+        table = cls(
             columns=[{"name": col, "label": col, "field": col} for col in df.columns],
-            rows=df.to_dict("records"),
+            rows=[],
             row_key=row_key,
             title=title,
             selection=selection,
             pagination=pagination,
             on_select=on_select,
+            data_source=(
+                (lambda request: _slice_dataframe(df, request)) if server_side else None
+            ),
         )
+        if not server_side:
+            table._props["rows"] = columnar.encode_dataframe(
+                columnar.to_serializable(df)
+            )
+        return table
 
     @property
     def rows(self) -> List[Dict]:
         """List of rows."""
+        if columnar.is_encoded(self._props["rows"]):
+            # NOTE: rows of a DataFrame are sent in columnar format and only decoded when accessed
+            self._props["rows"] = columnar.decode_rows(self._props["rows"])
         return self._props["rows"]
 
     @rows.setter
     def rows(self, value: List[Dict]) -> None:
+        if columnar.is_encoded(self._props["rows"]):
+            self._props["rows"] = []
         self._props["rows"][:] = value
         self.update()
 
@@ -187,7 +236,7 @@ class Table(FilterElement, component="table.js"):
     @selected.setter
     def selected(self, value: List[Dict]) -> None:
         self._props["selected"][:] = value
-        self.update()
+        self._update_patch("props", ["selected"])
 
     @property
     def pagination(self) -> dict:
@@ -197,7 +246,7 @@ class Table(FilterElement, component="table.js"):
     @pagination.setter
     def pagination(self, value: dict) -> None:
         self._props["pagination"] = value
-        self.update()
+        self._update_patch("props", ["pagination"])
 
     @property
     def is_fullscreen(self) -> bool:
@@ -219,30 +268,134 @@ class Table(FilterElement, component="table.js"):
         self.is_fullscreen = not self.is_fullscreen
 
     def add_rows(self, *rows: Dict) -> None:
-        """Add rows to the table."""
+        """Add rows to the table.
+
+        Only the new rows are sent to the client.
+        """
         self.rows.extend(rows)
-        self.update()
+        self._send_row_delta(added=rows)
 
     def remove_rows(self, *rows: Dict) -> None:
-        """Remove rows from the table."""
-        keys = [row[self.row_key] for row in rows]
+        """Remove rows from the table.
+
+        Only the keys of the removed rows are sent to the client.
+        """
+        keys = {row[self.row_key] for row in rows}
         self.rows[:] = [row for row in self.rows if row[self.row_key] not in keys]
-        self.selected[:] = [
-            row for row in self.selected if row[self.row_key] not in keys
-        ]
-        self.update()
+        selected = [row for row in self.selected if row[self.row_key] not in keys]
+        if len(selected) != len(self.selected):
+            self._props["selected"][:] = selected
+            self._update_patch("props", ["selected"])
+        self._send_row_delta(removed_keys=keys)
 
     def update_rows(self, rows: List[Dict], *, clear_selection: bool = True) -> None:
         """Update rows in the table.
 
+        The rows are matched by their row key, so only inserted, changed and removed rows are sent to the client.
+        If the order of the remaining rows changes, the whole table is updated.
+
         - rows: list of rows to update
         - clear_selection: whether to clear the selection (default: True)
         """
-        self.rows[:] = rows
-        if clear_selection:
-            self.selected.clear()
+        key = self.row_key
+        old_rows = {row[key]: row for row in self.rows}
+        new_keys = [row[key] for row in rows]
+        new_key_set = set(new_keys)
+        removed_keys = [k for k in old_rows if k not in new_key_set]
+        added = [row for row in rows if row[key] not in old_rows]
+        # NOTE: rows which are identical objects may have been modified in place, so they are sent again
+        updated = [
+            row
+            for row in rows
+            if row[key] in old_rows
+            and (old_rows[row[key]] is row or old_rows[row[key]] != row)
+        ]
+        is_delta_possible = (
+            len(old_rows) == len(self.rows)
+            and len(new_key_set) == len(rows)
+            and new_keys
+            == [k for k in old_rows if k in new_key_set] + [row[key] for row in added]
+        )
+        self._props["rows"][:] = rows
+        if clear_selection and self.selected:
+            self._props["selected"].clear()
+            self._update_patch("props", ["selected"])
+        if is_delta_possible:
+            self._send_row_delta(
+                added=added, updated=updated, removed_keys=removed_keys
+            )
+        else:
+            self.update()
+
+    def _send_row_delta(
+        self,
+        *,
+        added: Iterable[Dict] = (),
+        updated: Iterable[Dict] = (),
+        removed_keys: Iterable[Any] = (),
+    ) -> None:
+        """Send inserted, changed and removed rows to the client instead of all rows.
+
+        The delta is applied to the element store of the client, so it also reaches tables which are not mounted,
+        e.g. inside a closed dialog.
+        The revision counter makes the client ignore deltas which are already contained in a full update of the table.
+        """
+        added, updated, removed_keys = list(added), list(updated), list(removed_keys)
+        if not added and not updated and not removed_keys:
+            return
+        self._props["revision"] += 1
+        self.client.outbox.enqueue_message(
+            "row_delta",
+            {
+                "id": self.id,
+                "path": ["rows"],
+                "key": self.row_key,
+                "revision": self._props["revision"],
+                "added": added,
+                "updated": updated,
+                "removed_keys": removed_keys,
+            },
+            self.client.id,
+        )
+
+    def reload(self) -> None:
+        """Request the current page from the data source again (only in server-side mode)."""
+        self._request(self.pagination)
+
+    def _request(self, pagination: Dict) -> None:
+        if self._data_source is None:
+            return
+        rows_per_page = pagination.get("rowsPerPage") or 0
+        start = (pagination.get("page", 1) - 1) * rows_per_page
+        request = TableRequest(
+            start=start,
+            stop=start + rows_per_page if rows_per_page else None,
+            sort_by=pagination.get("sortBy"),
+            descending=bool(pagination.get("descending")),
+            filter=self.filter,
+        )
+        result = self._data_source(request)
+        if isinstance(result, Awaitable):
+
+            async def wait_for_result() -> None:
+                self._show_page(pagination, *await result)
+
+            background_tasks.create(wait_for_result(), name="table data source")
+        else:
+            self._show_page(pagination, *result)
+
+    def _show_page(self, pagination: Dict, rows: List[Dict], total: int) -> None:
+        self._props["rows"] = rows
+        self._props["pagination"] = {**pagination, "rowsNumber": total}
         self.update()
 
+    def _handle_filter_change(self, filter_: str) -> None:
+        if self._data_source is None:
+            super()._handle_filter_change(filter_)
+            return
+        # NOTE: the filter is applied by the data source, so QTable must not filter the current page again
+        self._request({**self.pagination, "page": 1})
+
     class row(Element):
         def __init__(self) -> None:
             """Row Element
@@ -266,3 +419,23 @@ class Table(FilterElement, component="table.js"):
             This element is based on Quasar's [QTd ](https://quasar.dev/vue-components/table#qtd-api) component.
             """
             super().__init__("q-td")
+
+
+def _slice_dataframe(
+    df: "pd.DataFrame", request: TableRequest
+) -> Tuple[List[Dict], int]:
+    if request.filter:
+        mask = (
+            df.astype(str)
+            .apply(
+                lambda column: column.str.contains(
+                    request.filter, case=False, regex=False
+                )
+            )
+            .any(axis=1)
+        )
+        df = df[mask]
+    if request.sort_by is not None:
+        df = df.sort_values(request.sort_by, ascending=not request.descending)
+    rows = columnar.to_serializable(df.iloc[request.start : request.stop])
+    return rows.to_dict("records"), len(df)
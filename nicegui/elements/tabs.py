@@ -83,16 +83,28 @@ class TabPanels(ValueElement):
     def _value_to_model_value(self, value: Any) -> Any:
         return value._props["name"] if isinstance(value, (Tab, TabPanel)) else value  # pylint: disable=protected-access
 
+    def _handle_value_change(self, value: Any) -> None:
+        super()._handle_value_change(value)
+        name = self._value_to_model_value(value)
+        for panel in self:
+            if panel._props["name"] == name:  # pylint: disable=protected-access
+                panel._show_content()  # pylint: disable=protected-access
+
 
 class TabPanel(DisableableElement):
-    def __init__(self, name: Union[Tab, str]) -> None:
+    def __init__(self, name: Union[Tab, str], *, lazy: bool = False) -> None:
         """Tab Panel
 
         This element represents [Quasar's QTabPanel ](https://quasar.dev/vue-components/tab-panels#qtabpanel-api) component.
         It is a child of a `TabPanels` element.
 
         - name: `ui.tab` or the name of a tab element
+        - lazy: whether to send the content to the browser only when the panel is shown for the first time (default: `False`)
         """
         super().__init__(tag="q-tab-panel")
         self._props["name"] = name._props["name"] if isinstance(name, Tab) else name
         self._classes.append("nicegui-tab-panel")
+        if lazy:
+            panels = context.get_slot().parent
+            if panels._props.get("model-value") != self._props["name"]:  # pylint: disable=protected-access
+                self._defer_content()
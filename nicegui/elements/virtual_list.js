@@ -0,0 +1,42 @@
+export default {
+  template: `
+    <div @scroll="handleScroll">
+      <div :style="{ position: 'relative', height: row_count * row_height + 'px' }">
+        <div :style="{ position: 'absolute', left: 0, right: 0, top: first * row_height + 'px' }">
+          <slot></slot>
+        </div>
+      </div>
+    </div>
+  `,
+  data() {
+    return {
+      requested: null,
+    };
+  },
+  mounted() {
+    this.handleScroll();
+  },
+  methods: {
+    handleScroll() {
+      const visibleCount = Math.ceil(this.$el.clientHeight / this.row_height);
+      const visibleFirst = Math.floor(this.$el.scrollTop / this.row_height);
+      const maxFirst = Math.max(0, this.row_count - this.window_size);
+      const first = Math.min(maxFirst, Math.max(0, visibleFirst - Math.floor((this.window_size - visibleCount) / 2)));
+      if (Math.abs(first - this.first) < this.window_size / 4 && visibleFirst + visibleCount <= this.first + this.window_size) return;
+      if (first === this.requested) return;
+      this.requested = first;
+      this.$emit("range", first);
+    },
+  },
+  watch: {
+    first() {
+      this.requested = null;
+    },
+  },
+  props: {
+    row_count: Number,
+    row_height: Number,
+    window_size: Number,
+    first: Number,
+  },
+};
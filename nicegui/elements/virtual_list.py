@@ -0,0 +1,93 @@
+from typing import Any, Callable, Dict, List
+
+from ..element import Element
+from ..events import GenericEventArguments
+
+
+class VirtualList(Element, component="virtual_list.js"):
+    def __init__(
+        self,
+        row_count: int,
+        build_row: Callable[[int], Any],
+        *,
+        row_height: float = 40,
+        window_size: int = 50,
+    ) -> None:
+        """Virtual List
+
+        A scrollable list which only keeps a window of rows on the server and in the browser.
+        When scrolling, the browser requests the visible range of rows and `build_row` is called for every new row index.
+        The row containers are reused for new indices, so memory and payload stay constant, no matter how many rows there are.
+
+        - row_count: total number of rows
+        - build_row: function which creates the content of the row with the given index
+        - row_height: height of a single row in pixels (default: 40)
+        - window_size: number of rows to keep rendered (default: 50)
+        """
+        super().__init__()
+        self._classes.append("nicegui-virtual-list")
+        self._props["row_count"] = row_count
+        self._props["row_height"] = row_height
+        self._props["window_size"] = window_size
+        self._props["first"] = 0
+        self._build_row = build_row
+        self._rows: Dict[int, Element] = {}
+        self.on("range", self._handle_range)
+        self._show(0)
+
+    @property
+    def row_count(self) -> int:
+        """Total number of rows."""
+        return self._props["row_count"]
+
+    @row_count.setter
+    def row_count(self, value: int) -> None:
+        self._props["row_count"] = value
+        self._show(self._props["first"])
+
+    @property
+    def rows(self) -> Dict[int, Element]:
+        """The currently rendered row containers by row index."""
+        return self._rows
+
+    def _handle_range(self, e: GenericEventArguments) -> None:
+        self._show(int(e.args))
+
+    def _show(self, first: int) -> None:
+        """Render the window of rows starting at the given index, reusing the containers of rows out of view."""
+        window_size = self._props["window_size"]
+        first = max(0, min(first, self.row_count - window_size))
+        indices = range(first, min(first + window_size, self.row_count))
+        free_rows: List[Element] = [
+            row for index, row in self._rows.items() if index not in indices
+        ]
+        rows = {index: row for index, row in self._rows.items() if index in indices}
+        with self.client.outbox.bulk():
+            for index in indices:
+                if index in rows:
+                    continue
+                if free_rows:
+                    row = free_rows.pop()
+                    row.clear()
+                else:
+                    with self:
+                        row = Element().style(
+                            f'height: {self._props["row_height"]}px; overflow: hidden'
+                        )
+                with row:
+                    self._build_row(index)
+                rows[index] = row
+            for row in free_rows:
+                self.remove(row)
+            self._rows = dict(sorted(rows.items()))
+            self.default_slot.children[:] = self._rows.values()
+            self._props["first"] = first
+            self.update()
+
+    def refresh(self) -> None:
+        """Rebuild the content of all rendered rows, e.g. after the underlying data has changed."""
+        with self.client.outbox.bulk():
+            for index, row in self._rows.items():
+                row.clear()
+                with row:
+                    self._build_row(index)
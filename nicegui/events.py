@@ -13,6 +13,7 @@ from typing import (
     List,
     Literal,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -35,6 +36,8 @@ class EventArguments:
 @dataclass(**KWONLY_SLOTS)
 class ObservableChangeEventArguments(EventArguments):
     sender: ObservableCollection
+    path: Tuple[Any, ...] = ()
+    action: str = "replace"
 
 
 @dataclass(**KWONLY_SLOTS)
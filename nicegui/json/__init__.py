@@ -26,5 +26,7 @@ else:
         loads,
     )
 
+from nicegui.json.raw_json import RawJSON
 
-__all__ = ["dumps", "loads", "NiceGUIJSONResponse"]
+
+__all__ = ["dumps", "loads", "NiceGUIJSONResponse", "RawJSON"]
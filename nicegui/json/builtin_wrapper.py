@@ -1,9 +1,13 @@
+import base64
 import json
+import math
 from datetime import date, datetime
-from typing import Any, Optional, Tuple
+from typing import Any, Optional, Set, Tuple
 
 from fastapi import Response
 
+from .raw_json import RawJSON, RawJSONSplicer
+
 try:
     import numpy as np
 
@@ -13,23 +17,62 @@ except ImportError:
 
 
 def dumps(
-    obj: Any, sort_keys: bool = False, separators: Optional[Tuple[str, str]] = None
+    obj: Any,
+    sort_keys: bool = False,
+    separators: Optional[Tuple[str, str]] = None,
+    *,
+    bytes_as_base64: bool = False,
 ):
     """Serializes a Python object to a JSON-encoded string.
 
     This implementation uses Python's default json module, but extends it in order to support NumPy arrays.
+    Nested `RawJSON` objects are embedded verbatim.
+    Bytes are not serializable unless `bytes_as_base64` is set,
+    because socket.io sends them as binary attachments instead.
+    Like orjson, NaN and infinite values are serialized as `null`.
     """
     if separators is None:
         separators = (",", ":")
-    return json.dumps(
-        obj,
-        sort_keys=sort_keys,
-        separators=separators,
-        indent=None,
-        allow_nan=False,
-        ensure_ascii=False,
-        cls=NumpyJsonEncoder,
-    )
+    splicer = RawJSONSplicer()
+    kwargs = {
+        "sort_keys": sort_keys,
+        "separators": separators,
+        "indent": None,
+        "allow_nan": False,
+        "ensure_ascii": False,
+        "cls": NumpyJsonEncoder,
+        "splicer": splicer,
+        "bytes_as_base64": bytes_as_base64,
+    }
+    try:
+        text = json.dumps(obj, **kwargs)
+    except ValueError as e:
+        if not str(e).startswith("Out of range float values"):
+            raise
+        # NOTE: replacing non-finite floats is only done if necessary to keep the common case fast
+        splicer.fragments.clear()
+        text = json.dumps(_replace_non_finite_floats(obj), **kwargs)
+    return splicer.splice(text) if splicer.fragments else text
+
+
+def _replace_non_finite_floats(obj: Any, markers: Optional[Set[int]] = None) -> Any:
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if not isinstance(obj, (dict, list, tuple)):
+        return obj
+    markers = set() if markers is None else markers
+    if id(obj) in markers:
+        raise ValueError("Circular reference detected")
+    markers.add(id(obj))
+    if isinstance(obj, dict):
+        result: Any = {
+            key: _replace_non_finite_floats(value, markers)
+            for key, value in obj.items()
+        }
+    else:
+        result = [_replace_non_finite_floats(value, markers) for value in obj]
+    markers.remove(id(obj))
+    return result
 
 
 def loads(value: str) -> Any:
@@ -50,14 +93,31 @@ class NiceGUIJSONResponse(Response):
 
 
 class NumpyJsonEncoder(json.JSONEncoder):
-    """Special json encoder that supports NumPy arrays and date/datetime objects."""
+    """Special json encoder that supports NumPy arrays, date/datetime and RawJSON objects."""
+
+    def __init__(
+        self,
+        *,
+        splicer: Optional[RawJSONSplicer] = None,
+        bytes_as_base64: bool = False,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.splicer = splicer
+        self.bytes_as_base64 = bytes_as_base64
 
     def default(self, o):
+        if isinstance(o, RawJSON) and self.splicer is not None:
+            return self.splicer.placeholder(o)
+        if self.bytes_as_base64 and isinstance(o, bytes):
+            return base64.b64encode(o).decode("ascii")
         if has_numpy and isinstance(o, np.integer):
             return int(o)
         if has_numpy and isinstance(o, np.floating):
-            return float(o)
+            return float(o) if np.isfinite(o) else None
         if has_numpy and isinstance(o, np.ndarray):
+            if o.dtype.kind == "f" and not np.isfinite(o).all():
+                return np.where(np.isfinite(o), o, None).tolist()
             return o.tolist()
         if isinstance(o, (datetime, date)):
             return o.isoformat()
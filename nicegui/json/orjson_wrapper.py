@@ -1,3 +1,4 @@
+import base64
 from decimal import Decimal
 from typing import Any, Optional, Tuple
 
@@ -5,6 +6,8 @@ from typing import Any, Optional, Tuple
 import orjson
 from fastapi import Response
 
+from .raw_json import RawJSON, RawJSONSplicer
+
 try:
     import numpy as np
 
@@ -16,11 +19,18 @@ ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
 
 
 def dumps(
-    obj: Any, sort_keys: bool = False, separators: Optional[Tuple[str, str]] = None
+    obj: Any,
+    sort_keys: bool = False,
+    separators: Optional[Tuple[str, str]] = None,
+    *,
+    bytes_as_base64: bool = False,
 ):
     """Serializes a Python object to a JSON-encoded string.
 
     By default, this function supports serializing NumPy arrays, which Python's json module does not.
+    Nested `RawJSON` objects are embedded verbatim.
+    Bytes are not serializable unless `bytes_as_base64` is set,
+    because socket.io sends them as binary attachments instead.
 
     Uses package `orjson` internally.
     """
@@ -37,7 +47,17 @@ def dumps(
     if sort_keys:
         opts |= orjson.OPT_SORT_KEYS
 
-    return orjson.dumps(obj, option=opts, default=_orjson_converter).decode("utf-8")
+    splicer = RawJSONSplicer()
+
+    def converter(obj):
+        if isinstance(obj, RawJSON):
+            return splicer.placeholder(obj)
+        if bytes_as_base64 and isinstance(obj, bytes):
+            return base64.b64encode(obj).decode("ascii")
+        return _orjson_converter(obj)
+
+    text = orjson.dumps(obj, option=opts, default=converter).decode("utf-8")
+    return splicer.splice(text) if splicer.fragments else text
 
 
 def loads(value: str) -> Any:
@@ -50,13 +70,30 @@ def loads(value: str) -> Any:
 
 def _orjson_converter(obj):
     """Custom serializer/converter, e.g. for NumPy object arrays."""
-    if has_numpy and isinstance(obj, np.ndarray) and obj.dtype == np.object_:
-        return obj.tolist()
+    if has_numpy and isinstance(obj, np.ndarray):
+        return _convert_array(obj)
     if isinstance(obj, Decimal):
         return float(obj)
     raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
 
 
+def _convert_array(array: "np.ndarray") -> Any:
+    """Convert an array which orjson does not serialize natively.
+
+    orjson only serializes C-contiguous arrays of common numeric data types in native byte order.
+    Other numeric arrays (e.g. slices, transposed arrays or float16 arrays) are converted into such an array,
+    so that they still take the fast path instead of being converted into Python lists.
+    """
+    if array.dtype.kind in "biuf":
+        dtype = (
+            np.float64 if array.dtype == np.float16 else array.dtype.newbyteorder("=")
+        )
+        converted = np.ascontiguousarray(array, dtype=dtype)
+        if converted is not array:
+            return converted
+    return array.tolist()
+
+
 class NiceGUIJSONResponse(Response):
     """FastAPI response class to support our custom json serializer implementation.
 
@@ -0,0 +1,32 @@
+from typing import List
+
+
+class RawJSON:
+    """JSON text which is embedded verbatim when serializing a surrounding object.
+
+    This allows serializing a payload only once and sending the result to multiple receivers,
+    e.g. to all sockets of a shared page and to the On Air relay.
+    """
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+class RawJSONSplicer:
+    """Replaces RawJSON objects with placeholders during serialization and splices their text in afterwards."""
+
+    def __init__(self) -> None:
+        self.fragments: List[str] = []
+
+    def placeholder(self, raw: RawJSON) -> str:
+        """Remember the raw JSON text and return a unique placeholder string to be serialized instead."""
+        self.fragments.append(raw.text)
+        return f"\x00{id(self)}-{len(self.fragments) - 1}\x00"
+
+    def splice(self, text: str) -> str:
+        """Replace the serialized placeholders with the raw JSON text."""
+        for i, fragment in enumerate(self.fragments):
+            text = text.replace(f'"\\u0000{id(self)}-{i}\\u0000"', fragment, 1)
+        return text
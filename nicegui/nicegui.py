@@ -11,7 +11,7 @@ from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 
-from . import air, background_tasks, binding, core, favicon, helpers, json, run, welcome
+from . import air, background_tasks, binding, core, favicon, helpers, json, outbox, run, welcome
 from .app import App
 from .client import Client
 from .dependencies import js_components, libraries, resources
@@ -218,8 +218,10 @@ async def _startup() -> None:
     core.loop = asyncio.get_running_loop()
     app.start()
     background_tasks.create(binding.refresh_loop(), name="refresh bindings")
+    background_tasks.create(outbox.loop(), name="outbox loop")
     background_tasks.create(Client.prune_instances(), name="prune clients")
     background_tasks.create(Slot.prune_stacks(), name="prune slot stacks")
+    background_tasks.create(app.storage.prune_loop(), name="prune user storages")
     air.connect()
 
 
@@ -231,7 +233,8 @@ async def _shutdown() -> None:
     1. Signals the main window to shutdown the server.
     2. Disconnects from the air.
     3. Stops the application.
-    4. Tears down the run.
+    4. Writes pending storage changes to disk.
+    5. Tears down the run.
 
     Usage:
     This function should be called when the application needs to be shut down gracefully.
@@ -244,6 +247,7 @@ async def _shutdown() -> None:
         app.native.main_window.signal_server_shutdown()
     air.disconnect()
     app.stop()
+    app.storage.flush()
     run.tear_down()
 
 
@@ -7,7 +7,9 @@ from typing import (
     Collection,
     Dict,
     Iterable,
+    Iterator,
     List,
+    Literal,
     Optional,
     SupportsIndex,
     Union,
@@ -15,6 +17,12 @@ from typing import (
 
 from . import events
 
+ChangeAction = Literal["set", "delete", "insert", "replace"]
+
+_NO_KEY = object()
+_handlers_version = 0
+"""Incremented whenever a change handler is registered, which invalidates all cached handler chains."""
+
 
 class ObservableCollection(abc.ABC):
     """
@@ -23,6 +31,12 @@ class ObservableCollection(abc.ABC):
     This class provides a foundation for creating collections that can be observed for changes.
     It allows registering change handlers and propagating change events to the registered handlers.
 
+    Change events carry the path of keys (or indices) from the collection the handler is registered on
+    to the changed item, together with the kind of change ("set", "delete", "insert" or "replace").
+    A "replace" event means that the whole collection at the given path has changed, e.g. after `clear()` or `sort()`.
+
+    Nested dictionaries, lists and sets are wrapped into observable collections lazily when they are accessed.
+
     Attributes:
         change_handlers (List[Callable]): A list of all change handlers registered on this collection and its parents.
 
@@ -52,7 +66,10 @@ class ObservableCollection(abc.ABC):
         """
         super().__init__(factory() if data is None else data)  # type: ignore
         self._parent = _parent
+        self._key: Any = _NO_KEY
         self._change_handlers: List[Callable] = [on_change] if on_change else []
+        self._handler_chain: List[ObservableCollection] = []
+        self._handler_chain_version = -1
 
     @property
     def change_handlers(self) -> List[Callable]:
@@ -63,20 +80,75 @@ class ObservableCollection(abc.ABC):
             List[Callable]: A list of change handlers.
 
         """
-        change_handlers = self._change_handlers[:]
-        if self._parent is not None:
-            change_handlers.extend(self._parent.change_handlers)
-        return change_handlers
+        return [
+            handler
+            for collection in self._get_handler_chain()
+            for handler in collection._change_handlers
+        ]
 
-    def _handle_change(self) -> None:
+    def _get_handler_chain(self) -> List[ObservableCollection]:
         """
-        Handle the change event by calling all registered change handlers.
+        Return this collection and its parents which have change handlers.
+
+        The chain is cached until the next change handler is registered anywhere.
 
+        Returns:
+            List[ObservableCollection]: The collections with change handlers, starting with this collection.
+
+        """
+        if self._handler_chain_version != _handlers_version:
+            chain: List[ObservableCollection] = []
+            collection: Optional[ObservableCollection] = self
+            while collection is not None:
+                if collection._change_handlers:
+                    chain.append(collection)
+                collection = collection._parent
+            self._handler_chain = chain
+            self._handler_chain_version = _handlers_version
+        return self._handler_chain
+
+    def _handle_change(
+        self, action: ChangeAction = "replace", key: Any = _NO_KEY
+    ) -> None:
         """
-        for handler in self.change_handlers:
-            events.handle_event(
-                handler, events.ObservableChangeEventArguments(sender=self)
+        Handle the change event by calling all registered change handlers.
+
+        Args:
+            action (ChangeAction): The kind of change.
+            key (Any): The key or index of the changed item (omitted if the whole collection changed).
+
+        """
+        chain = self._get_handler_chain()
+        if not chain:
+            return
+        path: List[Any] = [] if key is _NO_KEY else [key]
+        collection: ObservableCollection = self
+        for handler_collection in chain:
+            while collection is not handler_collection:
+                assert collection._parent is not None
+                collection_key = collection._parent._find_key(collection)
+                if collection_key is _NO_KEY:
+                    return  # NOTE: the collection has been removed from its parent
+                path.append(collection_key)
+                collection = collection._parent
+            arguments = events.ObservableChangeEventArguments(
+                sender=self, path=tuple(reversed(path)), action=action
             )
+            for handler in handler_collection._change_handlers:
+                events.handle_event(handler, arguments)
+
+    def _find_key(self, child: ObservableCollection) -> Any:
+        """
+        Find the key or index of the given child collection.
+
+        Args:
+            child (ObservableCollection): The child collection.
+
+        Returns:
+            Any: The key or index of the child or `_NO_KEY` if it is not contained in this collection.
+
+        """
+        return _NO_KEY
 
     def on_change(self, handler: Callable) -> None:
         """
@@ -86,26 +158,50 @@ class ObservableCollection(abc.ABC):
             handler (Callable): The handler function to be registered.
 
         """
+        global _handlers_version  # pylint: disable=global-statement
         self._change_handlers.append(handler)
+        _handlers_version += 1
 
-    def _observe(self, data: Any) -> Any:
+    def remove_change_handler(self, handler: Callable) -> None:
+        """
+        Unregister a handler which has been registered with `on_change()`.
+
+        Args:
+            handler (Callable): The handler function to be unregistered.
+
+        """
+        global _handlers_version  # pylint: disable=global-statement
+        self._change_handlers.remove(handler)
+        _handlers_version += 1
+
+    def _observe(self, data: Any, key: Any = _NO_KEY) -> Any:
         """
         Observe the given data and return an observable version of it.
 
         Args:
             data (Any): The data to be observed.
+            key (Any): The key of the data within this collection (if known).
 
         Returns:
             Any: The observable version of the data.
 
         """
         if isinstance(data, dict):
-            return ObservableDict(data, _parent=self)
-        if isinstance(data, list):
-            return ObservableList(data, _parent=self)
-        if isinstance(data, set):
-            return ObservableSet(data, _parent=self)
-        return data
+            observable: ObservableCollection = ObservableDict(data, _parent=self)
+        elif isinstance(data, list):
+            observable = ObservableList(data, _parent=self)
+        elif isinstance(data, set):
+            observable = ObservableSet(data, _parent=self)
+        else:
+            return data
+        observable._key = key
+        return observable
+
+
+def _needs_wrapping(value: Any) -> bool:
+    return isinstance(value, (dict, list, set)) and not isinstance(
+        value, ObservableCollection
+    )
 
 
 class ObservableDict(ObservableCollection, dict):
@@ -117,21 +213,51 @@ class ObservableDict(ObservableCollection, dict):
         _parent: Optional[ObservableCollection] = None,
     ) -> None:
         super().__init__(factory=dict, data=data, on_change=on_change, _parent=_parent)
-        for key, value in self.items():
-            super().__setitem__(key, self._observe(value))
+
+    def _find_key(self, child: ObservableCollection) -> Any:
+        if child._key is not _NO_KEY and dict.get(self, child._key) is child:
+            return child._key
+        for key, value in dict.items(self):
+            if value is child:
+                return key
+        return _NO_KEY
+
+    def _wrap_all(self) -> None:
+        for key, value in dict.items(self):
+            if _needs_wrapping(value):
+                dict.__setitem__(self, key, self._observe(value, key))
+
+    def __getitem__(self, __key: Any) -> Any:
+        value = super().__getitem__(__key)
+        if _needs_wrapping(value):
+            value = self._observe(value, __key)
+            dict.__setitem__(self, __key, value)
+        return value
+
+    def get(self, __key: Any, __default: Any = None) -> Any:
+        return self[__key] if __key in self else __default
+
+    def values(self) -> Any:
+        self._wrap_all()
+        return super().values()
+
+    def items(self) -> Any:
+        self._wrap_all()
+        return super().items()
 
     def pop(self, k: Any, d: Any = None) -> Any:
         item = super().pop(k, d)
-        self._handle_change()
+        self._handle_change("delete", k)
         return item
 
     def popitem(self) -> Any:
         item = super().popitem()
-        self._handle_change()
+        self._handle_change("delete", item[0])
         return item
 
     def update(self, *args: Any, **kwargs: Any) -> None:
-        super().update(self._observe(dict(*args, **kwargs)))
+        for key, value in dict(*args, **kwargs).items():
+            dict.__setitem__(self, key, self._observe(value, key))
         self._handle_change()
 
     def clear(self) -> None:
@@ -139,24 +265,23 @@ class ObservableDict(ObservableCollection, dict):
         self._handle_change()
 
     def setdefault(self, __key: Any, __default: Any = None) -> Any:
-        item = super().setdefault(__key, self._observe(__default))
-        self._handle_change()
-        return item
+        super().setdefault(__key, self._observe(__default, __key))
+        self._handle_change("set", __key)
+        return self[__key]
 
     def __setitem__(self, __key: Any, __value: Any) -> None:
-        super().__setitem__(__key, self._observe(__value))
-        self._handle_change()
+        super().__setitem__(__key, self._observe(__value, __key))
+        self._handle_change("set", __key)
 
     def __delitem__(self, __key: Any) -> None:
         super().__delitem__(__key)
-        self._handle_change()
+        self._handle_change("delete", __key)
 
     def __or__(self, other: Any) -> Any:
         return super().__or__(other)
 
     def __ior__(self, other: Any) -> Any:
-        super().__ior__(self._observe(dict(other)))
-        self._handle_change()
+        self.update(other)
         return self
 
 
@@ -206,8 +331,33 @@ class ObservableList(ObservableCollection, list):
         _parent: Optional[ObservableCollection] = None,
     ) -> None:
         super().__init__(factory=list, data=data, on_change=on_change, _parent=_parent)
-        for i, item in enumerate(self):
-            super().__setitem__(i, self._observe(item))
+
+    def _find_key(self, child: ObservableCollection) -> Any:
+        for i, item in enumerate(list.__iter__(self)):
+            if item is child:
+                return i
+        return _NO_KEY
+
+    def _wrap(self, index: int, item: Any) -> Any:
+        if _needs_wrapping(item):
+            item = self._observe(item)
+            list.__setitem__(self, index, item)
+        return item
+
+    def __getitem__(self, key: Union[SupportsIndex, slice]) -> Any:  # type: ignore[override]
+        if isinstance(key, slice):
+            for i in range(*key.indices(len(self))):
+                self._wrap(i, list.__getitem__(self, i))
+            return super().__getitem__(key)
+        return self._wrap(key.__index__(), super().__getitem__(key))
+
+    def __iter__(self) -> Iterator[Any]:
+        for i, item in enumerate(super().__iter__()):
+            yield self._wrap(i, item)
+
+    def __reversed__(self) -> Iterator[Any]:
+        for i in range(len(self) - 1, -1, -1):
+            yield self[i]
 
     def append(self, item: Any) -> None:
         """
@@ -223,7 +373,7 @@ class ObservableList(ObservableCollection, list):
             None
         """
         super().append(self._observe(item))
-        self._handle_change()
+        self._handle_change("insert", len(self) - 1)
 
     def extend(self, iterable: Iterable) -> None:
         """
@@ -238,7 +388,7 @@ class ObservableList(ObservableCollection, list):
         Raises:
             None
         """
-        super().extend(self._observe(list(iterable)))
+        super().extend([self._observe(item) for item in iterable])
         self._handle_change()
 
     def insert(self, index: SupportsIndex, obj: Any) -> None:
@@ -259,8 +409,12 @@ class ObservableList(ObservableCollection, list):
             - This method internally observes the inserted object using the `_observe` method.
             - After inserting the object, it calls the `_handle_change` method to notify any observers of the change.
         """
-        super().insert(index, self._observe(obj))
-        self._handle_change()
+        position = index.__index__()
+        if position < 0:
+            position = max(len(self) + position, 0)
+        position = min(position, len(self))
+        super().insert(position, self._observe(obj))
+        self._handle_change("insert", position)
 
     def remove(self, value: Any) -> None:
         """
@@ -280,8 +434,9 @@ class ObservableList(ObservableCollection, list):
             After removing the value, it triggers the `_handle_change` method
             to notify any observers of the change.
         """
-        super().remove(value)
-        self._handle_change()
+        index = self.index(value)
+        super().__delitem__(index)
+        self._handle_change("delete", index)
 
     def pop(self, index: SupportsIndex = -1) -> Any:
         """
@@ -299,8 +454,11 @@ class ObservableList(ObservableCollection, list):
         This method removes and returns an item from the observable list. It also triggers a change event to notify
         any observers of the list that a change has occurred.
         """
+        position = index.__index__()
+        if position < 0:
+            position += len(self)
         item = super().pop(index)
-        self._handle_change()
+        self._handle_change("delete", position)
         return item
 
     def clear(self) -> None:
@@ -342,18 +500,28 @@ class ObservableList(ObservableCollection, list):
         self._handle_change()
 
     def __delitem__(self, key: Union[SupportsIndex, slice]) -> None:
-        super().__delitem__(key)
-        self._handle_change()
+        if isinstance(key, slice):
+            super().__delitem__(key)
+            self._handle_change()
+        else:
+            index = key.__index__()
+            super().__delitem__(key)
+            self._handle_change("delete", index + len(self) + 1 if index < 0 else index)
 
     def __setitem__(self, key: Union[SupportsIndex, slice], value: Any) -> None:
-        super().__setitem__(key, self._observe(value))
-        self._handle_change()
+        if isinstance(key, slice):
+            super().__setitem__(key, [self._observe(item) for item in value])
+            self._handle_change()
+        else:
+            index = key.__index__()
+            super().__setitem__(key, self._observe(value))
+            self._handle_change("set", index + len(self) if index < 0 else index)
 
     def __add__(self, other: Any) -> Any:
         return super().__add__(other)
 
     def __iadd__(self, other: Any) -> Any:
-        super().__iadd__(self._observe(other))
+        super().__iadd__([self._observe(item) for item in other])
         self._handle_change()
         return self
 
@@ -412,15 +580,13 @@ class ObservableSet(ObservableCollection, set):
             None
         """
         super().__init__(factory=set, data=data, on_change=on_change, _parent=_parent)
-        for item in self:
-            super().add(self._observe(item))
 
     def add(self, item: Any) -> None:
         """
         Add an item to the observable set.
 
-        This method adds the specified item to the observable set. The item will be observed
-        for any changes and the `_handle_change()` method will be called after the item is added.
+        This method adds the specified item to the observable set.
+        The `_handle_change()` method will be called after the item is added.
 
         Args:
             item (Any): The item to be added to the set.
@@ -428,8 +594,8 @@ class ObservableSet(ObservableCollection, set):
         Returns:
             None
         """
-        super().add(self._observe(item))
-        self._handle_change()
+        super().add(item)
+        self._handle_change("insert", item)
 
     def remove(self, item: Any) -> None:
         """
@@ -450,7 +616,7 @@ class ObservableSet(ObservableCollection, set):
             to notify any observers of the change.
         """
         super().remove(item)
-        self._handle_change()
+        self._handle_change("delete", item)
 
     def discard(self, item: Any) -> None:
         """
@@ -463,7 +629,7 @@ class ObservableSet(ObservableCollection, set):
             None
         """
         super().discard(item)
-        self._handle_change()
+        self._handle_change("delete", item)
 
     def pop(self) -> Any:
         """
@@ -499,7 +665,7 @@ class ObservableSet(ObservableCollection, set):
         Returns:
             None
         """
-        super().update(self._observe(set(*s)))
+        super().update(*s)
         self._handle_change()
 
     def intersection_update(self, *s: Iterable[Any]) -> None:
@@ -563,7 +729,7 @@ class ObservableSet(ObservableCollection, set):
         Returns:
             Any: The updated set.
         """
-        super().__ior__(self._observe(other))
+        super().__ior__(other)
         self._handle_change()
         return self
 
@@ -589,7 +755,7 @@ class ObservableSet(ObservableCollection, set):
         Returns:
             Any: The updated set.
         """
-        super().__iand__(self._observe(other))
+        super().__iand__(other)
         self._handle_change()
         return self
 
@@ -615,7 +781,7 @@ class ObservableSet(ObservableCollection, set):
         Returns:
             Any: The updated set.
         """
-        super().__isub__(self._observe(other))
+        super().__isub__(other)
         self._handle_change()
         return self
 
@@ -641,6 +807,6 @@ class ObservableSet(ObservableCollection, set):
         Returns:
             Any: The updated set.
         """
-        super().__ixor__(self._observe(other))
+        super().__ixor__(other)
         self._handle_change()
         return self
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from collections import deque
-from typing import TYPE_CHECKING, Any, Deque, Dict, Optional, Tuple
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-from . import background_tasks, core
+from . import core, json
+from .dataclasses import KWONLY_SLOTS
 
 if TYPE_CHECKING:
     from .client import Client
@@ -14,11 +18,43 @@ ClientId = str
 ElementId = int
 MessageType = str
 Message = Tuple[ClientId, MessageType, Any]
+PatchFields = Dict[str, Set[str]]
+
+
+@dataclass(**KWONLY_SLOTS)
+class OutboxMetrics:
+    """Metrics of the server-wide outbox dispatcher.
+
+    Attributes:
+        queue_depth (int): The number of outboxes with pending updates or messages.
+        flush_count (int): The total number of flushed outboxes.
+        emit_count (int): The total number of emitted socket messages.
+        last_flush_latency (float): The time between the first enqueued change and its flush for the last flushed outbox.
+        max_flush_latency (float): The maximum flush latency observed so far.
+        last_cycle_duration (float): The duration of the last dispatcher cycle in seconds.
+    """
+
+    queue_depth: int = 0
+    flush_count: int = 0
+    emit_count: int = 0
+    last_flush_latency: float = 0.0
+    max_flush_latency: float = 0.0
+    last_cycle_duration: float = 0.0
+
+
+metrics = OutboxMetrics()
+ready_outboxes: Dict[Outbox, float] = {}
+"""Maps outboxes with pending work to the time they became ready (in insertion order)."""
+_ready_event: Optional[asyncio.Event] = None
 
 
 class Outbox:
     """
-    The Outbox class is responsible for managing updates and messages to be sent to clients in an endless loop.
+    The Outbox class is responsible for collecting updates and messages to be sent to a client.
+
+    The outboxes of all clients are flushed by a single server-wide dispatcher loop (see `loop()`),
+    which only visits outboxes with pending work and sleeps while there is nothing to send.
+    Once woken up, it waits for `app.config.message_flush_interval` seconds to coalesce further changes into a single flush.
 
     Args:
         client (Client): The client associated with the outbox.
@@ -26,33 +62,44 @@ class Outbox:
     Attributes:
         client (Client): The client associated with the outbox.
         updates (Dict[ElementId, Optional[Element]]): A dictionary that stores the updates to be sent to clients.
+        patches (Dict[ElementId, Tuple[Element, PatchFields]]): A dictionary that stores the changed fields
+            (e.g. "props", "style" or "class") and keys of elements which do not need a full update.
         messages (Deque[Message]): A deque that stores the messages to be sent to clients.
-        _should_stop (bool): A flag indicating whether the outbox loop should stop.
+        _should_stop (bool): A flag indicating whether the outbox has been stopped.
 
     Methods:
         enqueue_update(element: Element) -> None:
             Enqueues an update for the given element.
+        bulk() -> Iterator[None]:
+            Context manager for enqueuing many updates without waking up the dispatcher for each of them.
         enqueue_delete(element: Element) -> None:
             Enqueues a deletion for the given element.
+        enqueue_patch(element: Element, field: str, keys: Iterable[str]) -> None:
+            Enqueues a partial update for the given field and keys of the element.
         enqueue_message(message_type: MessageType, data: Any, target_id: ClientId) -> None:
             Enqueues a message for the given client.
-        loop() -> None:
-            Sends updates and messages to all clients in an endless loop.
+        wake_up() -> None:
+            Registers the outbox with the dispatcher if there is pending work, e.g. after the client connected.
+        flush() -> None:
+            Sends all pending updates and messages to the client.
         _emit(message_type: MessageType, data: Any, target_id: ClientId) -> None:
             Emits a message to the specified client.
         stop() -> None:
-            Stops the outbox loop.
+            Stops the outbox.
     """
 
     def __init__(self, client: Client) -> None:
         self.client = client
         self.updates: Dict[ElementId, Optional[Element]] = {}
+        self.patches: Dict[ElementId, Tuple[Element, PatchFields]] = {}
         self.messages: Deque[Message] = deque()
         self._should_stop = False
-        if core.app.is_started:
-            background_tasks.create(self.loop(), name=f"outbox loop {client.id}")
-        else:
-            core.app.on_startup(self.loop)
+        self._bulk_depth = 0
+
+    @property
+    def has_pending_work(self) -> bool:
+        """Whether there are updates, patches or messages to be sent."""
+        return bool(self.updates or self.patches or self.messages)
 
     def enqueue_update(self, element: Element) -> None:
         """
@@ -62,6 +109,24 @@ class Outbox:
             element (Element): The element to be updated.
         """
         self.updates[element.id] = element
+        self.patches.pop(element.id, None)
+        if not self._bulk_depth:
+            self.wake_up()
+
+    @contextmanager
+    def bulk(self) -> Iterator[None]:
+        """
+        Enqueues many updates at once.
+
+        The dispatcher is woken up only once when leaving the outermost block instead of for every single update.
+        """
+        self._bulk_depth += 1
+        try:
+            yield
+        finally:
+            self._bulk_depth -= 1
+            if not self._bulk_depth:
+                self.wake_up()
 
     def enqueue_delete(self, element: Element) -> None:
         """
@@ -71,6 +136,28 @@ class Outbox:
             element (Element): The element to be deleted.
         """
         self.updates[element.id] = None
+        self.patches.pop(element.id, None)
+        self.wake_up()
+
+    def enqueue_patch(
+        self, element: Element, field: str, keys: Iterable[str] = ()
+    ) -> None:
+        """
+        Enqueues a partial update for the given element.
+
+        Only the given field (and keys) will be sent to the client instead of the whole element.
+        If a full update of the element is already pending, the patch is not needed and ignored.
+
+        Args:
+            element (Element): The element to be patched.
+            field (str): The changed field of the element ("props", "style" or "class").
+            keys (Iterable[str]): The changed keys of the field (only for "props" and "style").
+        """
+        if element.id in self.updates:
+            return
+        _, fields = self.patches.setdefault(element.id, (element, {}))
+        fields.setdefault(field, set()).update(keys)
+        self.wake_up()
 
     def enqueue_message(
         self, message_type: MessageType, data: Any, target_id: ClientId
@@ -84,42 +171,62 @@ class Outbox:
             target_id (ClientId): The ID of the target client.
         """
         self.messages.append((target_id, message_type, data))
+        self.wake_up()
 
-    async def loop(self) -> None:
-        """
-        Sends updates and messages to all clients in an endless loop.
+    def wake_up(self) -> None:
         """
-        while not self._should_stop:
-            try:
-                await asyncio.sleep(0.01)
+        Registers the outbox with the dispatcher if there is pending work.
 
-                if not self.updates and not self.messages:
-                    continue
+        Outboxes of clients without socket connection are not registered.
+        They are woken up again by the client after the handshake.
+        """
+        if self._should_stop or self in ready_outboxes:
+            return
+        if not self.has_pending_work or not self.client.has_socket_connection:
+            return
+        ready_outboxes[self] = time.time()
+        if _ready_event is not None:
+            _ready_event.set()
 
-                if not self.client.has_socket_connection:
-                    continue
+    async def flush(self) -> None:
+        """
+        Sends all pending updates, patches and messages to the client.
 
-                coros = []
-                data = {
-                    element_id: None if element is None else element._to_dict()  # pylint: disable=protected-access
-                    for element_id, element in self.updates.items()
-                }
+        Emits are awaited one after the other to preserve the order of messages for this client.
+        """
+        coros = []
+        # NOTE: content of lazy containers is sent as a whole when it is shown for the first time
+        deferred_ids = self.client.deferred_element_ids
+        if self.updates:
+            data = {
+                element_id: None if element is None else element._to_dict()  # pylint: disable=protected-access
+                for element_id, element in self.updates.items()
+                if element is None or element_id not in deferred_ids
+            }
+            if data:
                 coros.append(self._emit("update", data, self.client.id))
-                self.updates.clear()
+            self.updates.clear()
 
-                for target_id, message_type, data in self.messages:
-                    coros.append(self._emit(message_type, data, target_id))
-                self.messages.clear()
+        if self.patches:
+            data = {
+                element_id: element._to_patch(fields)  # pylint: disable=protected-access
+                for element_id, (element, fields) in self.patches.items()
+                if element_id not in deferred_ids
+            }
+            if data:
+                coros.append(self._emit("patch", data, self.client.id))
+            self.patches.clear()
 
-                for coro in coros:
-                    try:
-                        await coro
-                    except Exception as e:
-                        core.app.handle_exception(e)
+        for target_id, message_type, data in self.messages:
+            coros.append(self._emit(message_type, data, target_id))
+        self.messages.clear()
 
+        metrics.emit_count += len(coros)
+        for coro in coros:
+            try:
+                await coro
             except Exception as e:
                 core.app.handle_exception(e)
-                await asyncio.sleep(0.1)
 
     async def _emit(
         self, message_type: MessageType, data: Any, target_id: ClientId
@@ -127,17 +234,83 @@ class Outbox:
         """
         Emits a message to the specified client.
 
+        Messages which are also forwarded to NiceGUI On Air are serialized only once for both receivers.
+
         Args:
             message_type (MessageType): The type of the message.
             data (Any): The data to be sent in the message.
             target_id (ClientId): The ID of the target client.
         """
+        if core.air is None or not core.air.is_air_target(target_id):
+            # NOTE: socket.io already encodes each message once per room
+            await core.sio.emit(message_type, data, room=target_id)
+            return
+        data = _serialize_once(data)
         await core.sio.emit(message_type, data, room=target_id)
-        if core.air is not None and core.air.is_air_target(target_id):
-            await core.air.emit(message_type, data, room=target_id)
+        await core.air.emit(message_type, data, room=target_id)
 
     def stop(self) -> None:
         """
-        Stops the outbox loop.
+        Stops the outbox.
+
+        Pending updates and messages are discarded.
         """
         self._should_stop = True
+        ready_outboxes.pop(self, None)
+
+
+def _serialize_once(data: Any) -> Any:
+    """Serialize the data to JSON text which is embedded verbatim by all further serializations.
+
+    Data that cannot be serialized to JSON (e.g. bytes which are sent as binary attachments) is returned unchanged.
+    """
+    try:
+        return json.RawJSON(json.dumps(data))
+    except (TypeError, ValueError):
+        return data
+
+
+async def loop() -> None:
+    """Flush all outboxes with pending work in an endless loop.
+
+    The loop sleeps until an outbox becomes ready, so idle clients do not cause any wakeups.
+    """
+    global _ready_event  # pylint: disable=global-statement
+    _ready_event = asyncio.Event()
+    _ready_event.set()
+    while True:
+        try:
+            await _ready_event.wait()
+            # NOTE: wait a little to coalesce further changes into a single flush
+            await asyncio.sleep(core.app.config.message_flush_interval)
+            _ready_event.clear()
+            await _flush_ready_outboxes()
+        except Exception as e:
+            core.app.handle_exception(e)
+            await asyncio.sleep(0.1)
+
+
+async def _flush_ready_outboxes() -> None:
+    t = time.time()
+    metrics.queue_depth = len(ready_outboxes)
+    outboxes: List[Tuple[Outbox, float]] = list(ready_outboxes.items())
+    ready_outboxes.clear()
+    for outbox, ready_time in outboxes:
+        metrics.last_flush_latency = t - ready_time
+        metrics.max_flush_latency = max(
+            metrics.max_flush_latency, metrics.last_flush_latency
+        )
+    metrics.flush_count += len(outboxes)
+    await asyncio.gather(*(outbox.flush() for outbox, _ in outboxes))
+    metrics.queue_depth = len(ready_outboxes)
+    metrics.last_cycle_duration = time.time() - t
+
+
+def reset() -> None:
+    """Clear all ready outboxes and metrics.
+
+    This function is intended for testing purposes only.
+    """
+    ready_outboxes.clear()
+    for name, value in asdict(OutboxMetrics()).items():
+        setattr(metrics, name, value)
@@ -149,6 +149,7 @@ class page:
                 k: v for k, v in dec_kwargs.items() if k in parameters_of_decorated_func
             }
             with Client(self) as client:
+                client.session_id = request.scope.get("session", {}).get("id")
                 if any(
                     p.name == "client"
                     for p in inspect.signature(func).parameters.values()
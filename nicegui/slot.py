@@ -29,6 +29,8 @@ class Slot:
         When exiting the context, the slot is removed from the slot stack and the stack is pruned if empty.
     """
 
+    __slots__ = ("name", "parent", "template", "children")
+
     stacks: Dict[int, List[Slot]] = {}
 
     def __init__(
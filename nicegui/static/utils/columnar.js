@@ -0,0 +1,77 @@
+const TYPED_ARRAYS = {
+  int8: Int8Array,
+  uint8: Uint8Array,
+  int16: Int16Array,
+  uint16: Uint16Array,
+  int32: Int32Array,
+  uint32: Uint32Array,
+  float32: Float32Array,
+  float64: Float64Array,
+  int64: Float64Array,
+  uint64: Float64Array,
+  bool: Uint8Array,
+};
+
+function toArrayBuffer(buffer) {
+  if (typeof buffer === "string") {
+    // NOTE: buffers embedded into the initial page are base64 encoded
+    const binary = atob(buffer);
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+    return bytes.buffer;
+  }
+  if (ArrayBuffer.isView(buffer)) {
+    return buffer.buffer.slice(buffer.byteOffset, buffer.byteOffset + buffer.byteLength);
+  }
+  return buffer;
+}
+
+export function isEncodedArray(value) {
+  return typeof value === "object" && value !== null && "__ndarray__" in value;
+}
+
+export function isEncodedColumns(value) {
+  return typeof value === "object" && value !== null && "__columns__" in value;
+}
+
+function toValues(typedArray, dtype) {
+  if (dtype === "bool") return Array.from(typedArray, (value) => value !== 0);
+  if (dtype.startsWith("float")) return Array.from(typedArray, (value) => (Number.isNaN(value) ? null : value));
+  return Array.from(typedArray);
+}
+
+function reshape(values, shape) {
+  if (shape.length <= 1) return values;
+  const size = values.length / shape[0];
+  const rows = [];
+  for (let i = 0; i < shape[0]; i++) rows.push(reshape(values.slice(i * size, (i + 1) * size), shape.slice(1)));
+  return rows;
+}
+
+export function decodeArray(encoded) {
+  const { dtype, shape, buffer } = encoded.__ndarray__;
+  const typedArray = new TYPED_ARRAYS[dtype](toArrayBuffer(buffer));
+  return reshape(toValues(typedArray, dtype), shape);
+}
+
+export function decodeRows(encoded) {
+  const { length, names, columns } = encoded.__columns__;
+  const values = columns.map((column) => (isEncodedArray(column) ? decodeArray(column) : column));
+  const rows = new Array(length);
+  for (let i = 0; i < length; i++) {
+    const row = {};
+    for (let j = 0; j < names.length; j++) row[names[j]] = values[j][i];
+    rows[i] = row;
+  }
+  return rows;
+}
+
+export function decodeArrays(obj) {
+  if (typeof obj !== "object" || obj === null) return obj;
+  if (isEncodedArray(obj)) return decodeArray(obj);
+  if (isEncodedColumns(obj)) return decodeRows(obj);
+  if (Array.isArray(obj)) return obj.map(decodeArrays);
+  const result = {};
+  for (const [key, value] of Object.entries(obj)) result[key] = decodeArrays(value);
+  return result;
+}
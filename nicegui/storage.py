@@ -1,20 +1,72 @@
+import abc
+import asyncio
 import contextvars
 import os
+import sqlite3
+import threading
+import time
 import uuid
+import weakref
+from collections import OrderedDict, deque
 from collections.abc import MutableMapping
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Iterator, Optional, Union
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union
 
-import aiofiles
 from starlette.middleware import Middleware
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.middleware.sessions import SessionMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
-from . import background_tasks, context, core, json, observables
+from . import background_tasks, context, core, events, json, observables, run
+from .dataclasses import KWONLY_SLOTS
 from .logging import log
 
+# NOTE: changes are written after the storage has been idle for this many seconds ...
+STORAGE_WRITE_DELAY = float(os.environ.get("NICEGUI_STORAGE_WRITE_DELAY", "0.1"))
+# ... but not later than this many seconds after the first unsaved change
+STORAGE_MAX_WRITE_DELAY = float(
+    os.environ.get("NICEGUI_STORAGE_MAX_WRITE_DELAY", "1.0")
+)
+# NOTE: append changes to a journal instead of rewriting the whole storage for every write
+STORAGE_JOURNAL = os.environ.get("NICEGUI_STORAGE_JOURNAL", "false").lower() == "true"
+# NOTE: the journal is compacted into a new snapshot when it grows beyond this many bytes (and the snapshot size)
+JOURNAL_COMPACTION_SIZE = int(
+    os.environ.get("NICEGUI_STORAGE_JOURNAL_COMPACTION_SIZE", "100000")
+)
+# NOTE: "file" (one JSON file per storage) or "sqlite" (a single database in write-ahead logging mode)
+STORAGE_BACKEND = os.environ.get("NICEGUI_STORAGE_BACKEND", "file")
+# NOTE: least recently used user storages beyond this number are dropped from memory and reloaded on demand
+MAX_CACHED_USER_STORAGES = int(
+    os.environ.get("NICEGUI_MAX_CACHED_USER_STORAGES", "10000")
+)
+# NOTE: user storages of sessions without connected clients are unloaded after this many seconds without access
+USER_STORAGE_IDLE_TIMEOUT = float(
+    os.environ.get("NICEGUI_USER_STORAGE_IDLE_TIMEOUT", "300")
+)
+
+
+@dataclass(**KWONLY_SLOTS)
+class StorageMetrics:
+    """Metrics of the user storage cache.
+
+    Attributes:
+        hits (int): The number of user storage accesses which were served from memory.
+        misses (int): The number of user storage accesses which had to load the data from the storage backend.
+        evictions (int): The number of user storages which have been unloaded from memory.
+        cached (int): The number of user storages currently kept in memory.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    cached: int = 0
+
+
+metrics = StorageMetrics()
+
 request_contextvar: contextvars.ContextVar[Optional[Request]] = contextvars.ContextVar(
     "request_var", default=None
 )
@@ -58,69 +110,515 @@ class ReadOnlyDict(MutableMapping):
         return len(self._data)
 
 
+class StorageBackend(abc.ABC):
+    """
+    Abstract base class for the persistence layer of `app.storage.user` and `app.storage.general`.
+
+    A backend stores JSON documents under string keys like "storage-general" or "storage-user-<session ID>".
+    Backends can additionally keep a journal of JSON records per key by implementing `append` and `read_journal`.
+    The records are appended after the document has been written and replayed when it is read.
+    Its methods are called from a thread pool and must therefore be thread-safe.
+    """
+
+    @abc.abstractmethod
+    def read(self, key: str) -> Optional[str]:
+        """Return the JSON document stored under the given key or `None` if there is none."""
+
+    @abc.abstractmethod
+    def write(self, key: str, text: str) -> None:
+        """Store the JSON document under the given key and discard its journal."""
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete the JSON document and the journal stored under the given key (if any)."""
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Delete all JSON documents and journals."""
+
+    @property
+    def supports_journal(self) -> bool:
+        """Whether the backend implements `append` and `read_journal`."""
+        return (
+            type(self).append is not StorageBackend.append
+            and type(self).read_journal is not StorageBackend.read_journal
+        )
+
+    def read_journal(self, key: str) -> List[str]:
+        """Return the journal records appended for the given key since the document has been written."""
+        raise NotImplementedError(f"{type(self).__name__} does not support journals")
+
+    def append(self, key: str, records: List[str]) -> None:
+        """Append records to the journal of the given key."""
+        raise NotImplementedError(f"{type(self).__name__} does not support journals")
+
+    def close(self) -> None:
+        """Release all resources of the backend."""
+
+
+class FileBackend(StorageBackend):
+    """
+    Storage backend which writes one JSON file per key into a directory.
+
+    Files are replaced atomically by writing to a temporary file first.
+
+    Args:
+        path (Path): The directory containing the JSON files.
+        encoding (Optional[str]): The encoding to use when reading and writing the files.
+    """
+
+    def __init__(self, path: Path, encoding: Optional[str] = None) -> None:
+        self.path = path
+        self.encoding = encoding
+
+    def filepath(self, key: str) -> Path:
+        """Return the path of the file for the given key."""
+        return self.path / f"{key}.json"
+
+    def journal_path(self, key: str) -> Path:
+        """Return the path of the journal file for the given key."""
+        return self.path / f"{key}.journal"
+
+    def read(self, key: str) -> Optional[str]:
+        filepath = self.filepath(key)
+        return filepath.read_text(self.encoding) if filepath.exists() else None
+
+    def write(self, key: str, text: str) -> None:
+        filepath = self.filepath(key)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = filepath.with_name(f".{filepath.name}.{uuid.uuid4().hex}.tmp")
+        temporary_path.write_text(text, encoding=self.encoding)
+        os.replace(temporary_path, filepath)
+        self.journal_path(key).unlink(missing_ok=True)
+
+    def delete(self, key: str) -> None:
+        self.filepath(key).unlink(missing_ok=True)
+        self.journal_path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        for filepath in [
+            *self.path.glob("storage-*.json"),
+            *self.path.glob("storage-*.journal"),
+        ]:
+            filepath.unlink()
+
+    def read_journal(self, key: str) -> List[str]:
+        journal_path = self.journal_path(key)
+        return (
+            journal_path.read_text(self.encoding).splitlines()
+            if journal_path.exists()
+            else []
+        )
+
+    def append(self, key: str, records: List[str]) -> None:
+        journal_path = self.journal_path(key)
+        journal_path.parent.mkdir(parents=True, exist_ok=True)
+        with journal_path.open("a", encoding=self.encoding) as f:
+            f.write("".join(f"{record}\n" for record in records))
+
+
+class SqliteBackend(StorageBackend):
+    """
+    Storage backend which keeps all JSON documents in a single SQLite database.
+
+    The database is used in write-ahead logging (WAL) mode, so reads are not blocked by concurrent writes.
+    This scales to large numbers of user storages, which would otherwise result in just as many files.
+
+    Args:
+        filepath (Path): The path to the database file.
+    """
+
+    def __init__(self, filepath: Path) -> None:
+        self.filepath = filepath
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._is_closed = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._is_closed:
+            raise RuntimeError(
+                f"The SQLite storage backend {self.filepath} has been closed"
+            )
+        if self._connection is None:
+            self.filepath.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(
+                self.filepath, check_same_thread=False, isolation_level=None
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS storage (key TEXT PRIMARY KEY, data TEXT NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS journal (id INTEGER PRIMARY KEY AUTOINCREMENT, key TEXT NOT NULL, record TEXT NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS journal_key ON journal (key, id)"
+            )
+        return self._connection
+
+    def _execute_in_transaction(self, *statements: Tuple[str, Tuple[Any, ...]]) -> None:
+        connection = self._connect()
+        connection.execute("BEGIN")
+        try:
+            for sql, parameters in statements:
+                connection.execute(sql, parameters)
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def read(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT data FROM storage WHERE key = ?", (key,))
+                .fetchone()
+            )
+        return None if row is None else row[0]
+
+    def write(self, key: str, text: str) -> None:
+        with self._lock:
+            self._execute_in_transaction(
+                (
+                    "INSERT OR REPLACE INTO storage (key, data) VALUES (?, ?)",
+                    (key, text),
+                ),
+                ("DELETE FROM journal WHERE key = ?", (key,)),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._execute_in_transaction(
+                ("DELETE FROM storage WHERE key = ?", (key,)),
+                ("DELETE FROM journal WHERE key = ?", (key,)),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._execute_in_transaction(
+                ("DELETE FROM storage", ()),
+                ("DELETE FROM journal", ()),
+            )
+
+    def read_journal(self, key: str) -> List[str]:
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute("SELECT record FROM journal WHERE key = ? ORDER BY id", (key,))
+                .fetchall()
+            )
+        return [row[0] for row in rows]
+
+    def append(self, key: str, records: List[str]) -> None:
+        with self._lock:
+            self._execute_in_transaction(
+                *(
+                    ("INSERT INTO journal (key, record) VALUES (?, ?)", (key, record))
+                    for record in records
+                )
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._is_closed = True
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
 class PersistentDict(observables.ObservableDict):
     """
-    A dictionary-like object that persists its data to a file.
+    A dictionary-like object that persists its data to a file or another storage backend.
 
     This class extends the `ObservableDict` class and adds the ability to persist
-    the data to a file specified by the `filepath` parameter. The data is stored
-    in JSON format.
+    the data to a file specified by the `filepath` parameter
+    or under the given `key` of a storage backend. The data is stored in JSON format.
+
+    Changes are written behind: a burst of changes results in a single write
+    once the dictionary has been idle for `write_delay` seconds, but at most `max_write_delay` seconds after the first change.
+    The data is serialized on the event loop and the resulting text is written in a separate thread,
+    where the file is replaced atomically.
+
+    In journal mode, only the changed values are appended to a journal, which is replayed when loading the data.
+    Once the journal has grown beyond `JOURNAL_COMPACTION_SIZE` bytes and the size of the last snapshot,
+    it is compacted by writing a new snapshot of the whole dictionary.
 
     Parameters:
-        filepath (Path): The path to the file where the data will be stored.
+        filepath (Optional[Path]): The path to the file where the data will be stored (if no backend is given).
         encoding (Optional[str]): The encoding to use when reading and writing the file.
+        backend (Optional[StorageBackend]): The storage backend to use instead of a file.
+        key (Optional[str]): The key of the data within the storage backend.
+        write_delay (Optional[float]): The idle time before changes are written (default: `STORAGE_WRITE_DELAY`).
+        max_write_delay (Optional[float]): The maximum delay of a write (default: `STORAGE_MAX_WRITE_DELAY`).
+        journal (Optional[bool]): Whether to append changes to a journal (default: `STORAGE_JOURNAL`).
 
     Attributes:
-        filepath (Path): The path to the file where the data is stored.
+        filepath (Optional[Path]): The path to the file where the data is stored (if no backend was given).
         encoding (Optional[str]): The encoding used when reading and writing the file.
+        backend (StorageBackend): The storage backend.
+        key (str): The key of the data within the storage backend.
+        write_delay (float): The idle time before changes are written.
+        max_write_delay (float): The maximum delay of a write.
+        journal (bool): Whether changes are appended to a journal.
     """
 
-    def __init__(self, filepath: Path, encoding: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        filepath: Optional[Path] = None,
+        encoding: Optional[str] = None,
+        *,
+        backend: Optional[StorageBackend] = None,
+        key: Optional[str] = None,
+        write_delay: Optional[float] = None,
+        max_write_delay: Optional[float] = None,
+        journal: Optional[bool] = None,
+    ) -> None:
         """
         Initialize a new instance of PersistentDict.
 
         Args:
-            filepath (Path): The path to the file where the data will be stored.
+            filepath (Optional[Path]): The path to the file where the data will be stored (if no backend is given).
             encoding (Optional[str]): The encoding to use when reading and writing the file.
+            backend (Optional[StorageBackend]): The storage backend to use instead of a file.
+            key (Optional[str]): The key of the data within the storage backend.
+            write_delay (Optional[float]): The idle time before changes are written.
+            max_write_delay (Optional[float]): The maximum delay of a write.
+            journal (Optional[bool]): Whether to append changes to a journal.
         """
+        if backend is None:
+            if filepath is None:
+                raise ValueError("Either a filepath or a storage backend is required")
+            backend = FileBackend(filepath.parent, encoding=encoding)
+            key = filepath.stem
+        elif key is None:
+            raise ValueError("A key is required when using a storage backend")
         self.filepath = filepath
         self.encoding = encoding
+        self.backend = backend
+        self.key = key
+        self.write_delay = STORAGE_WRITE_DELAY if write_delay is None else write_delay
+        self.max_write_delay = (
+            STORAGE_MAX_WRITE_DELAY if max_write_delay is None else max_write_delay
+        )
+        self.journal = STORAGE_JOURNAL if journal is None else journal
+        if self.journal and not backend.supports_journal:
+            log.warning(
+                f"{type(backend).__name__} does not support journals, storage {key} is written as a whole"
+            )
+            self.journal = False
+        self._dirty = False
+        self._writing = False
+        # NOTE: writes are taken on the event loop and executed in order by whichever thread drains the queue first
+        self._write_queue: Deque[Callable[[], None]] = deque()
+        self._write_lock = threading.Lock()
+        self._first_change_time: Optional[float] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._journal_records: List[str] = []
+        self._needs_snapshot = False
         try:
-            data = json.loads(filepath.read_text(encoding)) if filepath.exists() else {}
+            text = backend.read(key)
+            data = {} if text is None else json.loads(text)
+            records = backend.read_journal(key) if backend.supports_journal else []
         except Exception:
-            log.warning(f"Could not load storage file {filepath}")
-            data = {}
-        super().__init__(data, on_change=self.backup)
+            log.warning(f"Could not load storage {key}")
+            text, data, records = None, {}, []
+        if not _replay_journal(data, records, key):
+            # NOTE: the next write replaces the corrupt journal, so later records are not appended to it
+            self._needs_snapshot = True
+        self._snapshot_size = len(text or "")
+        self._journal_size = sum(map(len, records))
+        super().__init__(data, on_change=self._handle_change_event)
+
+    def _handle_change_event(self, e: events.ObservableChangeEventArguments) -> None:
+        if self.journal and not self._needs_snapshot:
+            if e.path:
+                self._record_change(e.path, e.action)
+            else:
+                # NOTE: the whole dictionary has changed
+                self._needs_snapshot = True
+        self.backup()
+
+    def _record_change(self, path: Tuple[Any, ...], action: str) -> None:
+        if action == "delete":
+            self._journal_records.append(json.dumps([action, list(path)]))
+            return
+        try:
+            value: Any = self
+            for key in path:
+                value = (
+                    dict.__getitem__(value, key)
+                    if isinstance(value, dict)
+                    else list.__getitem__(value, key)
+                )
+        except (KeyError, IndexError, TypeError):
+            # NOTE: e.g. changes of sets, which have no journal representation
+            self._needs_snapshot = True
+            return
+        try:
+            self._journal_records.append(json.dumps([action, list(path), value]))
+        except (TypeError, ValueError):
+            log.warning(
+                f"Could not record change of storage {self.key}, a snapshot is written instead"
+            )
+            self._needs_snapshot = True
 
     def backup(self) -> None:
         """
-        Back up the data to the given file path.
+        Schedule a backup of the data to the storage backend.
 
         This method is automatically called whenever the data in the dictionary changes.
-        It writes the current state of the dictionary to the file specified by `filepath`.
-        If the file does not exist, it will be created. If the dictionary is empty, no
-        backup will be performed.
+        The current state of the dictionary is written to the file specified by `filepath`
+        (or to the storage backend) after the write delay (see above).
+        If the file does not exist, it will be created. If the dictionary is empty,
+        the file will be deleted.
 
         Note:
             This method is intended to be used internally. In most cases, you don't need
             to call it manually.
+        """
+        if core.loop is None:
+            if not self._dirty:
+                core.app.on_startup(self._save)
+            self._dirty = True
+            return
+        self._dirty = True
+        now = core.loop.time()
+        if self._first_change_time is None:
+            self._first_change_time = now
+        if self._timer is not None:
+            self._timer.cancel()
+        delay = min(
+            self.write_delay, self._first_change_time + self.max_write_delay - now
+        )
+        self._timer = core.loop.call_later(max(delay, 0.0), self._start_saving)
 
-        Raises:
-            OSError: If an error occurs while writing the data to the file.
+    def flush(self) -> None:
+        """
+        Write pending changes to the file immediately.
+
+        This method blocks until the file has been written, e.g. when shutting down the server.
+        A write which is already running in a separate thread is waited for or taken over.
         """
-        if not self.filepath.exists():
-            if not self:
-                return
-            self.filepath.parent.mkdir(exist_ok=True)
+        self._cancel_timer()
+        self._take_write()
+        self._drain_writes()
+
+    def _save_now(self) -> None:
+        """Start writing pending changes without waiting for the write delay."""
+        if not self._dirty or core.loop is None:
+            return
+        self._cancel_timer()
+        self._start_saving()
+
+    def _discard_pending_write(self) -> None:
+        self._cancel_timer()
+        self._dirty = False
+        self._journal_records.clear()
+        self._write_queue.clear()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._first_change_time = None
+
+    def _start_saving(self) -> None:
+        self._timer = None
+        if self._writing:
+            return  # NOTE: the running write starts another one when it is done
+        background_tasks.create(self._save(), name=f"backup {self.key}")
+
+    async def _save(self) -> None:
+        self._writing = True
+        self._first_change_time = None
+        try:
+            self._take_write()
+            # NOTE: when stopping, the queued write is not run here but by `Storage.flush()`
+            await run.io_bound(self._drain_writes)
+        finally:
+            self._writing = False
+        if self._dirty and self._timer is None and not core.app.is_stopping:
+            self._start_saving()
+
+    def _drain_writes(self) -> None:
+        """Pass all queued writes to the storage backend (called in a separate thread or by `flush()`)."""
+        with self._write_lock:
+            while self._write_queue:
+                self._write_queue.popleft()()
+
+    def _take_write(self) -> None:
+        """Serialize pending changes on the event loop and queue the write for the storage backend."""
+        if not self._dirty:
+            return
+        if self.journal:
+            self._write_queue.append(self._take_journal_write())
+            return
+        self._dirty = False
+        if not self:
+            self._write_queue.append(partial(self.backend.delete, self.key))
+            return
+        text = json.dumps(self)
+        self._write_queue.append(partial(self.backend.write, self.key, text))
+
+    def _take_journal_write(self) -> Callable[[], None]:
+        """Take the pending journal records (or a snapshot) on the event loop and return the write for the backend."""
+        if not self._dirty:
+            return lambda: None
+        self._dirty = False
+        records, self._journal_records = self._journal_records, []
+        if not self:
+            self._needs_snapshot = False
+            self._snapshot_size = self._journal_size = 0
+            return partial(self.backend.delete, self.key)
+        journal_size = self._journal_size + sum(map(len, records))
+        if self._needs_snapshot or journal_size > max(
+            JOURNAL_COMPACTION_SIZE, self._snapshot_size
+        ):
+            # NOTE: the snapshot is serialized right away to be consistent with the records taken so far
+            text = json.dumps(self)
+            self._needs_snapshot = False
+            self._snapshot_size = len(text)
+            self._journal_size = 0
+            return partial(self.backend.write, self.key, text)
+        self._journal_size = journal_size
+        return (
+            partial(self.backend.append, self.key, records) if records else lambda: None
+        )
 
-        async def backup() -> None:
-            async with aiofiles.open(self.filepath, "w", encoding=self.encoding) as f:
-                await f.write(json.dumps(self))
 
-        if core.loop:
-            background_tasks.create_lazy(backup(), name=self.filepath.stem)
-        else:
-            core.app.on_startup(backup())
+def _replay_journal(data: Dict, records: List[str], key: str) -> bool:
+    """Apply journal records of the form `[action, path, value]` to the given data and return whether all could be applied."""
+    for i, record in enumerate(records):
+        try:
+            action, path, *value = json.loads(record)
+            container: Any = data
+            for path_key in path[:-1]:
+                container = container[_container_key(container, path_key)]
+            last_key = _container_key(container, path[-1])
+            if action == "delete":
+                if isinstance(container, dict):
+                    container.pop(last_key, None)
+                else:
+                    del container[last_key]
+            elif action == "insert" and isinstance(container, list):
+                container.insert(last_key, value[0])
+            else:
+                container[last_key] = value[0]
+        except Exception:
+            # NOTE: e.g. the last record has not been written completely
+            log.warning(f"Could not replay journal record {i} of storage {key}")
+            return False
+    return True
+
+
+def _container_key(container: Any, key: Any) -> Any:
+    # NOTE: JSON object keys are always strings
+    return (
+        key
+        if not isinstance(container, dict) or isinstance(key, str)
+        else json.dumps(key)
+    )
 
 
 class RequestTrackingMiddleware(BaseHTTPMiddleware):
@@ -196,15 +694,48 @@ class Storage:
     - user: Individual user storage that is persisted on the server (where NiceGUI is executed).
       The data is stored in a file on the server and is shared between all browser tabs by identifying the user via session cookie ID.
     - general: General storage shared between all users that is persisted on the server.
+
+    The user and general storage are persisted by a storage backend (see `backend`),
+    which is chosen with the environment variable `NICEGUI_STORAGE_BACKEND` ("file" or "sqlite").
+    Only the most recently used user storages are kept in memory (see `MAX_CACHED_USER_STORAGES`).
+    User storages of sessions without connected clients are unloaded after `USER_STORAGE_IDLE_TIMEOUT` seconds
+    and reloaded on the next access.
     """
 
     def __init__(self) -> None:
         self.path = Path(os.environ.get("NICEGUI_STORAGE_PATH", ".nicegui")).resolve()
         self.migrate_to_utf8()
-        self._general = PersistentDict(
-            self.path / "storage-general.json", encoding="utf-8"
+        self._backend: StorageBackend = (
+            SqliteBackend(self.path / "storage.db")
+            if STORAGE_BACKEND == "sqlite"
+            else FileBackend(self.path, encoding="utf-8")
         )
-        self._users: Dict[str, PersistentDict] = {}
+        self._general = PersistentDict(backend=self._backend, key="storage-general")
+        self._users: "OrderedDict[str, PersistentDict]" = OrderedDict()
+        self._access_times: Dict[str, float] = {}
+        # NOTE: user storages dropped from the cache are reused as long as they are referenced, e.g. by bindings
+        self._loaded_users: "weakref.WeakValueDictionary[str, PersistentDict]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._is_used = False
+
+    @property
+    def backend(self) -> StorageBackend:
+        """The storage backend for the user and general storage.
+
+        It can be replaced with a custom `StorageBackend` before the storage is used for the first time.
+        """
+        return self._backend
+
+    @backend.setter
+    def backend(self, backend: StorageBackend) -> None:
+        if self._is_used:
+            raise RuntimeError(
+                "The storage backend can only be replaced before the user or general storage is used"
+            )
+        self._backend.close()
+        self._backend = backend
+        self._general = PersistentDict(backend=backend, key="storage-general")
 
     @property
     def browser(self) -> Union[ReadOnlyDict, Dict]:
@@ -274,12 +805,61 @@ class Storage:
             raise RuntimeError(
                 "app.storage.user needs a storage_secret passed in ui.run()"
             )
-        session_id = request.session["id"]
-        if session_id not in self._users:
-            self._users[session_id] = PersistentDict(
-                self.path / f"storage-user-{session_id}.json", encoding="utf-8"
+        return self._get_user_storage(request.session["id"])
+
+    def _get_user_storage(self, session_id: str) -> PersistentDict:
+        self._is_used = True
+        persistent_dict = self._users.get(session_id)
+        if persistent_dict is None:
+            persistent_dict = self._loaded_users.get(session_id)
+        if persistent_dict is None:
+            metrics.misses += 1
+            persistent_dict = PersistentDict(
+                backend=self._backend, key=f"storage-user-{session_id}"
             )
-        return self._users[session_id]
+            self._loaded_users[session_id] = persistent_dict
+        else:
+            metrics.hits += 1
+        self._users[session_id] = persistent_dict
+        self._users.move_to_end(session_id)
+        self._access_times[session_id] = time.time()
+        while len(self._users) > MAX_CACHED_USER_STORAGES:
+            self._evict(next(iter(self._users)))
+        metrics.cached = len(self._users)
+        return persistent_dict
+
+    def _evict(self, session_id: str) -> None:
+        """Unload the user storage of the given session after starting to write its pending changes."""
+        persistent_dict = self._users.pop(session_id)
+        del self._access_times[session_id]
+        # NOTE: the pending write keeps the storage alive until it is done
+        persistent_dict._save_now()  # pylint: disable=protected-access
+        metrics.evictions += 1
+
+    def prune_user_storages(self) -> None:
+        """Unload user storages of sessions without connected clients which have not been accessed for a while."""
+        from .client import Client  # pylint: disable=import-outside-toplevel, cyclic-import
+
+        connected_session_ids = {
+            client.session_id
+            for client in Client.instances.values()
+            if client.has_socket_connection
+        }
+        deadline = time.time() - USER_STORAGE_IDLE_TIMEOUT
+        for session_id, access_time in list(self._access_times.items()):
+            if access_time < deadline and session_id not in connected_session_ids:
+                self._evict(session_id)
+        metrics.cached = len(self._users)
+
+    async def prune_loop(self) -> None:
+        """Prune idle user storages in an endless loop."""
+        while True:
+            try:
+                self.prune_user_storages()
+            except Exception:
+                # NOTE: make sure the loop doesn't crash
+                log.exception("Error while pruning user storages")
+            await asyncio.sleep(10)
 
     @staticmethod
     def _is_in_auto_index_context() -> bool:
@@ -312,6 +892,7 @@ class Storage:
             >>> print(general_storage)
             {'key': 'value'}
         """
+        self._is_used = True
         return self._general
 
     def clear(self) -> None:
@@ -319,8 +900,7 @@ class Storage:
         Clears all storage.
 
         This method clears all the data stored in the storage object. It removes all the data from the
-        `_general` and `_users` dictionaries, and also deletes any storage files present in the `path`
-        directory that match the pattern 'storage-*.json'.
+        `_general` and `_users` dictionaries, and also deletes all data of the storage backend.
 
         Usage:
             storage.clear()
@@ -329,9 +909,21 @@ class Storage:
             None
         """
         self._general.clear()
+        for persistent_dict in self._persistent_dicts():
+            persistent_dict._discard_pending_write()  # pylint: disable=protected-access
         self._users.clear()
-        for filepath in self.path.glob("storage-*.json"):
-            filepath.unlink()
+        self._access_times.clear()
+        self._loaded_users.clear()
+        self._backend.clear()
+        metrics.cached = 0
+
+    def flush(self) -> None:
+        """Write all pending changes of the general and user storage to disk immediately."""
+        for persistent_dict in self._persistent_dicts():
+            persistent_dict.flush()
+
+    def _persistent_dicts(self) -> List[PersistentDict]:
+        return [self._general, *self._loaded_users.values()]
 
     def migrate_to_utf8(self) -> None:
         """Migrates storage files from system's default encoding to UTF-8.
@@ -10,7 +10,7 @@ from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from starlette.routing import Route
 
-from nicegui import Client, app, binding, core
+from nicegui import Client, app, binding, client, core, outbox
 from nicegui.page import page
 
 from .screen import Screen
@@ -77,6 +77,8 @@ def reset_globals() -> Generator[None, None, None]:
     # NOTE we need to re-add the auto index route because we removed all routes above
     app.get("/")(Client.auto_index_client.build_response)
     binding.reset()
+    outbox.reset()
+    client.render_cache.clear()
     yield
 
 
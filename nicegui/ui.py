@@ -89,6 +89,7 @@ __all__ = [
     'tree',
     'upload',
     'video',
+    'virtual_list',
     'download',
     'add_body_html',
     'add_head_html',
@@ -201,6 +202,7 @@ from .elements.tooltip import Tooltip as tooltip
 from .elements.tree import Tree as tree
 from .elements.upload import Upload as upload
 from .elements.video import Video as video
+from .elements.virtual_list import VirtualList as virtual_list
 from .functions.download import download
 from .functions.html import add_body_html, add_head_html
 from .functions.javascript import run_javascript
@@ -31,6 +31,7 @@ def run(
     dark: Optional[bool] = False,
     language: Language = "en-US",
     binding_refresh_interval: float = 0.1,
+    message_flush_interval: float = 0.01,
     reconnect_timeout: float = 3.0,
     show: bool = True,
     on_air: Optional[Union[str, Literal[True]]] = None,
@@ -69,6 +70,7 @@ def run(
 
     - language: language for Quasar elements (default: `'en-US'`)
     - binding_refresh_interval: time between binding updates (default: `0.1` seconds, bigger is more CPU friendly)
+    - message_flush_interval: time to collect further changes before sending them to the browser (default: `0.01` seconds)
     - reconnect_timeout: maximum time the server waits for the browser to reconnect (default: 3.0 seconds)
     - show: automatically open the UI in a browser tab (default: `True`)
 
@@ -107,6 +109,7 @@ def run(
         dark=dark,
         language=language,
         binding_refresh_interval=binding_refresh_interval,
+        message_flush_interval=message_flush_interval,
         reconnect_timeout=reconnect_timeout,
         tailwind=tailwind,
         prod_js=prod_js,
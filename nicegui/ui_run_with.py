@@ -19,6 +19,7 @@ def run_with(
     dark: Optional[bool] = False,
     language: Language = "en-US",
     binding_refresh_interval: float = 0.1,
+    message_flush_interval: float = 0.01,
     reconnect_timeout: float = 3.0,
     mount_path: str = '/',
     on_air: Optional[Union[str, Literal[True]]] = None,
@@ -45,6 +46,8 @@ def run_with(
     :type language: Language
     - binding_refresh_interval: The time between binding updates in seconds. Default is 0.1 seconds. A bigger value is more CPU friendly.
     :type binding_refresh_interval: float
+    - message_flush_interval: The time to collect further changes before sending them to the browser in seconds. Default is 0.01 seconds.
+    :type message_flush_interval: float
     - reconnect_timeout: The maximum time the server waits for the browser to reconnect in seconds. Default is 3.0 seconds.
     :type reconnect_timeout: float
     - mount_path: The path at which NiceGUI should be mounted. Default is '/'.
@@ -65,6 +68,7 @@ def run_with(
         dark=dark,
         language=language,
         binding_refresh_interval=binding_refresh_interval,
+        message_flush_interval=message_flush_interval,
         reconnect_timeout=reconnect_timeout,
         tailwind=tailwind,
         prod_js=prod_js,
@@ -1,10 +1,12 @@
 from datetime import datetime, timedelta
 
 import pandas as pd
+import pytest
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 
 from nicegui import ui
+from nicegui.events import GenericEventArguments
 from nicegui.testing import Screen
 
 
@@ -280,3 +282,145 @@ def test_run_row_method(screen: Screen):
     screen.click("Update")
     screen.should_contain("Alice")
     screen.should_contain("42")
+
+
+def test_transaction():
+    grid = ui.aggrid(
+        {
+            "columnDefs": [{"field": "name"}, {"field": "age"}],
+            "rowData": [{"id": 1, "name": "Alice", "age": 18}],
+        },
+        row_id_field="id",
+    )
+    grid.client.outbox.updates.clear()
+
+    grid.apply_transaction(
+        add=[
+            {"id": 2, "name": "Bob", "age": 21},
+            {"id": 3, "name": "Carol", "age": 32},
+        ],
+        update=[{"id": 1, "name": "Alice", "age": 19}],
+    )
+    grid.apply_transaction(remove=[{"id": 2}])
+    assert grid.options["rowData"] == [
+        {"id": 1, "name": "Alice", "age": 19},
+        {"id": 3, "name": "Carol", "age": 32},
+    ]
+    assert grid.id not in grid.client.outbox.updates
+    deltas = [
+        data
+        for _, message_type, data in grid.client.outbox.messages
+        if message_type == "row_delta"
+    ]
+    assert [delta["path"] for delta in deltas] == [["options", "rowData"]] * 2
+    assert deltas[1]["removed_keys"] == [2]
+
+
+def test_transaction_in_closed_dialog(screen: Screen):
+    with ui.dialog() as dialog, ui.card():
+        grid = ui.aggrid(
+            {
+                "columnDefs": [{"field": "name"}, {"field": "age"}],
+                "rowData": [{"id": 1, "name": "Alice", "age": 18}],
+            },
+            row_id_field="id",
+        )
+    ui.button(
+        "Add",
+        on_click=lambda: grid.apply_transaction(
+            add=[{"id": 2, "name": "Bob", "age": 21}]
+        ),
+    )
+    ui.button("Open", on_click=dialog.open)
+
+    screen.open("/")
+    screen.click("Add")
+    screen.click("Open")
+    screen.should_contain("Alice")
+    screen.should_contain("Bob")
+
+
+def test_transaction_in_browser(screen: Screen):
+    grid = ui.aggrid(
+        {
+            "columnDefs": [{"field": "name"}, {"field": "age"}],
+            "rowData": [{"id": 1, "name": "Alice", "age": 18}],
+        },
+        row_id_field="id",
+    )
+    ui.button(
+        "Add",
+        on_click=lambda: grid.apply_transaction(
+            add=[{"id": 2, "name": "Bob", "age": 21}],
+            update=[{"id": 1, "name": "Alice", "age": 42}],
+        ),
+    )
+    ui.button("Remove", on_click=lambda: grid.apply_transaction(remove=[{"id": 1}]))
+
+    screen.open("/")
+    screen.click("Add")
+    screen.should_contain("Bob")
+    screen.should_contain("42")
+    screen.click("Remove")
+    screen.wait(0.5)
+    screen.should_not_contain("Alice")
+    screen.should_contain("Bob")
+
+
+def test_datasource(screen: Screen):
+    df = pd.DataFrame({"name": [f"Person {i}" for i in range(100_000)], "age": 42})
+    ui.aggrid.from_pandas(df, server_side=True)
+
+    screen.open("/")
+    screen.should_contain("Person 0")
+    screen.should_not_contain("Person 99999")
+
+
+def test_failing_datasource_resolves_request(monkeypatch: pytest.MonkeyPatch):
+    def datasource(_):
+        raise RuntimeError("datasource failed")
+
+    grid = ui.aggrid({"columnDefs": [{"field": "name"}]}, datasource=datasource)
+    calls = []
+    monkeypatch.setattr(
+        grid, "run_method", lambda name, *args: calls.append((name, *args))
+    )
+
+    args = {"request_id": 1, "start": 0, "stop": 100}
+    with pytest.raises(RuntimeError):
+        grid._handle_rows_request(  # pylint: disable=protected-access
+            GenericEventArguments(sender=grid, client=grid.client, args=args)
+        )
+    assert calls == [("resolve_rows", 1, None)]
+
+
+def test_datasource_applies_filters_and_sorting():
+    # pylint: disable=import-outside-toplevel
+    from nicegui.elements.aggrid import AgGridRequest, _slice_dataframe
+
+    df = pd.DataFrame(
+        {"name": ["Alice", "Bob", "Carol", "Dan"], "age": [18, 21, 42, 35]}
+    )
+    request = AgGridRequest(
+        start=0,
+        stop=10,
+        sort_model=[{"colId": "age", "sort": "desc"}],
+        filter_model={
+            "name": {"filterType": "text", "type": "notContains", "filter": "b"},
+            "age": {
+                "filterType": "number",
+                "operator": "OR",
+                "conditions": [
+                    {"filterType": "number", "type": "lessThan", "filter": 20},
+                    {
+                        "filterType": "number",
+                        "type": "greaterThanOrEqual",
+                        "filter": 40,
+                    },
+                ],
+            },
+        },
+    )
+    rows, total = _slice_dataframe(df, request)
+    assert rows == [{"name": "Carol", "age": 42}, {"name": "Alice", "age": 18}]
+    assert total == 2
@@ -1,8 +1,12 @@
+import asyncio
+import gc
 from typing import Dict
 
+import pytest
 from selenium.webdriver.common.keys import Keys
 
-from nicegui import ui
+from nicegui import binding, ui
+from nicegui.observables import ObservableDict
 from nicegui.testing import Screen
 
 
@@ -108,3 +112,149 @@ def test_missing_target_attribute(screen: Screen):
 
     screen.open("/")
     screen.should_contain("text='Hello'")
+
+
+def test_observable_dict_is_not_polled():
+    data = ObservableDict({"text": "one"})
+    label = ui.label().bind_text_from(data, "text")
+    assert label.text == "one"
+    assert not binding.active_links
+
+    data["text"] = "two"
+    assert label.text == "two"
+
+    binding.remove([label])
+    assert not binding.observed_collections
+    assert data.change_handlers == []
+
+
+def test_bindable_dataclass():
+    @binding.bindable_dataclass
+    class Model:
+        text: str = "one"
+        count: int = 0
+
+    model = Model()
+    label = ui.label().bind_text_from(model, "text")
+    number = ui.number().bind_value(model, "count")
+    assert not binding.active_links
+
+    model.text = "two"
+    assert label.text == "two"
+    number.value = 42
+    assert model.count == 42
+    assert model == Model(text="two", count=42)
+
+
+def test_bindings_keep_their_objects_alive():
+    class Model:
+        value = 1
+
+    def build():
+        model = Model()
+        ui.slider(min=0, max=10).bind_value(model, "value")
+        return ui.label().bind_text_from(model, "value", str)
+
+    label = build()
+    slider = next(
+        element
+        for element in label.client.elements.values()
+        if isinstance(element, ui.slider)
+    )
+    gc.collect()
+    slider.value = 5
+    binding._refresh_step()  # pylint: disable=protected-access
+    assert label.text == "5"
+
+    binding.remove([slider, label])
+    assert not binding.active_links
+    assert not binding.bindings
+    assert not binding.links_by_object
+
+
+def test_removing_an_object_only_touches_its_links():
+    data = {"a": "1", "b": "2"}
+    label_a = ui.label().bind_text_from(data, "a")
+    label_b = ui.label().bind_text_from(data, "b")
+    assert len(binding.links_by_object[id(data)]) == 2
+
+    binding.remove([label_a])
+    assert id(label_a) not in binding.links_by_object
+    assert len(binding.links_by_object[id(data)]) == 1
+    assert list(binding.active_links) == [(id(data), "b")]
+    assert label_b.text == "2"
+
+
+def test_batch_collapses_repeated_writes():
+    changes = []
+
+    class Model:
+        value = binding.BindableProperty(
+            on_change=lambda _, value: changes.append(value)
+        )
+
+        def __init__(self):
+            self.value = 0
+
+    model = Model()
+    label = ui.label().bind_text_from(model, "value", str)
+
+    with binding.batch():
+        for i in range(1, 1001):
+            model.value = i
+        assert model.value == 1000
+        assert label.text == "0"
+    assert label.text == "1000"
+    assert changes == [1000]
+
+    with binding.batch():
+        model.value = 1
+        model.value = 1000
+    assert changes == [1000]
+
+
+async def test_batch_is_bound_to_the_current_task():
+    changes = []
+
+    class Model:
+        value = binding.BindableProperty(
+            on_change=lambda _, value: changes.append(value)
+        )
+
+        def __init__(self):
+            self.value = 0
+
+    model = Model()
+    released = asyncio.Event()
+
+    async def batched_task():
+        with binding.batch():
+            model.value = 1
+            await released.wait()
+
+    task = asyncio.create_task(batched_task())
+    await asyncio.sleep(0)
+    Model().value = 2
+    assert changes == [2], "other tasks are not held back by the batch"
+
+    released.set()
+    await task
+    assert changes == [2, 1]
+
+
+def test_failing_notification_does_not_drop_other_writes():
+    class Model:
+        value = binding.BindableProperty(on_change=lambda *_: 1 / 0)
+        other = binding.BindableProperty()
+
+        def __init__(self):
+            self.value = 0
+            self.other = 0
+
+    model = Model()
+    label = ui.label().bind_text_from(model, "other", str)
+    with pytest.raises(ZeroDivisionError):
+        with binding.batch():
+            model.value = 1
+            model.other = 2
+    assert label.text == "2"
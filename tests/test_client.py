@@ -0,0 +1,96 @@
+import json
+
+import pytest
+from starlette.requests import Request
+
+from nicegui import Client, client, core, ui
+from nicegui.page import page
+
+
+@pytest.fixture(autouse=True)
+def run_config(monkeypatch: pytest.MonkeyPatch):
+    config = {
+        "reload": False,
+        "title": "NiceGUI",
+        "viewport": "width=device-width, initial-scale=1",
+        "favicon": None,
+        "dark": False,
+        "language": "en-US",
+        "binding_refresh_interval": 0.1,
+        "message_flush_interval": 0.01,
+        "reconnect_timeout": 3.0,
+        "tailwind": True,
+        "prod_js": True,
+        "show_welcome_message": False,
+        "_has_run_config": True,
+    }
+    for name, value in config.items():
+        monkeypatch.setattr(core.app.config, name, value, raising=False)
+
+
+def test_identical_pages_are_rendered_once():
+    request = Request(
+        {"type": "http", "method": "GET", "path": "/", "headers": [], "root_path": ""}
+    )
+    responses = []
+    for _ in range(2):
+        with Client(page("/")) as c:
+            ui.label("<Hello>")
+        responses.append((c.id, c.build_response(request).body.decode()))
+
+    assert len(client.render_cache) == 1
+    (id_1, html_1), (id_2, html_2) = responses
+    assert id_1 in html_1 and id_2 not in html_1
+    assert html_1.replace(id_1, id_2) == html_2
+    assert "&lt;Hello&gt;" in html_1
+
+
+def test_pages_embedding_the_client_id_are_rendered_once():
+    request = Request(
+        {"type": "http", "method": "GET", "path": "/", "headers": [], "root_path": ""}
+    )
+    responses = []
+    for _ in range(2):
+        with Client(page("/")) as c:
+            upload = ui.upload()
+        responses.append((c.id, c.build_response(request).body.decode()))
+        assert f"/_nicegui/client/{c.id}/upload/{upload.id}" in responses[-1][1]
+
+    assert len(client.render_cache) == 1
+    (id_1, html_1), (id_2, html_2) = responses
+    assert html_1.replace(id_1, id_2) == html_2
+
+
+async def test_large_pages_are_streamed(monkeypatch):
+    monkeypatch.setattr(client, "STREAMING_RENDER_THRESHOLD", 10)
+    monkeypatch.setattr(client, "STREAMING_RENDER_CHUNK_SIZE", 4)
+    request = Request(
+        {"type": "http", "method": "GET", "path": "/", "headers": [], "root_path": ""}
+    )
+    with Client(page("/", title="Test")) as c:
+        for i in range(20):
+            ui.label(f"<{i}>")
+    response = c.build_response(request)
+    chunks = [chunk async for chunk in response.body_iterator]
+    html = "".join(chunks)
+
+    assert len(chunks) > 5
+    assert not client.render_cache
+    assert c.id in html
+    assert "&lt;19&gt;" in html
+    raw_elements = html.split("String.raw`")[1].split("`;")[0]
+    assert len(json.loads(raw_elements)) == len(c.elements)
+
+
+def test_content_of_lazy_containers_is_not_rendered():
+    request = Request(
+        {"type": "http", "method": "GET", "path": "/", "headers": [], "root_path": ""}
+    )
+    with Client(page("/")) as c:
+        with ui.dialog(lazy=True):
+            ui.label("Hidden content")
+        ui.label("Visible content")
+    html = c.build_response(request).body.decode()
+
+    assert "Visible content" in html
+    assert "Hidden content" not in html
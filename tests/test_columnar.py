@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+
+from nicegui import columnar, json, ui
+
+
+def test_round_trip():
+    df = pd.DataFrame(
+        {
+            "int": [1, 2, 3],
+            "float": [0.5, np.nan, 2.0],
+            "bool": [True, False, True],
+            "text": ["a", "b", "c"],
+            "big": [2**60, 0, 1],
+        }
+    )
+    encoded = columnar.encode_dataframe(df)
+    kinds = dict(
+        zip(encoded["__columns__"]["names"], encoded["__columns__"]["columns"])
+    )
+    assert columnar.is_encoded(kinds["int"])
+    assert columnar.is_encoded(kinds["float"])
+    assert columnar.is_encoded(kinds["bool"])
+    assert kinds["text"] == ["a", "b", "c"]
+    assert kinds["big"] == [
+        2**60,
+        0,
+        1,
+    ], "integers beyond 2**53 are not representable in JavaScript"
+
+    rows = columnar.decode_rows(encoded)
+    expected = df.to_dict("records")
+    assert rows[0] == expected[0]
+    assert np.isnan(rows[1]["float"])
+    assert rows[2] == expected[2]
+
+    array = np.arange(6, dtype=np.float32).reshape(2, 3)
+    encoded_array = columnar.encode_array(array)
+    assert encoded_array is not None
+    assert columnar.decode_array(encoded_array) == array.tolist()
+
+
+def test_encode_arrays_does_not_modify_options():
+    options = {"series": [{"data": np.arange(3)}], "xAxis": {"data": ["a", "b", "c"]}}
+    assert columnar.encode_arrays(options) is options, "small arrays are sent as JSON"
+    encoded = columnar.encode_arrays(options, min_size=0)
+    assert isinstance(options["series"][0]["data"], np.ndarray)
+    assert columnar.is_encoded(encoded["series"][0]["data"])
+    assert (
+        encoded["xAxis"] is options["xAxis"]
+    ), "containers without arrays are not copied"
+
+
+def test_columnar_payload_is_smaller():
+    df = pd.DataFrame(np.random.rand(10_000, 5), columns=list("abcde"))
+    table = ui.table.from_pandas(df)
+    payload = table._to_dict()  # pylint: disable=protected-access
+    columnar_size = len(json.dumps(payload, bytes_as_base64=True))
+    row_size = len(json.dumps(df.to_dict("records")))
+    assert columnar_size < row_size / 2
+
+    assert table.rows[0] == df.iloc[0].to_dict()
+    assert isinstance(table._props["rows"], list)  # pylint: disable=protected-access
+
+
+def test_echart_sends_arrays_as_buffers():
+    chart = ui.echart({"series": [{"type": "line", "data": np.linspace(0, 1, 10_000)}]})
+    options = chart._to_dict()["props"]["options"]  # pylint: disable=protected-access
+    assert columnar.is_encoded(options["series"][0]["data"])
+    assert isinstance(chart.options["series"][0]["data"], np.ndarray)
+
+
+def test_column_labels_are_kept():
+    df = pd.DataFrame({"name": ["Alice"], 42: [1.5]})
+    assert columnar.decode_rows(columnar.encode_dataframe(df)) == df.to_dict("records")
+    table = ui.table.from_pandas(df)
+    assert table.rows == [{"name": "Alice", 42: 1.5}]
@@ -1,3 +1,6 @@
+import gc
+import tracemalloc
+
 import pytest
 from selenium.webdriver.common.by import By
 
@@ -109,6 +112,26 @@ def test_props_parsing():
     }
 
 
+def test_parsing_is_cached():
+    # pylint: disable=protected-access
+    props = 'outlined dense color=primary label="Some label"'
+    style = "width: 12em; height: 34.5em; color: red"
+    ui.element._parse_props.cache_clear()
+    ui.element._parse_style.cache_clear()
+
+    for _ in range(100):
+        ui.element().props(props).style(style)
+    # NOTE: the given string and `None` (for `remove` and `replace`) are parsed once each
+    props_info = ui.element._parse_props.cache_info()
+    style_info = ui.element._parse_style.cache_info()
+    assert (props_info.misses, props_info.hits) == (2, 198)
+    assert (style_info.misses, style_info.hits) == (2, 298)
+
+    assert ui.element._parse_props(props) is ui.element._parse_props(props)
+    with pytest.raises(TypeError):
+        ui.element._parse_props(props)["dense"] = False
+
+
 def test_style(screen: Screen):
     label = ui.label("Some label")
 
@@ -207,6 +230,34 @@ def test_move(screen: Screen):
     )
 
 
+def test_add_children():
+    with ui.card() as card:
+        ui.label("first")
+    column = ui.column()
+    labels = column.add_children(ui.label, ["A", "B", "C"])
+    assert [label.text for label in labels] == ["A", "B", "C"]
+    assert list(column) == labels
+    assert len(list(card)) == 1, "the children are added to the given element only"
+    assert all(label.id in column.client.outbox.updates for label in labels)
+
+    column.add_slot("extra")
+    extra = column.add_children(ui.icon, ["home"], slot="extra")
+    assert column.slots["extra"].children == extra
+
+
+def test_add_children_enqueues_one_parent_update(monkeypatch):
+    column = ui.column()
+    outbox = column.client.outbox
+    outbox.updates.clear()
+    wake_ups = []
+    monkeypatch.setattr(outbox, "wake_up", lambda: wake_ups.append(True))
+
+    labels = column.add_children(ui.label, range(100))
+    assert list(outbox.updates.values()).count(column) == 1
+    assert len(outbox.updates) == len(labels) + 1
+    assert len(wake_ups) == 1
+
+
 def test_xss(screen: Screen):
     ui.label("</script><script>alert(1)</script>")
     ui.label("<b>Bold 1</b>, `code`, copy&paste, multi\nline")
@@ -346,6 +397,47 @@ def test_default_style():
     assert button_f._style.get("padding") == "30px"
 
 
+def test_defaults_are_shared_until_modified():
+    # pylint: disable=protected-access
+    class MyLabel(ui.label):
+        pass
+
+    MyLabel.default_classes("text-red").default_style("color: blue")
+    label_a = MyLabel()
+    label_b = MyLabel()
+    label_c = MyLabel()
+    assert (
+        label_a._class_list is label_b._class_list
+    ), "unmodified elements share their defaults"
+    assert label_a._style_dict is label_b._style_dict
+
+    label_a.classes("font-bold").style("font-size: 200%")
+    assert label_a._classes == ["text-red", "font-bold"]
+    assert label_a._style == {"color": "blue", "font-size": "200%"}
+    assert label_b._classes == ["text-red"], "other elements are not affected"
+    assert label_b._style == {"color": "blue"}
+
+    label_b._classes.append("font-bold")
+    label_b._style["color"] = "red"
+    assert label_b._classes == [
+        "text-red",
+        "font-bold",
+    ], "defaults are copied on first access"
+    assert label_b._style == {"color": "red"}
+    assert label_c._class_list == ["text-red"]
+    assert label_c._style_dict == {"color": "blue"}
+
+
+def test_event_listeners_can_be_modified_in_place():
+    # pylint: disable=protected-access
+    element_a = ui.element()
+    element_b = ui.element()
+    element_a._event_listeners.clear()
+    element_a.on("click", lambda: None)
+    assert len(element_a._event_listeners) == 1
+    assert not element_b._listener_dict
+
+
 def test_invalid_tags(screen: Screen):
     good_tags = ["div", "div-1", "DIV", "däv", "div_x", "🙂"]
     bad_tags = ["<div>", "hi hi", "hi/ho", "foo$bar"]
@@ -377,3 +469,30 @@ def test_update_before_client_connection(screen: Screen):
 
     screen.open("/")
     screen.should_contain("Hello again!")
+
+
+@pytest.mark.parametrize(
+    "factory, max_bytes",
+    [
+        (ui.element, 1500),
+        (ui.label, 1500),
+        (ui.button, 1500),
+        (ui.row, 1500),
+        (lambda: ui.input("Input"), 3000),
+        (lambda: ui.checkbox("Checkbox"), 3000),
+    ],
+)
+def test_memory_per_element(factory, max_bytes):
+    count = 1000
+    factory()  # NOTE: warm up caches and registries
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        elements = [factory() for _ in range(count)]
+        gc.collect()
+        bytes_per_element = (tracemalloc.get_traced_memory()[0] - before) / count
+    finally:
+        tracemalloc.stop()
+    assert len(elements) == count
+    assert bytes_per_element < max_bytes
@@ -1,4 +1,4 @@
-from nicegui import ui
+from nicegui import core, ui
 from nicegui.testing import Screen
 
 
@@ -68,3 +68,36 @@ def test_group(screen: Screen):
     screen.should_not_contain("Content A")
     screen.should_not_contain("Content B")
     screen.should_contain("Content C")
+
+
+def test_lazy_expansion_sends_content_when_opened():
+    with ui.expansion("Expand!", lazy=True) as expansion:
+        label = ui.label("Content")
+    client = expansion.client
+    assert client.deferred_element_ids == {label.id}
+
+    client.outbox.updates.clear()
+    expansion.open()
+    assert not client.deferred_containers
+    assert label.id in client.outbox.updates
+
+
+def test_method_calls_of_deferred_elements_are_held_back(monkeypatch):
+    with ui.expansion("Outer", lazy=True) as outer:
+        with ui.expansion("Inner", lazy=True) as inner:
+            label = ui.label("Content")
+        button = ui.button("Click me")
+    client = outer.client
+    assert client.deferred_element_ids == {inner.id, label.id, button.id}
+    monkeypatch.setattr(core, "loop", object())
+    calls = []
+    monkeypatch.setattr(client, "run_javascript", lambda code, **_: calls.append(code))
+
+    button.run_method("focus")
+    assert not calls
+
+    outer.open()
+    assert client.deferred_element_ids == {
+        label.id
+    }, "the inner expansion is still closed"
+    assert calls == [f'return runMethod({button.id}, "focus", [])']
@@ -65,3 +65,64 @@ def test_json():
         assert (
             orjson_str == builtin_str
         ), f"json serializer implementations do not match: orjson={orjson_str}, built-in={builtin_str}"
+
+
+@pytest.mark.skipif("orjson" not in sys.modules, reason="requires the orjson library.")
+def test_numpy_edge_cases():
+    # pylint: disable=import-outside-toplevel
+    from nicegui.json.builtin_wrapper import dumps as builtin_dumps
+    from nicegui.json.orjson_wrapper import dumps as orjson_dumps
+
+    matrix = np.arange(12.0).reshape(3, 4)
+    tests = [
+        (float("nan"), "null"),
+        ([1.0, float("inf"), -float("inf")], "[1.0,null,null]"),
+        (np.float64("nan"), "null"),
+        (np.float32("inf"), "null"),
+        (np.array([1.0, np.nan, np.inf]), "[1.0,null,null]"),
+        ({"data": np.array([np.nan], dtype=np.float32)}, '{"data":[null]}'),
+        (matrix[:, 1], "[1.0,5.0,9.0]"),
+        (matrix[::2, ::2].T, "[[0.0,8.0],[2.0,10.0]]"),
+        (np.array([1.5, 0.25], dtype=np.float16), "[1.5,0.25]"),
+    ]
+    for test, expected in tests:
+        assert orjson_dumps(test) == expected
+        assert builtin_dumps(test) == expected
+
+
+@pytest.mark.skipif("orjson" not in sys.modules, reason="requires the orjson library.")
+def test_raw_json_is_embedded_verbatim():
+    # pylint: disable=import-outside-toplevel
+    from nicegui.json import RawJSON
+    from nicegui.json.builtin_wrapper import dumps as builtin_dumps
+    from nicegui.json.orjson_wrapper import dumps as orjson_dumps
+
+    payload = {"1": {"props": {"text": "a\x00b"}, "data": np.array([1.0, 2.0])}}
+    raw = RawJSON(orjson_dumps(payload))
+    for dumps in [orjson_dumps, builtin_dumps]:
+        assert dumps(["update", raw], separators=(",", ":")) == orjson_dumps(["update", payload])
+        assert dumps({"event": "update", "data": raw}) == orjson_dumps({"event": "update", "data": payload})
+
+
+@pytest.mark.skipif("orjson" not in sys.modules, reason="requires the orjson library.")
+def test_bytes_are_only_serialized_as_base64_on_request():
+    # pylint: disable=import-outside-toplevel
+    from nicegui.json.builtin_wrapper import dumps as builtin_dumps
+    from nicegui.json.orjson_wrapper import dumps as orjson_dumps
+
+    for dumps in [orjson_dumps, builtin_dumps]:
+        with pytest.raises(TypeError):
+            dumps({"buffer": b"\x00\x01"})
+        assert (
+            dumps({"buffer": b"\x00\x01"}, bytes_as_base64=True) == '{"buffer":"AAE="}'
+        )
+
+
+def test_circular_references_are_reported():
+    # pylint: disable=import-outside-toplevel
+    from nicegui.json.builtin_wrapper import dumps as builtin_dumps
+
+    data: list = [float("nan")]
+    data.append(data)
+    with pytest.raises(ValueError, match="Circular reference detected"):
+        builtin_dumps(data)
@@ -156,3 +156,52 @@ def test_setting_change_handler():
     data.on_change(increment_counter)
     data.append(2)
     assert count == 1
+
+
+def test_change_paths_and_actions():
+    changes = []
+    data = ObservableDict(
+        {"a": {"b": [1, 2, {"c": 3}]}, "s": {1}},
+        on_change=lambda e: changes.append((e.path, e.action)),
+    )
+    data["a"]["b"][2]["c"] = 4
+    data["a"]["b"].append(5)
+    data["a"]["b"].insert(-1, 6)
+    data["a"]["b"].pop(0)
+    del data["a"]["b"][-1]
+    data["a"]["b"].sort(key=str)
+    data["s"].add(2)
+    data["s"].discard(1)
+    del data["a"]
+    assert changes == [
+        (("a", "b", 2, "c"), "set"),
+        (("a", "b", 3), "insert"),
+        (("a", "b", 3), "insert"),
+        (("a", "b", 0), "delete"),
+        (("a", "b", 3), "delete"),
+        (("a", "b"), "replace"),
+        (("s", 2), "insert"),
+        (("s", 1), "delete"),
+        (("a",), "delete"),
+    ]
+
+
+def test_lazy_wrapping():
+    nested = {"x": [1, 2, 3]}
+    data = ObservableDict({"a": nested})
+    assert dict.__getitem__(data, "a") is nested
+    assert isinstance(data["a"], ObservableDict)
+    assert (
+        type(dict.__getitem__(data["a"], "x")) is list
+    )  # pylint: disable=unidiomatic-typecheck
+    assert all(isinstance(value, ObservableList) for value in data["a"].values())
+
+
+def test_detached_collections_do_not_notify():
+    reset_counter()
+    data = ObservableDict({"a": {"b": 1}}, on_change=increment_counter)
+    child = data["a"]
+    data.pop("a")
+    assert count == 1
+    child["b"] = 2
+    assert count == 1
@@ -1,10 +1,10 @@
 import asyncio
 
-from nicegui import ui
+from nicegui import Client, core, outbox, ui
 from nicegui.testing import Screen
 
 
-def test_removing_outbox_loops(screen: Screen):
+def test_single_outbox_loop_for_all_clients(screen: Screen):
     @ui.page("/page", reconnect_timeout=0.1)
     def page():
         ui.button("Click me", on_click=lambda: ui.notify("Hello world!"))
@@ -24,4 +24,68 @@ def test_removing_outbox_loops(screen: Screen):
 
     screen.open("/")
     screen.wait(0.5)
-    assert count.text == "0 tasks"
+    assert count.text == "1 tasks"
+
+
+async def test_idle_outbox_loop_does_not_wake_up(monkeypatch):
+    client = Client.auto_index_client
+    monkeypatch.setattr(client, "environ", {})
+    monkeypatch.setattr(core.app.config, "message_flush_interval", 0.0, raising=False)
+    emitted = []
+
+    async def emit(message_type, data, target_id):
+        emitted.append((message_type, data, target_id))
+
+    monkeypatch.setattr(client.outbox, "_emit", emit)
+    task = asyncio.create_task(outbox.loop())
+    client.outbox.wake_up()  # NOTE: the client is woken up after the handshake
+    await asyncio.sleep(0.05)
+    assert len(emitted) == 1, "the initially enqueued elements should have been sent in a single flush"
+    assert not client.outbox.updates
+    assert outbox.metrics.flush_count == 1
+
+    await asyncio.sleep(0.05)
+    assert len(emitted) == 1, "an idle outbox should not emit anything"
+    assert not outbox.ready_outboxes
+
+    client.outbox.enqueue_message("notify", {"message": "Hi!"}, client.id)
+    assert outbox.metrics.queue_depth == 0
+    assert list(outbox.ready_outboxes) == [client.outbox]
+    await asyncio.sleep(0.05)
+    assert emitted[-1] == ("notify", {"message": "Hi!"}, client.id)
+    assert outbox.metrics.flush_count == 2
+
+    task.cancel()
+
+
+def test_patches_only_contain_changed_fields():
+    label = ui.label("Hello").props("color=red")
+    outbox = label.client.outbox
+    outbox.updates.clear()
+
+    label.props("color=blue dense").props(remove="color").style("color: red")
+    label.classes("text-bold")
+    _, fields = outbox.patches[label.id]
+    assert label._to_patch(fields) == {  # pylint: disable=protected-access
+        "class": ["text-bold"],
+        "props": {"dense": True},
+        "props_removed": ["color"],
+        "style": {"color": "red"},
+    }
+
+    label.update()
+    assert label.id not in outbox.patches, "a full update supersedes pending patches"
+
+    label.props("outline")
+    assert label.id not in outbox.patches, "a pending full update makes patches unnecessary"
+
+
+def test_elements_with_custom_update_are_not_patched():
+    select = ui.select(["A", "B"], value="A")
+    outbox = select.client.outbox
+    outbox.updates.clear()
+
+    select.props("dense")
+    select.value = "B"
+    assert select.id not in outbox.patches
+    assert outbox.updates[select.id] is select, "ui.select relies on its own update() method"
@@ -1,9 +1,16 @@
 import asyncio
+import json
+import threading
+import time
 from pathlib import Path
+from typing import Dict, Optional
 
 import httpx
+import pytest
 
-from nicegui import Client, app, background_tasks, ui
+from nicegui import Client, app, background_tasks, core, storage, ui
+from nicegui.page import page
+from nicegui.storage import FileBackend, PersistentDict, SqliteBackend, StorageBackend
 from nicegui.testing import Screen
 
 
@@ -182,3 +189,238 @@ def test_rapid_storage(screen: Screen):
         Path(".nicegui", "storage-general.json").read_text("utf-8")
         == '{"one":1,"two":2,"three":3}'
     )
+
+
+async def test_persistent_dict_writes_are_debounced(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(core, "loop", asyncio.get_running_loop())
+    filepath = tmp_path / "storage-test.json"
+    data = PersistentDict(
+        filepath, encoding="utf-8", write_delay=0.05, max_write_delay=0.2
+    )
+    for i in range(1000):
+        data[f"key{i}"] = i
+    assert not filepath.exists()
+
+    await asyncio.sleep(0.3)
+    assert PersistentDict(filepath, encoding="utf-8") == {
+        f"key{i}": i for i in range(1000)
+    }
+    assert list(tmp_path.iterdir()) == [filepath]
+
+    data.clear()
+    for _ in range(10):
+        data["count"] = data.get("count", 0) + 1
+        await asyncio.sleep(0.03)
+    assert filepath.read_text("utf-8") != "{}", "the maximum write delay has passed"
+
+    data["count"] = 42
+    data.flush()
+    assert filepath.read_text("utf-8") == '{"count":42}'
+
+
+async def test_flush_takes_over_a_running_write(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(core, "loop", asyncio.get_running_loop())
+    writes = []
+
+    class SlowBackend(FileBackend):
+        def write(self, key: str, text: str) -> None:
+            if threading.current_thread() is not threading.main_thread():
+                time.sleep(0.1)  # NOTE: the background write is slower than the flush
+            writes.append(text)
+            super().write(key, text)
+
+    backend = SlowBackend(tmp_path)
+    data = PersistentDict(backend=backend, key="storage-test", write_delay=0)
+    data["count"] = 1
+    await asyncio.sleep(0.05)
+    data["count"] = 2
+    data.flush()
+    await asyncio.sleep(0.2)
+    assert writes == ['{"count":1}', '{"count":2}'], "no stale data is written"
+    assert backend.read("storage-test") == '{"count":2}'
+
+
+async def test_sqlite_backend(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(core, "loop", asyncio.get_running_loop())
+    backend = SqliteBackend(tmp_path / "storage.db")
+    data = PersistentDict(backend=backend, key="storage-general")
+    data["list"] = [1, 2, 3]
+    data.flush()
+    assert PersistentDict(backend=backend, key="storage-general") == {"list": [1, 2, 3]}
+    assert PersistentDict(backend=backend, key="storage-user-1") == {}
+
+    data.clear()
+    data.flush()
+    assert backend.read("storage-general") is None
+    backend.close()
+    with pytest.raises(RuntimeError):
+        backend.read("storage-general")
+
+
+async def test_least_recently_used_user_storages_are_evicted(
+    tmp_path: Path, monkeypatch
+):
+    monkeypatch.setattr(core, "loop", asyncio.get_running_loop())
+    monkeypatch.setenv("NICEGUI_STORAGE_PATH", str(tmp_path))
+    monkeypatch.setattr(storage, "MAX_CACHED_USER_STORAGES", 2)
+    s = storage.Storage()
+    s.backend = SqliteBackend(tmp_path / "storage.db")
+    user_a = s._get_user_storage("a")  # pylint: disable=protected-access
+    user_a["name"] = "A"
+    s._get_user_storage("b")  # pylint: disable=protected-access
+    s._get_user_storage("c")  # pylint: disable=protected-access
+    assert list(s._users) == ["b", "c"]  # pylint: disable=protected-access
+    assert (
+        s._get_user_storage("a") is user_a
+    ), "referenced storages are reused"  # pylint: disable=protected-access
+
+    s.flush()
+    del user_a
+    s._users.clear()  # pylint: disable=protected-access
+    s._loaded_users.clear()  # pylint: disable=protected-access
+    assert s._get_user_storage("a") == {"name": "A"}  # pylint: disable=protected-access
+    with pytest.raises(RuntimeError):
+        s.backend = SqliteBackend(tmp_path / "other.db")
+    s.backend.close()
+
+
+async def test_idle_user_storages_are_unloaded(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(core, "loop", asyncio.get_running_loop())
+    monkeypatch.setattr(storage, "USER_STORAGE_IDLE_TIMEOUT", 0.0)
+    monkeypatch.setattr(storage, "metrics", storage.StorageMetrics())
+    s = storage.Storage()
+    s.backend = SqliteBackend(tmp_path / "storage.db")
+    s._get_user_storage("idle")["name"] = "Idle"  # pylint: disable=protected-access
+    s._get_user_storage("connected")  # pylint: disable=protected-access
+    s._get_user_storage("connected")  # pylint: disable=protected-access
+    client = Client(page("/"))
+    client.session_id = "connected"
+    client.environ = {}
+    try:
+        s.prune_user_storages()
+    finally:
+        client.delete()
+    assert list(s._users) == ["connected"]  # pylint: disable=protected-access
+    assert storage.metrics == storage.StorageMetrics(
+        hits=1, misses=2, evictions=1, cached=1
+    )
+
+    await asyncio.sleep(0.1)  # NOTE: pending changes are written when unloading
+    assert s.backend.read("storage-user-idle") == '{"name":"Idle"}'
+    s.backend.close()
+
+
+async def test_journal(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(core, "loop", asyncio.get_running_loop())
+    filepath = tmp_path / "storage-test.json"
+    journal_path = tmp_path / "storage-test.journal"
+    data = PersistentDict(filepath, encoding="utf-8", journal=True)
+    data["a"] = {"list": [1, 2]}
+    data.flush()
+    assert not filepath.exists()
+    data["a"]["list"].insert(0, 0)
+    data["a"]["list"].append({"x": 1})
+    data["a"]["list"][-1]["x"] = 2
+    data["b"] = 1
+    del data["b"]
+    data.flush()
+    assert len(journal_path.read_text("utf-8").splitlines()) == 6
+    assert PersistentDict(filepath, encoding="utf-8") == {
+        "a": {"list": [0, 1, 2, {"x": 2}]}
+    }
+
+    journal_path.write_text(journal_path.read_text("utf-8") + '["set",["c"', "utf-8")
+    assert PersistentDict(filepath, encoding="utf-8") == {
+        "a": {"list": [0, 1, 2, {"x": 2}]}
+    }
+
+    monkeypatch.setattr(storage, "JOURNAL_COMPACTION_SIZE", 0)
+    data["c"] = 3
+    data.flush()
+    assert not journal_path.exists()
+    assert json.loads(filepath.read_text("utf-8")) == {
+        "a": {"list": [0, 1, 2, {"x": 2}]},
+        "c": 3,
+    }
+
+
+async def test_torn_journal_is_replaced_on_next_write(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(core, "loop", asyncio.get_running_loop())
+    filepath = tmp_path / "storage-test.json"
+    journal_path = tmp_path / "storage-test.journal"
+    data = PersistentDict(filepath, encoding="utf-8", journal=True)
+    data["a"] = 1
+    data["b"] = 2
+    data.flush()
+    journal_path.write_text(journal_path.read_text("utf-8") + '["set",["c"', "utf-8")
+
+    data = PersistentDict(filepath, encoding="utf-8", journal=True)
+    assert data == {"a": 1, "b": 2}
+    data["d"] = 4
+    data.flush()
+    data["e"] = 5
+    data.flush()
+    assert PersistentDict(filepath, encoding="utf-8") == {
+        "a": 1,
+        "b": 2,
+        "d": 4,
+        "e": 5,
+    }
+
+
+async def test_unserializable_changes_are_written_as_snapshot(
+    tmp_path: Path, monkeypatch
+):
+    monkeypatch.setattr(core, "loop", asyncio.get_running_loop())
+    filepath = tmp_path / "storage-test.json"
+    data = PersistentDict(filepath, encoding="utf-8", journal=True)
+    data["a"] = 1
+    data.flush()
+    data["b"] = object()
+    data["b"] = 2
+    data.flush()
+    assert json.loads(filepath.read_text("utf-8")) == {"a": 1, "b": 2}
+
+
+async def test_journal_with_sqlite_backend(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(core, "loop", asyncio.get_running_loop())
+    backend = SqliteBackend(tmp_path / "storage.db")
+    data = PersistentDict(backend=backend, key="storage-general", journal=True)
+    data.update({"count": 0})
+    data.flush()
+    for _ in range(3):
+        data["count"] += 1
+        data.flush()
+    assert len(backend.read_journal("storage-general")) == 3
+    assert PersistentDict(backend=backend, key="storage-general") == {"count": 3}
+    backend.close()
+
+
+async def test_journal_falls_back_to_snapshots(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(core, "loop", asyncio.get_running_loop())
+
+    class DictBackend(StorageBackend):
+        def __init__(self) -> None:
+            self.documents: Dict[str, str] = {}
+
+        def read(self, key: str) -> Optional[str]:
+            return self.documents.get(key)
+
+        def write(self, key: str, text: str) -> None:
+            self.documents[key] = text
+
+        def delete(self, key: str) -> None:
+            self.documents.pop(key, None)
+
+        def clear(self) -> None:
+            self.documents.clear()
+
+    backend = DictBackend()
+    assert not backend.supports_journal
+    assert FileBackend(tmp_path).supports_journal
+
+    data = PersistentDict(backend=backend, key="storage-general", journal=True)
+    assert not data.journal
+    data["count"] = 1
+    data.flush()
+    assert backend.documents == {"storage-general": '{"count":1}'}
@@ -5,6 +5,7 @@ import pandas as pd
 from selenium.webdriver.common.by import By
 
 from nicegui import ui
+from nicegui.elements.table import TableRequest
 from nicegui.testing import Screen
 
 
@@ -187,6 +188,79 @@ def test_replace_rows(screen: Screen):
     screen.should_contain("Daniel")
 
 
+def test_row_operations_do_not_resend_all_rows():
+    table = ui.table(columns=columns(), rows=rows(), selection="multiple")
+    table.selected.append(table.rows[0])
+    outbox = table.client.outbox
+    outbox.updates.clear()
+
+    table.add_rows({"id": 3, "name": "Carol", "age": 32})
+    table.remove_rows(table.rows[0])
+    table.update_rows(
+        [
+            {"id": 1, "name": "Bob", "age": 22},
+            {"id": 2, "name": "Lionel", "age": 19},
+            {"id": 3, "name": "Carol", "age": 32},
+            {"id": 4, "name": "Daniel", "age": 33},
+        ]
+    )
+    assert table.id not in outbox.updates
+    assert outbox.patches[table.id][1] == {"props": {"selected"}}
+    assert table._props["revision"] == 3  # pylint: disable=protected-access
+    deltas = [
+        data for _, message_type, data in outbox.messages if message_type == "row_delta"
+    ]
+    assert [delta["revision"] for delta in deltas] == [1, 2, 3]
+    assert deltas[1]["removed_keys"] == [0]
+    assert [row["name"] for row in table.rows] == ["Bob", "Lionel", "Carol", "Daniel"]
+
+    table.update_rows(list(reversed(table.rows)))
+    assert table.id in outbox.updates, "reordering rows requires a full update"
+
+
+def test_change_rows_in_closed_dialog(screen: Screen):
+    with ui.dialog() as dialog, ui.card():
+        table = ui.table(columns=columns(), rows=rows())
+    ui.button(
+        "Add", on_click=lambda: table.add_rows({"id": 3, "name": "Carol", "age": 32})
+    )
+    ui.button("Remove", on_click=lambda: table.remove_rows(table.rows[0]))
+    ui.button("Open", on_click=dialog.open)
+
+    screen.open("/")
+    screen.click("Add")
+    screen.click("Remove")
+    screen.click("Open")
+    screen.should_contain("Carol")
+    screen.should_not_contain("Alice")
+
+
+def test_update_rows_by_key(screen: Screen):
+    table = ui.table(columns=columns(), rows=rows())
+    ui.button(
+        "Update",
+        on_click=lambda: table.update_rows(
+            [
+                {"id": 1, "name": "Bob", "age": 42},
+                {"id": 2, "name": "Lionel", "age": 19},
+                {"id": 3, "name": "Carol", "age": 32},
+            ]
+        ),
+    )
+    ui.button("Reverse", on_click=lambda: table.update_rows(table.rows[::-1]))
+
+    screen.open("/")
+    screen.click("Update")
+    screen.should_contain("Carol")
+    screen.should_contain("42")
+    screen.should_not_contain("Alice")
+
+    screen.click("Reverse")
+    screen.wait(0.5)
+    rows = screen.find_all_by_tag("tbody")[0].find_elements(By.TAG_NAME, "tr")
+    assert [row.text.split()[0] for row in rows] == ["Carol", "Lionel", "Bob"]
+
+
 def test_create_from_pandas(screen: Screen):
     df = pd.DataFrame({"name": ["Alice", "Bob"], "age": [18, 21], 42: "answer"})
     ui.table.from_pandas(df)
@@ -220,3 +294,52 @@ def test_problematic_datatypes(screen: Screen):
     screen.should_contain("5 days")
     screen.should_contain("(1+2j)")
     screen.should_contain("2021-01")
+
+
+def test_server_side_data_source():
+    requests: List[TableRequest] = []
+
+    def data_source(request: TableRequest):
+        requests.append(request)
+        stop = request.stop or 10_000_000
+        return [
+            {"id": i, "name": f"Person {i}"} for i in range(request.start, stop)
+        ], 10_000_000
+
+    table = ui.table(columns=columns(), rows=[], pagination=10, data_source=data_source)
+    assert [row["id"] for row in table.rows] == list(range(10))
+    assert table.pagination["rowsNumber"] == 10_000_000
+
+    table._request(  # pylint: disable=protected-access
+        {"page": 3, "rowsPerPage": 10, "sortBy": "age", "descending": True}
+    )
+    assert [row["id"] for row in table.rows] == list(range(20, 30))
+    assert requests[-1] == TableRequest(
+        start=20, stop=30, sort_by="age", descending=True, filter=None
+    )
+
+    table.filter = "Person 1"
+    assert requests[-1].filter == "Person 1"
+    assert requests[-1].start == 0
+    assert table._props["filter"] is None  # pylint: disable=protected-access
+
+
+def test_server_side_pandas(screen: Screen):
+    df = pd.DataFrame({"id": range(1000), "name": [f"Person {i}" for i in range(1000)]})
+    table = ui.table.from_pandas(df, pagination=5, server_side=True)
+    assert len(table.rows) == 5
+    ui.input("Search").bind_value(table, "filter")
+
+    screen.open("/")
+    screen.should_contain("Person 4")
+    screen.should_not_contain("Person 5")
+    screen.should_contain("1-5 of 1000")
+    screen.click("chevron_right")
+    screen.should_contain("Person 5")
+    screen.should_contain("6-10 of 1000")
+
+    screen.selenium.find_element(By.XPATH, '//*[@aria-label="Search"]').send_keys(
+        "Person 99"
+    )
+    screen.should_contain("Person 993")
+    screen.should_contain("1-5 of 11")
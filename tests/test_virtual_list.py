@@ -0,0 +1,44 @@
+from nicegui import ui
+from nicegui.testing import Screen
+
+
+def test_virtual_list_keeps_a_window_of_rows():
+    virtual_list = ui.virtual_list(
+        1_000_000, lambda i: ui.label(f"Row {i}"), window_size=50
+    )
+    client = virtual_list.client
+    element_count = len(client.elements)
+    assert list(virtual_list.rows) == list(range(50))
+    row_ids = {row.id for row in virtual_list.rows.values()}
+
+    virtual_list._show(1000)  # pylint: disable=protected-access
+    assert list(virtual_list.rows) == list(range(1000, 1050))
+    assert {row.id for row in virtual_list.rows.values()} == row_ids
+    assert [next(iter(row)).text for row in virtual_list] == [
+        f"Row {i}" for i in range(1000, 1050)
+    ]
+    assert len(client.elements) == element_count
+
+    virtual_list._show(1020)  # pylint: disable=protected-access
+    assert list(virtual_list.rows) == list(range(1020, 1070))
+    assert len(client.elements) == element_count
+
+    virtual_list._show(2_000_000)  # pylint: disable=protected-access
+    assert list(virtual_list.rows) == list(range(999_950, 1_000_000))
+
+    virtual_list.row_count = 10
+    assert list(virtual_list.rows) == list(range(10))
+    assert len(list(virtual_list)) == 10
+
+
+def test_scrolling(screen: Screen):
+    ui.virtual_list(1000, lambda i: ui.label(f"Row {i}"), row_height=20)
+
+    screen.open("/")
+    screen.should_contain("Row 0")
+    screen.should_not_contain("Row 500")
+    screen.selenium.execute_script(
+        'document.querySelector(".nicegui-virtual-list").scrollTop = 10000'
+    )
+    screen.should_contain("Row 500")
+    screen.should_not_contain("Row 0")
@@ -259,6 +259,54 @@ def aggrid_with_dynamic_row_height():
     ).classes("max-h-40")
 
 
+@doc.demo(
+    "Transactions",
+    """
+    With a `row_id_field` you can add, update and remove individual rows using `apply_transaction`.
+    In contrast to the `update` method only the changed rows are sent to the browser.
+""",
+)
+def aggrid_transactions():
+    import random
+
+    grid = ui.aggrid(
+        {
+            "columnDefs": [{"field": "name"}, {"field": "price"}],
+            "rowData": [{"name": name, "price": 100} for name in "ABC"],
+        },
+        row_id_field="name",
+    ).classes("max-h-40")
+
+    def tick() -> None:
+        name = random.choice("ABC")
+        grid.apply_transaction(
+            update=[{"name": name, "price": random.randint(90, 110)}]
+        )
+
+    ui.button("Tick", on_click=tick)
+
+
+@doc.demo(
+    "Infinite row model",
+    """
+    Instead of `rowData` you can pass a `datasource` function which is called with an `AgGridRequest`
+    whenever the grid needs a block of rows.
+    It returns the rows of the block and the total number of rows.
+    `from_pandas` does this automatically when `server_side=True` is passed.
+""",
+)
+def aggrid_infinite_row_model():
+    def datasource(request):
+        rows = [
+            {"number": i} for i in range(request.start, min(request.stop, 1_000_000))
+        ]
+        return rows, 1_000_000
+
+    ui.aggrid({"columnDefs": [{"field": "number"}]}, datasource=datasource).classes(
+        "max-h-40"
+    )
+
+
 @doc.demo(
     "Run row methods",
     """
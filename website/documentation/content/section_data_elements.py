@@ -19,6 +19,7 @@ from . import (
     spinner_documentation,
     table_documentation,
     tree_documentation,
+    virtual_list_documentation,
 )
 
 doc.title("*Data* Elements")
@@ -40,6 +41,7 @@ doc.intro(scene_documentation)
 doc.intro(leaflet_documentation)
 doc.intro(tree_documentation)
 doc.intro(log_documentation)
+doc.intro(virtual_list_documentation)
 doc.intro(editor_documentation)
 doc.intro(code_documentation)
 doc.intro(json_editor_documentation)
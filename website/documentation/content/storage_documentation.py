@@ -32,6 +32,12 @@ doc.title("Storage")
     The user storage and browser storage are only available within [page builder functions ](/documentation/page)
     because they are accessing the underlying `Request` object from FastAPI.
     Additionally these two types require the `storage_secret` parameter in`ui.run()` to encrypt the browser session cookie.
+
+    By default, the server-side storages are written to one JSON file each in the `.nicegui` directory.
+    For many users, set the environment variable `NICEGUI_STORAGE_BACKEND=sqlite` to keep them in a single SQLite database instead
+    or assign a custom `StorageBackend` to `app.storage.backend`.
+    With `NICEGUI_STORAGE_JOURNAL=true` only the changed values are appended to a journal,
+    which is compacted into a new snapshot from time to time.
 """,
 )
 def storage_demo():
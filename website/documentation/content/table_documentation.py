@@ -180,6 +180,39 @@ def table_from_pandas_demo():
     ui.table.from_pandas(df).classes("max-h-40")
 
 
+@doc.demo(
+    "Server-side data source",
+    """
+    For large datasets you can pass a `data_source` function instead of rows.
+    It is called with a `TableRequest` containing the requested range, sorting and filter
+    and returns the rows of the current page together with the total number of rows.
+    Only the visible rows are sent to the browser.
+    Use `from_pandas(df, server_side=True)` to page through a DataFrame this way.
+""",
+)
+def server_side_data_source_demo():
+    def data_source(request):
+        numbers = range(1_000_000)
+        if request.filter:
+            numbers = [n for n in numbers if request.filter in str(n)]
+        if request.sort_by == "number" and request.descending:
+            numbers = numbers[::-1]
+        rows = [{"number": n} for n in numbers[request.start : request.stop]]
+        return rows, len(numbers)
+
+    columns = [
+        {"name": "number", "label": "Number", "field": "number", "sortable": True}
+    ]
+    table = ui.table(
+        columns=columns,
+        rows=[],
+        row_key="number",
+        pagination=5,
+        data_source=data_source,
+    )
+    ui.input("Filter").bind_value(table, "filter")
+
+
 @doc.demo(
     "Adding rows",
     """
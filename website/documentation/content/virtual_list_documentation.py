@@ -0,0 +1,30 @@
+from nicegui import ui
+
+from . import doc
+
+
+@doc.demo(ui.virtual_list)
+def main_demo() -> None:
+    ui.virtual_list(1_000_000, lambda i: ui.label(f"Row {i}"), row_height=24)
+
+
+@doc.demo(
+    "Refresh rows",
+    """
+    Call `refresh` to rebuild the rendered rows after the underlying data has changed.
+    Changing the `row_count` property updates the scroll height.
+""",
+)
+def refresh_demo():
+    items = [f"Item {i}" for i in range(100)]
+    virtual_list = ui.virtual_list(len(items), lambda i: ui.label(items[i]))
+
+    def add() -> None:
+        items.insert(0, f"New item {len(items)}")
+        virtual_list.row_count = len(items)
+        virtual_list.refresh()
+
+    ui.button("Add", on_click=add)
+
+
+doc.reference(ui.virtual_list)